@@ -15,6 +15,7 @@ Users should only access these methods indirectly through a ``Session`` or
 ``SessionInterface`` instance.
 """
 import json
+import threading
 from typing import Dict
 
 import requests
@@ -25,6 +26,7 @@ from pydent.exceptions import TridentJSONDataIncomplete
 from pydent.exceptions import TridentLoginError
 from pydent.exceptions import TridentRequestError
 from pydent.exceptions import TridentTimeoutError
+from pydent.utils import json_codec
 from pydent.utils import logger
 from pydent.utils import pprint_data
 from pydent.utils import url_build
@@ -64,6 +66,16 @@ class AqHTTP:
         self.log = logger(name="AqHTTP@{}".format(aquarium_url))  #: the logger
         self._using_requests = True  #: if False, any HTTP requests will throw and error
         self.num_requests = 0  #: number of requests counter
+        self._num_requests_lock = threading.Lock()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_num_requests_lock", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._num_requests_lock = threading.Lock()
 
     def on(self):
         """Turn on requests. When requests are off, this causes.
@@ -195,7 +207,9 @@ class AqHTTP:
 
     @staticmethod
     def _serialize_request(url: str, method: str, body: dict) -> str:
-        return json.dumps({"url": url, "method": method, "body": body}, sort_keys=True)
+        return json_codec.dumps(
+            {"url": url, "method": method, "body": body}, sort_keys=True
+        )
 
     @classmethod
     def _dispatch_response(cls, response):
@@ -237,6 +251,10 @@ class AqHTTP:
         :type kwargs: dict
         :return: json
         :rtype: dict
+
+        .. versionchanged:: 1.1.0
+            The 'json' body is encoded using the selected
+            :mod:`JSON codec <pydent.utils.json_codec>`.
         """
 
         url = url_build(self.aquarium_url, path)
@@ -251,7 +269,11 @@ class AqHTTP:
         if not allow_none and "json" in kwargs:
             self._disallow_null_in_json(kwargs["json"])
 
-        self.num_requests += 1
+        if "json" in kwargs:
+            self._encode_json_body(kwargs)
+
+        with self._num_requests_lock:
+            self.num_requests += 1
         response = requests.request(
             method, url, timeout=timeout, cookies=self.cookies, **kwargs
         )
@@ -260,6 +282,17 @@ class AqHTTP:
         self._dispatch_response(response)
         return self._response_to_json(response)
 
+    @staticmethod
+    def _encode_json_body(kwargs: dict):
+        """Replaces the 'json' request argument with encoded data."""
+        body = kwargs.pop("json")
+        if body is None:
+            return
+        headers = dict(kwargs.get("headers", None) or {})
+        headers.setdefault("Content-Type", "application/json")
+        kwargs["headers"] = headers
+        kwargs["data"] = json_codec.dumps_bytes(body)
+
     def _response_to_json(self, response: requests.Response) -> dict:
         """Turns :class:`requests.Request` instance into a json.
 
@@ -274,7 +307,7 @@ class AqHTTP:
             raise TridentRequestError(msg, response)
 
         try:
-            response_json = response.json()
+            response_json = json_codec.loads(response.content)
         except json.JSONDecodeError:
             msg = "Response is not JSON formatted"
             msg += "\nMessage:\n" + response.text
@@ -9,7 +9,6 @@ Validated JSON Schemas (https://json-schema.org/)
 
 Check out the :ref:`JSON Schema page <json_schema>` for more information.
 """
-import json
 from copy import deepcopy
 from datetime import datetime
 from datetime import timedelta
@@ -29,10 +28,11 @@ from pydent.relationships import HasOne
 from pydent.relationships import JSON
 from pydent.relationships import Raw
 from pydent.sessionabc import SessionABC
+from pydent.utils import json_codec
 
 aql_schema_filepath = join(abspath(dirname(__file__)), "aql.schema.json")
 with open(aql_schema_filepath, "r") as f:
-    aql_schema = json.load(f)
+    aql_schema = json_codec.loads(f.read())
 
 
 class QueryBuilder:
@@ -195,7 +195,11 @@ def _aql(session, data, model=None):
         dump_params = dict(include_uri=True, include_model_type=True)
         if isinstance(data["__json__"], dict):
             dump_params.update(data["__json__"])
-        return [m.dump(**dump_params) for m in returned_models]
+        encode = dump_params.pop("encode", False)
+        dumped = [m.dump(**dump_params) for m in returned_models]
+        if encode:
+            return json_codec.dumps(dumped)
+        return dumped
     else:
         return returned_models
 
@@ -208,13 +212,16 @@ def validate_aql(data):
 
 def aql(
     session: SessionABC, data: Dict, use_cache: bool = False
-) -> Union[List[ModelBase], Dict]:
+) -> Union[List[ModelBase], Dict, str]:
     """Perform a complex query a complex JSON query object.
 
     Check out the :ref:`JSON Schema page <json_schema>` for more information.
 
     .. versionadded:: 0.1.5a16
     .. versionchanged:: 0.1.5a23 `query` key now changed to `__query__`
+    .. versionchanged:: 1.1.0 `__json__` accepts `encode` to return the
+        models as a JSON string, encoded with the selected
+        :mod:`JSON codec <pydent.utils.json_codec>`
 
     :param session: Aquarium session instance
     :param data: data query
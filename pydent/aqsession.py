@@ -99,8 +99,10 @@ from requests.exceptions import ReadTimeout
 from pydent.aqhttp import AqHTTP
 from pydent.aql import aql
 from pydent.aql import aql_schema
+from pydent.base import IdentityMap
 from pydent.base import ModelBase
 from pydent.base import ModelRegistry
+from pydent.base import RawPolicy
 from pydent.browser import Browser
 from pydent.interfaces import BrowserInterface
 from pydent.interfaces import QueryInterface
@@ -157,10 +159,14 @@ class AqSession(SessionABC):
         else:
             self._aqhttp = AqHTTP(login, password, aquarium_url)
         self._current_user = None
+        self._identity_map = IdentityMap()
         self._interface_class = QueryInterface
         self._initialize_interfaces()
         self._browser = None  #: the sessions browser
         self._using_cache = False
+        #: if True, nested include data is deserialized on first access
+        self.lazy_nested = False
+        self._raw_policy = RawPolicy.KEEP
         self.init_cache()
         self.parent_session = (
             None  #: the parent session, if derived from another session
@@ -303,6 +309,27 @@ class AqSession(SessionABC):
     def browser(self):
         return self._browser
 
+    @property
+    def identity_map(self) -> IdentityMap:
+        """The models loaded in this session, keyed by model class and id.
+
+        .. versionadded:: 1.1.0
+        """
+        return self._identity_map
+
+    @property
+    def raw_policy(self) -> RawPolicy:
+        """How models loaded in this session retain the raw data they were
+        loaded from. See :class:`RawPolicy <pydent.base.RawPolicy>`.
+
+        .. versionadded:: 1.1.0
+        """
+        return self._raw_policy
+
+    @raw_policy.setter
+    def raw_policy(self, policy: Union[RawPolicy, str]):
+        self._raw_policy = RawPolicy(policy)
+
     def init_cache(self):
         self._browser = Browser(self)
 
@@ -343,6 +370,8 @@ class AqSession(SessionABC):
         )
         instance.using_requests = self.using_requests
         instance.using_cache = self.using_cache
+        instance.lazy_nested = self.lazy_nested
+        instance.raw_policy = self.raw_policy
         return instance
 
     def with_cache(
@@ -393,7 +422,9 @@ class AqSession(SessionABC):
             if to_session.browser:
                 to_session.browser.update_cache(models)
             for m in models:
+                from_session.identity_map.remove(m)
                 m._session = to_session
+                to_session.identity_map.add(m)
 
     @classmethod
     def query_schema(cls) -> Dict:
@@ -476,18 +507,27 @@ class AqSession(SessionABC):
         using_models: bool = None,
         using_verbose: bool = None,
         session_swap: bool = False,
+        lazy_nested: bool = None,
+        raw_policy: Union[RawPolicy, str] = None,
     ) -> "AqSession":
         """Factory call for producing a new Session instance.
 
         .. versionchanges:: 0.1.5a7
             'session_swap` parameter added.
 
+        .. versionchanged:: 1.1.0
+            'lazy_nested' and 'raw_policy' parameters added.
+
         :param using_cache:
         :param using_requests:
         :param timeout:
         :param using_models:
         :param using_verbose:
         :param session_swap:
+        :param lazy_nested: if True, nested data loaded using `include` is
+            only deserialized into models when first accessed
+        :param raw_policy: how loaded models retain the data they were
+            loaded from
         :return:
         """
         new_session = self.copy()
@@ -504,6 +544,10 @@ class AqSession(SessionABC):
             new_session.browser.update_cache(self.browser.models)
         if using_verbose is not None:
             new_session.set_verbose(using_verbose)
+        if lazy_nested is not None:
+            new_session.lazy_nested = lazy_nested
+        if raw_policy is not None:
+            new_session.raw_policy = raw_policy
         return new_session
 
     def __enter__(self) -> "AqSession":
@@ -43,10 +43,15 @@ relationships - models relationships are stored
 
 """
 import itertools
+import threading
+import weakref
 from copy import deepcopy
+from enum import Enum
+from types import MappingProxyType
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Mapping
 from typing import Tuple
 from typing import Union
 
@@ -60,10 +65,131 @@ from pydent.interfaces import QueryInterface
 from pydent.marshaller import fields
 from pydent.marshaller import ModelRegistry
 from pydent.marshaller import SchemaModel
+from pydent.marshaller.descriptors import Placeholders
 from pydent.sessionabc import SessionABC
 from pydent.utils import url_build
 
 
+class IdentityMap:
+    """Weakly references the models loaded in a session by their class and
+    id, so that loading the same server record twice returns the same model
+    instance.
+
+    Models are not kept alive by the map and are removed once they are
+    garbage collected. Models without an id are never added.
+
+    .. versionadded:: 1.1.0
+    """
+
+    def __init__(self):
+        self._models = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._models)
+
+    def __contains__(self, model: "ModelBase"):
+        return self.get(model.__class__, model.id) is model
+
+    def __iter__(self):
+        with self._lock:
+            models = list(self._models.values())
+        return iter(models)
+
+    def __deepcopy__(self, memo):
+        return self.__class__()
+
+    def __reduce__(self):
+        return self.__class__, ()
+
+    def get(self, model_class: type, model_id: int) -> Union["ModelBase", None]:
+        """Returns the loaded model with the class and id, or None."""
+        if model_id is None:
+            return None
+        with self._lock:
+            return self._models.get((model_class, model_id), None)
+
+    def add(self, model: "ModelBase"):
+        """Adds a model to the map, replacing any model with the same class
+        and id."""
+        if model.id is None:
+            return
+        with self._lock:
+            self._models[(model.__class__, model.id)] = model
+
+    def remove(self, model: "ModelBase"):
+        """Removes a model from the map."""
+        with self._lock:
+            key = (model.__class__, model.id)
+            if self._models.get(key, None) is model:
+                del self._models[key]
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+
+class RawPolicy(Enum):
+    """How loaded models retain the raw data (`ModelBase.raw`) they were
+    loaded from. Set using `AqSession.raw_policy`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    KEEP = "keep"  #: keep the loaded data as is
+    DROP = "drop"  #: drop the loaded data, `raw` is None
+    #: keep a compact, read-only :class:`FrozenRaw` copy without relationship data
+    FROZEN = "frozen"
+
+
+class FrozenRaw(Mapping):
+    """A compact, read-only copy of the data a model was loaded from.
+
+    Only the values are stored per instance. Keys and their positions are
+    shared between all copies of data with the same keys. Values of
+    excluded keys (e.g. nested relationship data, which is held by the
+    nested models) are replaced with None.
+
+    .. versionadded:: 1.1.0
+    """
+
+    __slots__ = ["_index", "_values"]
+
+    MAX_SHAPES = 1024  #: maximum number of shared key indices
+    _indices = {}
+
+    def __init__(self, data: dict, exclude: Mapping = None):
+        keys = tuple(data)
+        index = self._indices.get(keys, None)
+        if index is None:
+            index = {k: i for i, k in enumerate(keys)}
+            if len(self._indices) < self.MAX_SHAPES:
+                index = self._indices.setdefault(keys, index)
+        self._index = index
+        if exclude:
+            self._values = tuple(None if k in exclude else v for k, v in data.items())
+        else:
+            self._values = tuple(data.values())
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, dict(self))
+
+
 class ModelBase(SchemaModel):
     """Base class for Aquarium models. Subclass of.
 
@@ -88,6 +214,18 @@ class ModelBase(SchemaModel):
     counter = itertools.count()
     id = None
     rid = None
+    raw = None  #: the data the model was loaded from (see :class:`RawPolicy`)
+    _defaults = {}  #: model class to defaults set by initializing the class
+    _DEFAULT_EXCLUDED_ATTRIBUTES = frozenset(
+        (
+            "_session",
+            "_rid",
+            "raw",
+            ModelRegistry._data_key,
+            ModelRegistry._deserialized_key,
+            ModelRegistry._deferred_key,
+        )
+    )
 
     def __new__(cls, *args, session=None, **kwargs):
         instance = super().__new__(cls)
@@ -102,17 +240,128 @@ class ModelBase(SchemaModel):
 
     @classmethod
     def _set_data(cls, data: dict, owner: "ModelBase") -> "ModelBase":
-        instance = cls.__new__(cls, session=owner.session)
+        """Creates a model instance from data.
+
+        .. versionchanged:: 1.1.0
+            If the owner's session has an :class:`IdentityMap`, a model
+            with the same class and id that is already loaded in the
+            session is updated with the data and returned instead of
+            creating a new instance.
+        """
         if not hasattr(owner, "session"):
             raise NoSessionError(
                 "Cannot instantiate new model because its data parent"
                 " {} has no 'session' attribute".format(owner)
             )
-        instance.raw = data
-        cls.__init__(instance)
-        ModelBase.__init__(instance, **data)
+        session = owner.session
+        identity_map = getattr(session, "identity_map", None)
+        if identity_map is not None and isinstance(data, dict):
+            instance = identity_map.get(cls, data.get(cls.PRIMARY_KEY, None))
+            if instance is not None and instance.session is session:
+                instance._retain_raw(data, session)
+                instance.add_data(data, lazy=getattr(session, "lazy_nested", False))
+                return instance
+        instance = cls._new_from_data(data, session)
+        if identity_map is not None:
+            identity_map.add(instance)
         return instance
 
+    @classmethod
+    def _new_from_data(cls, data: dict, session: "SessionABC") -> "ModelBase":
+        instance = cls.__new__(cls, session=session)
+        instance._retain_raw(data, session)
+        lazy = getattr(session, "lazy_nested", False)
+        defaults = cls._init_defaults()
+        if defaults is None:
+            cls.__init__(instance)
+            ModelBase.__init__(instance, **data)
+            return instance
+        serialized, deserialized, attributes = defaults
+        setattr(instance, cls._data_key, cls._copy_defaults(*serialized))
+        setattr(instance, cls._deserialized_key, cls._copy_defaults(*deserialized))
+        if attributes[0]:
+            vars(instance).update(cls._copy_defaults(*attributes))
+        instance.add_data(data, lazy=lazy)
+        instance.add_data({"rid": instance._rid, "id": data.get("id", None)})
+        return instance
+
+    def _retain_raw(self, data: dict, session: "SessionABC"):
+        """Sets `raw` to the loaded data according to the session's
+        :class:`RawPolicy`.
+
+        .. versionadded:: 1.1.0
+        """
+        policy = getattr(session, "raw_policy", RawPolicy.KEEP)
+        if policy is RawPolicy.DROP:
+            self.__dict__.pop("raw", None)
+        elif policy is RawPolicy.FROZEN and isinstance(data, dict):
+            self.raw = FrozenRaw(data, self.get_relationships())
+        else:
+            self.raw = data
+
+    @classmethod
+    def _init_defaults(cls) -> Union[None, Tuple[Tuple[Dict, Tuple[str, ...]], ...]]:
+        """Returns the serialized data, deserialized data and instance
+        attributes set by initializing the model class without arguments, so
+        loading models does not need to call `__init__` on each instance.
+        Each is returned with the keys of its mutable values, which are
+        copied for each instance.
+
+        Returns None if the defaults cannot be safely copied, in which case
+        `__init__` is called for each loaded model.
+
+        .. versionadded:: 1.1.0
+        """
+        try:
+            return ModelBase._defaults[cls]
+        except KeyError:
+            pass
+        defaults = None
+        try:
+            template = cls.__new__(cls)
+            cls.__init__(template)
+        except Exception:
+            template = None
+        if template is not None:
+            serialized = dict(getattr(template, cls._data_key, {}))
+            serialized.pop("rid", None)
+            deserialized = dict(getattr(template, cls._deserialized_key, {}))
+            attributes = {
+                k: v
+                for k, v in vars(template).items()
+                if k not in cls._DEFAULT_EXCLUDED_ATTRIBUTES
+            }
+            parts = (serialized, deserialized, attributes)
+            if all(cls._is_copyable_default(v) for d in parts for v in d.values()):
+                defaults = tuple(
+                    (
+                        d,
+                        tuple(
+                            k
+                            for k, v in d.items()
+                            if isinstance(v, (dict, list, tuple))
+                        ),
+                    )
+                    for d in parts
+                )
+        ModelBase._defaults[cls] = defaults
+        return defaults
+
+    @staticmethod
+    def _copy_defaults(defaults: Dict[str, Any], mutable: Tuple[str, ...]) -> Dict:
+        copied = dict(defaults)
+        for k in mutable:
+            copied[k] = deepcopy(copied[k])
+        return copied
+
+    @staticmethod
+    def _is_copyable_default(value) -> bool:
+        if isinstance(value, (dict, list, tuple)):
+            if isinstance(value, dict):
+                value = list(value.keys()) + list(value.values())
+            return all(ModelBase._is_copyable_default(v) for v in value)
+        return value is None or isinstance(value, (bool, int, float, str, Enum))
+
     @classmethod
     def get_server_model_name(cls):
         if cls.SERVER_MODEL_NAME is None:
@@ -232,14 +481,26 @@ class ModelBase(SchemaModel):
         return self
 
     @classmethod
-    def get_relationships(cls):
-        grouped = cls._model_schema.grouped_fields
-        relationships = grouped[fields.Relationship.__name__]
-        alias = grouped[fields.Alias.__name__]
-        for aname, alias_field in alias.items():
-            aliased = relationships.get(alias_field.alias, None)
-            if aliased:
-                relationships[aname] = aliased
+    def get_relationships(cls) -> Mapping[str, fields.Relationship]:
+        """Returns the relationships of the model class, including aliases of
+        relationships.
+
+        .. versionchanged:: 1.1.0
+            Relationships are computed once per class and returned as a
+            read-only mapping.
+        """
+        schema = cls._model_schema
+        relationships = schema._relationships
+        if relationships is None:
+            grouped = schema.grouped_fields
+            relationships = dict(grouped[fields.Relationship.__name__])
+            alias = grouped[fields.Alias.__name__]
+            for aname, alias_field in alias.items():
+                aliased = relationships.get(alias_field.alias, None)
+                if aliased:
+                    relationships[aname] = aliased
+            relationships = MappingProxyType(relationships)
+            schema._relationships = relationships
         return relationships
 
     @property
@@ -271,15 +532,117 @@ class ModelBase(SchemaModel):
             )
         self._session = new_session
 
-    def connect_to_session(self, session: "SessionABC"):
+    def connect_to_session(self, session: "SessionABC", recursive: bool = False):
         """Connect model to a session.
 
+        .. versionchanged:: 1.1.0
+            Added `recursive`, e.g. to reattach unpickled models, which are
+            not pickled with their session.
+
         :param session: the :class:`AqSession <pydent.aqsession.AqSession>`
+        :param recursive: if True, also connects the models in the
+            deserialized relationships of this model (and so on) that have no
+            session. Connected models are added to the session's identity map,
+            if it has one and it does not have a model with the same id.
         :return: None
         :raises SessionAlreadySet: if session is already set
         :raises NoSessionError: if session is not a SessionABC type
         """
-        self.session = session
+        if not recursive:
+            self.session = session
+            return
+        identity_map = getattr(session, "identity_map", None)
+        visited = set()
+        stack = [self]
+        while stack:
+            model = stack.pop()
+            if id(model) in visited:
+                continue
+            visited.add(id(model))
+            if model is self or model.session is None:
+                model.session = session
+                if (
+                    identity_map is not None
+                    and identity_map.get(model.__class__, model.id) is None
+                ):
+                    identity_map.add(model)
+            deserialized = getattr(model, ModelRegistry._deserialized_key)
+            for name in model.get_relationships():
+                val = deserialized.get(name, None)
+                if isinstance(val, ModelBase):
+                    stack.append(val)
+                elif isinstance(val, list):
+                    stack.extend(m for m in val if isinstance(m, ModelBase))
+
+    def __getstate__(self) -> Tuple[int, Dict, Dict, Union[Dict, None]]:
+        """Returns the pickled state of the model: its rid, its data, its
+        deserialized data (including related models) and any other instance
+        attributes. The session and `raw` data are not pickled. The data of
+        relationships that are already deserialized is not pickled twice.
+
+        Relationships that are deferred (see
+        :meth:`RelationshipAccessor.set_deferred
+        <pydent.marshaller.descriptors.RelationshipAccessor.set_deferred>`)
+        are resolved first.
+
+        .. versionadded:: 1.1.0
+        """
+        for name in list(vars(self).get(ModelRegistry._deferred_key, ())):
+            getattr(self, name)
+        deserialized = getattr(self, ModelRegistry._deserialized_key)
+        data = getattr(self, ModelRegistry._data_key)
+        if deserialized:
+            relationships = self.get_relationships()
+            lazy = Placeholders.LAZY
+            duplicated = [
+                k
+                for k, v in deserialized.items()
+                if v is not lazy and k in relationships and k in data
+            ]
+            if duplicated:
+                data = dict(data)
+                for k in duplicated:
+                    del data[k]
+        attributes = None
+        instance_dict = vars(self)
+        extra = instance_dict.keys() - self._DEFAULT_EXCLUDED_ATTRIBUTES
+        if extra:
+            attributes = {k: instance_dict[k] for k in extra}
+        return self._rid, data, deserialized, attributes
+
+    def __setstate__(self, state):
+        """Restores the model from its pickled state. Unpickled models have no
+        session; use :meth:`connect_to_session` to reattach them.
+
+        .. versionchanged:: 1.1.0
+            Models are pickled using :meth:`__getstate__`.
+        """
+        if isinstance(state, dict):
+            # pickled with its __dict__
+            super().__setstate__(state)
+            return
+        rid, data, deserialized, attributes = state
+        self._session = None
+        self._rid = rid
+        setattr(self, ModelRegistry._data_key, data)
+        setattr(self, ModelRegistry._deserialized_key, deserialized)
+        if attributes:
+            vars(self).update(attributes)
+        self._add_data_accessors(data)
+
+    def __deepcopy__(self, memo) -> "ModelBase":
+        """Deep copies the model, including its session and `raw` data, which
+        are not part of the pickled state.
+
+        .. versionadded:: 1.1.0
+        """
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        copied.__setstate__(deepcopy(self.__getstate__(), memo))
+        copied._session = deepcopy(self._session, memo)
+        if "raw" in vars(self):
+            copied.raw = deepcopy(self.raw, memo)
+        return copied
 
     def _check_for_session(self):
         """Raises error if model is not connected to a session.
@@ -361,7 +724,7 @@ class ModelBase(SchemaModel):
                 clsname=self.__class__.__name__, rid=self.rid, model=model_name
             )
         )
-        return model.find(self.session, model_id)
+        return self._fulfill(model_name, model.find, self.session, model_id)
 
     def where_callback(
         self, model_name: str, *args, **kwargs
@@ -386,7 +749,29 @@ class ModelBase(SchemaModel):
                 clsname=self.__class__.__name__, rid=self.rid, model=model_name
             )
         )
-        return model.where(self.session, query_arg, *args[1:], **kwargs)
+        return self._fulfill(
+            model_name, model.where, self.session, query_arg, *args[1:], **kwargs
+        )
+
+    def _fulfill(self, model_name: str, fxn, *args, **kwargs):
+        """Calls the query function of a relationship callback and records
+        on the session's browser if the relationship was fulfilled by a
+        server request.
+
+        .. versionadded:: 1.1.0
+        """
+        browser = getattr(self.session, "browser", None)
+        if browser is None:
+            return fxn(*args, **kwargs)
+        stats = browser.cache_stats
+        fallbacks = stats.local_fallbacks
+        result = fxn(*args, **kwargs)
+        if (
+            not getattr(self.session, "using_cache", False)
+            or stats.local_fallbacks > fallbacks
+        ):
+            stats.network_relation(self.__class__.__name__, model_name)
+        return result
 
     def print(self):
         data = self.dump()
@@ -478,24 +863,36 @@ class ModelBase(SchemaModel):
     @classmethod
     def _flatten_deserialized_data(cls, models: List["ModelBase"], memo: dict) -> dict:
         """Flattens all of the relationships found in the models, returning a
-        rid: model dictionary."""
+        rid: model dictionary.
+
+        .. versionchanged:: 1.1.0
+            Relationships are walked using an explicit stack instead of
+            recursion, so deeply nested models do not reach the recursion
+            limit. Models already in the memo are not walked again.
+        """
         if models is None:
             return memo
-        for model in models:
-
+        relationship_keys = {}
+        stack = list(models)
+        stack.reverse()
+        while stack:
+            model = stack.pop()
             if model is None or model.rid in memo:
                 continue
-            else:
-                memo[model.rid] = model
-                data = model._get_deserialized_data()
-                for key in model.get_relationships():
-                    val = data.get(key, None)
-                    if val is None:
-                        continue
-                    elif isinstance(val, list):
-                        cls._flatten_deserialized_data(val, memo)
-                    else:
-                        cls._flatten_deserialized_data([val], memo)
+            memo[model.rid] = model
+            keys = relationship_keys.get(model.__class__, None)
+            if keys is None:
+                keys = tuple(reversed(tuple(model.get_relationships())))
+                relationship_keys[model.__class__] = keys
+            data = model._get_deserialized_data()
+            for key in keys:
+                val = data.get(key, None)
+                if val is None:
+                    continue
+                elif isinstance(val, list):
+                    stack.extend(reversed(val))
+                else:
+                    stack.append(val)
         return memo
 
     @property
@@ -514,29 +911,18 @@ class ModelBase(SchemaModel):
         return url_build(url, self.get_tableized_name(), str(self._primary_key))
 
     @classmethod
-    def _dump(
+    def _dump_extras(
         cls,
         obj: "ModelBase",
-        only: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
-        include: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
-        ignore: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
+        data: dict,
         include_model_type: bool = False,
         include_uri: bool = False,
-    ) -> dict:
-        data = super()._dump(
-            obj,
-            only=only,
-            include=include,
-            ignore=ignore,
-            include_model_type=include_model_type,
-            include_uri=include_uri,
-        )
+    ):
         if issubclass(obj.__class__, ModelBase):
             if include_model_type:
                 data[cls.MODEL_TYPE_DUMP_KEY] = obj.get_server_model_name()
             if include_uri:
                 data[cls.URI_DUMP_KEY] = obj.uri
-        return data
 
     def dump(
         self,
@@ -9,13 +9,25 @@ Browser (:mod:`pydent.browser`)
 
 Browser class for searching and cacheing results.
 """
+
+import mmap
+import pickle
 import re
+import struct
+import sys
+import threading
 from collections import OrderedDict
-from difflib import get_close_matches
+from collections.abc import Mapping
+from collections.abc import MutableMapping
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from pprint import pformat
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Tuple
 from typing import Union
 
 import networkx as nx
@@ -24,14 +36,20 @@ from pydent import models as pydent_models
 from pydent.base import ModelBase
 from pydent.exceptions import ForbiddenRequestError
 from pydent.exceptions import TridentBaseException
+from pydent.exceptions import TridentRequestError
 from pydent.interfaces import QueryInterface
 from pydent.interfaces import QueryInterfaceABC
 from pydent.marshaller import ModelRegistry
 from pydent.models import Sample
 from pydent.relationships import BaseRelationship
+from pydent.relationships import Function
+from pydent.relationships import HasManyGeneric
 from pydent.sessionabc import SessionABC
 from pydent.utils import logger
+from pydent.utils.async_requests import chunkify
 from pydent.utils.logging_helpers import did_you_mean
+from pydent.utils.search_index import NameIndex
+from pydent.utils.search_index import TextIndex
 
 # TODO: browser documentation
 # TODO: examples in sphinx
@@ -43,6 +61,225 @@ class BrowserException(TridentBaseException):
     """Generic browser exception."""
 
 
+class SnapshotBuffer:
+    """A memory-mapped snapshot file shared by the :class:`LazyModelDict` of
+    each model class in the snapshot. The file is closed once every model
+    dictionary has decoded all of its records or was released.
+
+    .. versionadded:: 1.1.0
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.users = 0
+
+    def __getitem__(self, item):
+        return self.data[item]
+
+    @property
+    def closed(self) -> bool:
+        return self.data.closed
+
+    def acquire(self):
+        self.users += 1
+
+    def release(self):
+        self.users -= 1
+        if self.users <= 0:
+            self.close()
+
+    def close(self):
+        self.data.close()
+
+
+class LazyModelDict(MutableMapping):
+    """A model cache dictionary (id to model) for one model class whose models
+    are decoded from a :meth:`Browser.snapshot <pydent.browser.Browser.snapshot>`
+    only when they are first accessed.
+
+    .. versionadded:: 1.1.0
+    """
+
+    def __init__(
+        self,
+        browser: "Browser",
+        model_class: str,
+        records: Dict,
+        data: SnapshotBuffer,
+        start: int = 0,
+    ):
+        self.browser = browser
+        self.model_class = model_class
+        self.records = records  #: key to (offset, length) of pending records
+        self.data = data  #: buffer holding the pending records
+        self.start = start  #: offset of the first record in the buffer
+        self.decoded = {}
+        if self.records:
+            self.data.acquire()
+
+    def __getitem__(self, key):
+        try:
+            return self.decoded[key]
+        except KeyError:
+            pass
+        offset, length = self.records[key]
+        offset += self.start
+        return self.browser._decode_snapshot_record(
+            self, key, self.data[offset : offset + length]
+        )
+
+    def _pop_record(self, key):
+        if key in self.records:
+            del self.records[key]
+            if not self.records:
+                self.data.release()
+
+    def release(self):
+        """Drops the pending records, releasing the snapshot buffer."""
+        if self.records:
+            self.records = {}
+            self.data.release()
+
+    def __setitem__(self, key, model):
+        self._pop_record(key)
+        self.decoded[key] = model
+
+    def __delitem__(self, key):
+        if key in self.decoded:
+            del self.decoded[key]
+            self._pop_record(key)
+        elif key in self.records:
+            self._pop_record(key)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.decoded or key in self.records
+
+    def __iter__(self):
+        yield from list(self.decoded)
+        yield from [k for k in list(self.records) if k not in self.decoded]
+
+    def __len__(self):
+        return len(self.decoded) + len(
+            [k for k in self.records if k not in self.decoded]
+        )
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+
+class CacheStats:
+    """Counts cache hits, cache misses and server fallbacks of a
+    :class:`Browser` per model class, and relationship fulfillments that
+    required server requests.
+
+    .. versionadded:: 1.1.0
+    """
+
+    COUNTERS = ("hits", "misses", "fallbacks")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_lock", None)
+        state.pop("_local", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def reset(self):
+        """Resets all counts."""
+        with self._lock:
+            self.models = {}  #: model class to counts
+            self.relations = {}  #: (model class, relationship name) to counts
+            self.network_relations = {}  #: (model class, nested class) to counts
+
+    @staticmethod
+    def _increment(counts: Dict, key, counter: str, num: int):
+        counts.setdefault(key, dict.fromkeys(CacheStats.COUNTERS, 0))[counter] += num
+
+    def hit(self, model_class: str, num: int = 1):
+        with self._lock:
+            self._increment(self.models, model_class, "hits", num)
+
+    def miss(self, model_class: str, num: int = 1):
+        with self._lock:
+            self._increment(self.models, model_class, "misses", num)
+
+    def fallback(self, model_class: str):
+        """Records a request made to the server."""
+        with self._lock:
+            self._increment(self.models, model_class, "fallbacks", 1)
+        self._local.fallbacks = self.local_fallbacks + 1
+
+    def relation(self, model_class: str, name: str, hits: int, misses: int):
+        """Records the models whose relationship was already deserialized
+        (hits) or needed to be retrieved (misses)."""
+        with self._lock:
+            self._increment(self.relations, (model_class, name), "hits", hits)
+            self._increment(self.relations, (model_class, name), "misses", misses)
+
+    def network_relation(self, model_class: str, nested_class: str):
+        """Records a relationship fulfillment that made a server request."""
+        with self._lock:
+            key = (model_class, nested_class)
+            self.network_relations[key] = self.network_relations.get(key, 0) + 1
+
+    @property
+    def local_fallbacks(self) -> int:
+        """The number of server fallbacks made by the current thread."""
+        return getattr(self._local, "fallbacks", 0)
+
+
+def _payload_size(data) -> int:
+    """Estimates the memory (in bytes) held by JSON-like data."""
+    size = sys.getsizeof(data)
+    if isinstance(data, Mapping):
+        for k, v in data.items():
+            size += _payload_size(k) + _payload_size(v)
+    elif isinstance(data, list):
+        for v in data:
+            size += _payload_size(v)
+    return size
+
+
+def _was_included(model: ModelBase, include: Union[List[str], Dict]) -> bool:
+    """Whether the data a model was loaded from contained the relations.
+
+    .. versionchanged:: 1.1.0
+        `include` may be an include tree (as returned by
+        :meth:`Browser.plan_include <pydent.browser.Browser.plan_include>`),
+        in which case the nested relations are checked as well.
+    """
+    if not isinstance(include, Mapping):
+        include = {n: {} for n in include}
+    for name, sub_include in include.items():
+        if model.raw is not None:
+            if name not in model.raw:
+                return False
+        # the raw data was dropped; relations that were not loaded are still holders
+        elif not model.is_deserialized(name):
+            return False
+        if not sub_include:
+            continue
+        val = model._get_deserialized_data().get(name, None)
+        if isinstance(val, ModelBase):
+            val = [val]
+        for nested in val or []:
+            if not _was_included(nested, sub_include):
+                return False
+    return True
+
+
 class Browser(QueryInterfaceABC):
     """A class for browsing models and Aquarium inventory."""
 
@@ -54,7 +291,16 @@ class Browser(QueryInterfaceABC):
         "HasMany",
         "HasManyThrough",
         "HasManyGeneric",
+        "HasOneFromMany",
     ]
+    INCLUDE_RELATION_TYPES = ["HasOne", "HasMany", "HasManyThrough"]
+    INCLUDE_BATCH_SIZE = 100  #: number of root models per 'include' query
+    RELATION_SPEC_TYPES = (str, list, set, tuple, dict)
+    SNAPSHOT_MAGIC = b"PYDENT-BROWSER-SNAPSHOT-1\n"
+    #: pickle protocol of snapshot records
+    SNAPSHOT_PROTOCOL = min(pickle.HIGHEST_PROTOCOL, 5)
+    RETRIEVE_MAX_WORKERS = 4  #: default worker pool size for recursive_retrieve
+    PREFETCH_MAX_WORKERS = 2  #: worker pool size for prefetch
 
     def __init__(self, session: SessionABC, inherit_models: bool = False):
         """Instantiates a new browser from a AqSession instance.
@@ -74,14 +320,195 @@ class Browser(QueryInterfaceABC):
         self.model = Sample
         self.model_list_cache = {}
         self.model_cache = {}
+        self.name_indices = {}
+        self.text_index = TextIndex()
+        self._cache_lock = threading.RLock()
+        self._model_locks = {}
+        self._prefetch_executor = None
+        self._prefetches = {}  #: model class to futures of in flight prefetches
+        self._prefetch_local = threading.local()
+        self.cache_stats = CacheStats()
         self.log = logger(name="Browser@{}".format(session.url))
         if session.browser and inherit_models:
             self.update_cache(session.browser.models)
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_cache_lock", None)
+        state.pop("_model_locks", None)
+        state.pop("_prefetch_executor", None)
+        state.pop("_prefetches", None)
+        state.pop("_prefetch_local", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache_lock = threading.RLock()
+        self._model_locks = {}
+        self._prefetch_executor = None
+        self._prefetches = {}
+        self._prefetch_local = threading.local()
+
+    def _model_lock(self, model_class: str) -> threading.RLock:
+        """Returns the lock guarding the cache of a single model class, so
+        workers caching different model classes do not block each other.
+
+        The browser-wide lock may be acquired while holding a model lock, but
+        not the other way around.
+        """
+        lock = self._model_locks.get(model_class, None)
+        if lock is None:
+            with self._cache_lock:
+                lock = self._model_locks.setdefault(model_class, threading.RLock())
+        return lock
+
     @property
     def model_name(self):
         return self.model.__name__
 
+    @staticmethod
+    def _snapshot_ref(model: ModelBase) -> Tuple[str, Union[int, str]]:
+        return model.__class__.__name__, model._primary_key
+
+    def _snapshot_record(self, model: ModelBase) -> Dict:
+        """Returns the model's own data and references to its deserialized
+        relationships."""
+        relationships = model.get_relationships()
+        data = {
+            k: v
+            for k, v in model._get_data().items()
+            if k not in relationships and k != ModelBase.GLOBAL_KEY
+        }
+        relations = {}
+        for name, val in model._get_deserialized_data().items():
+            if name not in relationships or val is None:
+                continue
+            if isinstance(val, list):
+                relations[name] = [
+                    self._snapshot_ref(m) for m in val if isinstance(m, ModelBase)
+                ]
+            elif isinstance(val, ModelBase):
+                relations[name] = self._snapshot_ref(val)
+        return {"data": data, "relations": relations}
+
+    def snapshot(self, path: str) -> int:
+        """Writes all cached models to a binary snapshot file, which can be
+        loaded into another browser using :meth:`restore`.
+
+        Each model is stored as a separate record (using the highest pickle
+        protocol available, up to 5) holding its data and references to its
+        deserialized relationships, so models can be rebuilt without callbacks.
+        An index of record offsets is written at the start of the file.
+
+        .. versionadded:: 1.1.0
+
+        :param path: the file path
+        :return: number of models written
+        """
+        index = {}
+        records = []
+        offset = 0
+        with self._cache_lock:
+            model_classes = list(self.model_cache)
+        cache = {}
+        for model_class in model_classes:
+            with self._model_lock(model_class):
+                cache[model_class] = dict(self.model_cache.get(model_class, {}))
+        for model_class, models in cache.items():
+            class_index = index.setdefault(model_class, {})
+            for key, model in models.items():
+                if model.id is None:
+                    continue
+                record = pickle.dumps(
+                    self._snapshot_record(model), protocol=self.SNAPSHOT_PROTOCOL
+                )
+                class_index[key] = (offset, len(record))
+                records.append(record)
+                offset += len(record)
+        header = pickle.dumps(index, protocol=self.SNAPSHOT_PROTOCOL)
+        with open(path, "wb") as f:
+            f.write(self.SNAPSHOT_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for record in records:
+                f.write(record)
+        self.log.info("CACHE wrote {} models to {}".format(len(records), path))
+        return len(records)
+
+    def restore(self, path: str) -> int:
+        """Restores models from a snapshot file written by :meth:`snapshot`
+        into the cache. The file is memory-mapped and models are only decoded
+        when they are first accessed. The relationships of a decoded model are
+        only resolved when they are accessed. Models already in the cache are
+        kept. The file is closed once all of its models are decoded or the
+        cache is cleared.
+
+        .. versionadded:: 1.1.0
+
+        :param path: the file path
+        :return: number of models in the snapshot
+        """
+        data = SnapshotBuffer(path)
+        start = len(self.SNAPSHOT_MAGIC)
+        if data[:start] != self.SNAPSHOT_MAGIC:
+            data.close()
+            raise BrowserException("'{}' is not a browser snapshot".format(path))
+        (header_length,) = struct.unpack("<Q", data[start : start + 8])
+        start += 8
+        index = pickle.loads(data[start : start + header_length])
+        start += header_length
+
+        num_models = 0
+        for model_class, class_index in index.items():
+            num_models += len(class_index)
+            with self._model_lock(model_class):
+                with self._cache_lock:
+                    lazy = LazyModelDict(self, model_class, class_index, data, start)
+                    for key, model in self.model_cache.get(model_class, {}).items():
+                        lazy[key] = model
+                    self.model_cache[model_class] = lazy
+        if not data.users:
+            data.close()
+        self.log.info("CACHE restored {} models from {}".format(num_models, path))
+        return num_models
+
+    def _decode_snapshot_record(
+        self, models: LazyModelDict, key: Union[int, str], record
+    ) -> ModelBase:
+        """Rebuilds a model from a snapshot record. Its relationships are
+        deferred until they are accessed, so only the record is decoded."""
+        with self._cache_lock:
+            if key in models.decoded:
+                return models.decoded[key]
+            record = pickle.loads(record)
+            model_class = ModelRegistry.get_model(models.model_class)
+            model = model_class.load_from(record["data"], self.session)
+            for name, ref in record["relations"].items():
+                model_class.__dict__[name].set_deferred(
+                    model, self._snapshot_resolver(ref)
+                )
+            models[key] = model
+            if models.model_class == Sample.__name__:
+                self.text_index.add(model._primary_key, model.name, model.description)
+            return model
+
+    def _snapshot_resolver(self, ref) -> Callable:
+        """Returns a function that resolves a relationship reference (or list
+        of references) of a snapshot record to cached models."""
+
+        def resolve():
+            if isinstance(ref, list):
+                val = [self._resolve_snapshot_ref(r) for r in ref]
+                return [m for m in val if m is not None]
+            return self._resolve_snapshot_ref(ref)
+
+        return resolve
+
+    def _resolve_snapshot_ref(self, ref):
+        model_class, key = ref
+        with self._cache_lock:
+            return self.model_cache.get(model_class, {}).get(key, None)
+
     # TODO: change session interface (find, where, etc.) to use cache IF use_
     #       cache = True
     # TODO: where and find queries can sort through models much more quickly than
@@ -90,8 +517,9 @@ class Browser(QueryInterfaceABC):
     @property
     def models(self):
         models = []
-        for v in self.model_cache.values():
-            models += list(v.values())
+        with self._cache_lock:
+            for v in self.model_cache.values():
+                models += list(v.values())
         return models
 
     def set_model(self, model_name):
@@ -129,8 +557,87 @@ class Browser(QueryInterfaceABC):
 
     def clear(self):
         """Clears the model cache."""
-        self.model_list_cache = {}
-        self.model_cache = {}
+        with self._cache_lock:
+            model_classes = set(self.model_cache)
+        model_classes.add(Sample.__name__)
+        for model_class in model_classes:
+            with self._model_lock(model_class):
+                with self._cache_lock:
+                    cache = self.model_cache.pop(model_class, None)
+                    if isinstance(cache, LazyModelDict):
+                        cache.release()
+                    if model_class == Sample.__name__:
+                        self.text_index = TextIndex()
+        with self._cache_lock:
+            self.model_list_cache = {}
+            self.name_indices = {}
+
+    def _cached_bytes(self, model_class: str) -> int:
+        """Estimates the bytes held by the raw payloads of cached models."""
+        with self._model_lock(model_class):
+            cache = self.model_cache.get(model_class, {})
+            if isinstance(cache, LazyModelDict):
+                models = list(cache.decoded.values())
+                size = sum(
+                    length
+                    for key, (_, length) in cache.records.items()
+                    if key not in cache.decoded
+                )
+            else:
+                models = list(cache.values())
+                size = 0
+        for model in models:
+            raw = getattr(model, "raw", None)
+            if raw is None:
+                raw = model._get_data()
+            size += _payload_size(raw)
+        return size
+
+    def stats(self) -> Dict:
+        """Returns the cache statistics collected since the browser was
+        created or :meth:`reset_stats` was last called.
+
+        .. code-block:: python
+
+            browser.recursive_retrieve(samples, {"items": "object_type"})
+            browser.stats()["models"]["ObjectType"]
+            # {'hits': 12, 'misses': 3, 'fallbacks': 1, 'cached': 3, 'bytes': 2480}
+
+        .. versionadded:: 1.1.0
+
+        :return: a dictionary with keys 'models' (per model class counts of
+            cache 'hits', 'misses' and server 'fallbacks', the number of
+            'cached' models and the estimated 'bytes' held by their raw
+            payloads), 'relations' (per (model class, relationship name)
+            counts of already deserialized 'hits' and retrieved 'misses') and
+            'network_relations' (per (model class, nested model class)
+            counts of relationship fulfillments that made server requests)
+        """
+        stats = self.cache_stats
+        with stats._lock:
+            models = {k: dict(v) for k, v in stats.models.items()}
+            relations = {k: dict(v) for k, v in stats.relations.items()}
+            network_relations = dict(stats.network_relations)
+        with self._cache_lock:
+            model_classes = list(self.model_cache)
+        for model_class in set(model_classes).union(models):
+            counts = models.setdefault(
+                model_class, dict.fromkeys(CacheStats.COUNTERS, 0)
+            )
+            counts["cached"] = len(self.model_cache.get(model_class, {}))
+            counts["bytes"] = self._cached_bytes(model_class)
+        return {
+            "models": models,
+            "relations": relations,
+            "network_relations": network_relations,
+        }
+
+    def reset_stats(self):
+        """Resets the cache statistics.
+
+        .. versionadded:: 1.1.0
+        """
+        self.cache_stats.reset()
 
     def list_models(self, *args, **kwargs):
         def get_models():
@@ -235,6 +742,7 @@ class Browser(QueryInterfaceABC):
             )
         interface = self.interface(model_class)
         fxn = getattr(interface, fname)
+        self.cache_stats.fallback(model_class)
         if fname == "all":
             models = fxn(opts=opts, **params)
         else:
@@ -314,6 +822,7 @@ class Browser(QueryInterfaceABC):
             model_class = self.model_name
         if self.use_cache:
             return self.cached_find(model_class, model_id)
+        self.cache_stats.fallback(model_class)
         return self.interface(model_class).find(model_id)
 
     def find_by_name(self, name, model_class=None, primary_key="id"):
@@ -417,17 +926,21 @@ class Browser(QueryInterfaceABC):
         self.log.info(
             "CACHE updated cached with {} {} models".format(len(modeldict), modelname)
         )
-        self.model_cache.setdefault(modelname, {})
-
-        model_cache_dict = self.model_cache[modelname]
-        for mid in modeldict:
-            model = modeldict[mid]
-            if mid in model_cache_dict:
-                cached_model = model_cache_dict[mid]
-                vars(cached_model).update(vars(model))
-            else:
-                model_cache_dict[mid] = model
-        return [model_cache_dict[mid] for mid in modeldict]
+        with self._model_lock(modelname):
+            model_cache_dict = self.model_cache.setdefault(modelname, {})
+            cached = []
+            for mid, model in modeldict.items():
+                cached_model = model_cache_dict.setdefault(mid, model)
+                if cached_model is not model:
+                    vars(cached_model).update(vars(model))
+                cached.append(cached_model)
+            if modelname == Sample.__name__:
+                with self._cache_lock:
+                    for model in cached:
+                        self.text_index.add(
+                            model._primary_key, model.name, model.description
+                        )
+            return cached
 
     def _group_models_and_update_cache(self, models):
         grouped_by_type = {}
@@ -448,11 +961,15 @@ class Browser(QueryInterfaceABC):
     def cached_find(self, model_class, id):
         if isinstance(id, list):
             return self.cached_where({"id": id}, model_class)
-        cached_models = self.model_cache.get(model_class, {})
-        found_model = cached_models.get(id, None)
+        self.wait_for_prefetch(model_class)
+        with self._model_lock(model_class):
+            found_model = self.model_cache.get(model_class, {}).get(id, None)
         if found_model is None:
+            self.cache_stats.miss(model_class)
+            self.cache_stats.fallback(model_class)
             found_model = self.interface(model_class).find(id)
         else:
+            self.cache_stats.hit(model_class)
             self.log.info(
                 "CACHE found {} model with id={} in cache".format(model_class, id)
             )
@@ -463,6 +980,7 @@ class Browser(QueryInterfaceABC):
         )[0]
 
     def server_where(self, query, model, opts, include, methods, page_size):
+        self.cache_stats.fallback(model)
         return self.interface(model).where(
             query, opts=opts, methods=methods, include=include, page_size=page_size
         )
@@ -489,10 +1007,10 @@ class Browser(QueryInterfaceABC):
         elif [] in query.values():
             return []
         else:
-            cached_models = self.model_cache.get(model, {})
-            found, found_queries = self._find_matches(
-                query, list(cached_models.values())
-            )
+            self.wait_for_prefetch(model)
+            with self._model_lock(model):
+                cached_models = list(self.model_cache.get(model, {}).values())
+            found, found_queries = self._find_matches(query, cached_models)
             found_dict = {f.id: f for f in found}
 
             # TODO: this code is broken, remaining query
@@ -512,9 +1030,14 @@ class Browser(QueryInterfaceABC):
 
             # TODO: this code may be sketchy... here {'id': []}, really means we found
             #       all of the models..
+            self.cache_stats.hit(model, len(found_dict))
             if primary_key in remaining_query and not remaining_query[primary_key]:
                 return list(found_dict.values())
+            self.cache_stats.fallback(model)
             server_models = self.interface(model).where(remaining_query, opts=opts)
+        self.cache_stats.miss(
+            model, len([m for m in server_models if m.id not in found_dict])
+        )
 
         models_dict = OrderedDict({s.id: s for s in server_models})
         models_dict.update(found_dict)
@@ -527,6 +1050,61 @@ class Browser(QueryInterfaceABC):
                 returned = returned[-opts["limit"] :]
         return returned
 
+    def name_index(self, refresh: bool = False) -> NameIndex:
+        """Returns the local :class:`NameIndex <pydent.utils.search_index.NameIndex>`
+        of model names for the browser's current model. The index is built from
+        :meth:`list_models` on first use.
+
+        .. versionadded:: 1.1.0
+
+        :param refresh: if True, add models created since the index was built
+            (see :meth:`refresh_name_index`)
+        :return: the name index
+        """
+        index = self.name_indices.get(self.model_name, None)
+        if index is None:
+            index = NameIndex(self.list_models())
+            self.name_indices[self.model_name] = index
+            self.log.info(
+                "SEARCH indexed {} {} names".format(len(index), self.model_name)
+            )
+        elif refresh:
+            self.refresh_name_index()
+        return index
+
+    def refresh_name_index(self, page_size: int = 500) -> int:
+        """Adds models newer than the index watermark (the largest indexed id)
+        to the name index. Models are requested newest first, one page at a
+        time, until an already indexed model is reached.
+
+        .. versionadded:: 1.1.0
+
+        :param page_size: number of models to request at a time
+        :return: number of models added to the index
+        """
+        index = self.name_index()
+        watermark = index.watermark
+        interface = self.interface()
+        offset = 0
+        num_added = 0
+        while True:
+            models = interface.last(page_size, opts={"offset": offset})
+            new_models = [m for m in models if m.id > watermark]
+            for m in new_models:
+                index.add(m.id, m.name)
+            num_added += len(new_models)
+            if self.use_cache and new_models:
+                self.update_cache(new_models)
+            if len(new_models) < page_size:
+                break
+            offset += page_size
+        self.log.info(
+            "SEARCH added {} new {} names to the index".format(
+                num_added, self.model_name
+            )
+        )
+        return num_added
+
     def _search_helper(self, pattern, filter_fxn, sample_type=None, **query):
         sample_type_id = None
         if sample_type is not None:
@@ -538,13 +1116,13 @@ class Browser(QueryInterfaceABC):
         if sample_type_id is not None:
             query.update({"sample_type_id": sample_type_id})
 
-        model_list = self.list_models()
+        index = self.name_index()
         self.log.info(
             "SEARCH found {} total models of type {}".format(
-                len(model_list), self.model_name
+                len(index), self.model_name
             )
         )
-        matches = filter_fxn(pattern, model_list)
+        matches = filter_fxn(pattern, index)
 
         if not matches:
             return []
@@ -577,18 +1155,16 @@ class Browser(QueryInterfaceABC):
         :type query: dict
         :return: list of samples
         :rtype: list
+
+        .. versionchanged:: 1.1.0
+            Names are searched using the local
+            :meth:`name index <pydent.browser.Browser.name_index>`. As before,
+            the pattern is matched against the Aquarium identifier of each
+            sample (e.g. '12: pMOD8').
         """
 
-        def regex_filter(pattern, sample_list):
-            matches = []
-            for name in sample_list:
-                args = []
-                if ignore_case:
-                    args.append(re.IGNORECASE)
-                m = re.search(pattern, name, *args)
-                if m is not None:
-                    matches.append(name)
-            return matches
+        def regex_filter(pattern, index):
+            return index.search(pattern, ignore_case=ignore_case)
 
         return self._search_helper(
             pattern, regex_filter, sample_type=sample_type, **query
@@ -610,21 +1186,125 @@ class Browser(QueryInterfaceABC):
         :type ignore_case: bool
         :return: list of samples
         :rtype: list
+
+        .. versionchanged:: 1.1.0
+            The samples are narrowed using the full-text index (see
+            :meth:`search_text <pydent.browser.Browser.search_text>`) and the
+            pattern is only matched against the descriptions of samples that
+            contain the literal text the pattern requires. If no samples are
+            provided, only the samples missing from the full-text index are
+            requested and the candidate samples are read from the cache.
         """
-        matches = []
-        args = []
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        literals = NameIndex.required_literals(pattern)
         if samples is None:
-            samples = self.search(".*", sample_type=sample_type)
-        if ignore_case:
-            args.append(re.IGNORECASE)
+            samples = self._text_index_candidates(literals, sample_type)
+            candidates = None
+        else:
+            with self._cache_lock:
+                for s in samples:
+                    self.text_index.add(s._primary_key, s.name, s.description)
+                candidates = self.text_index.candidates(literals)
+        matches = []
         for sample in samples:
+            if candidates is not None and sample._primary_key not in candidates:
+                continue
             description = sample.description
             if description is None:
                 continue
-            if re.search(pattern, sample.description, *args):
+            if regex.search(description):
                 matches.append(sample)
         return matches
 
+    def _index_sample_texts(self):
+        """Adds the samples of the name index that are missing from the
+        full-text index. Missing samples are read from the cache or else
+        requested from the server."""
+        index = self.name_index()
+        with self._cache_lock:
+            missing = [i for i in index.names if i not in self.text_index]
+        if not missing:
+            return
+        with self._model_lock(Sample.__name__):
+            cache = self.model_cache.get(Sample.__name__, {})
+            cached = [cache[i] for i in missing if i in cache]
+        with self._cache_lock:
+            for s in cached:
+                self.text_index.add(s._primary_key, s.name, s.description)
+            missing = [i for i in missing if i not in self.text_index]
+        if missing:
+            self.log.info(
+                "SEARCH requesting {} samples missing from the text index".format(
+                    len(missing)
+                )
+            )
+            self.update_cache(self.interface(Sample.__name__).find(missing))
+
+    def _text_index_candidates(self, literals, sample_type=None):
+        """Returns the indexed samples that may contain all of the literals,
+        read from the cache."""
+        self._index_sample_texts()
+        with self._cache_lock:
+            ids = self.text_index.candidates(literals)
+            if ids is None:
+                ids = set(self.text_index.texts)
+        ids = sorted(ids)
+        with self._model_lock(Sample.__name__):
+            cache = self.model_cache.get(Sample.__name__, {})
+            samples = [cache[i] for i in ids if i in cache]
+        if len(samples) < len(ids):
+            samples = self.cached_find(Sample.__name__, ids)
+        if sample_type is not None:
+            if isinstance(sample_type, pydent_models.SampleType):
+                sample_type_id = sample_type.id
+            else:
+                sample_type_id = self.find_by_name(sample_type, "SampleType").id
+            samples = [s for s in samples if s.sample_type_id == sample_type_id]
+        return samples
+
+    def search_text(self, query, samples=None, sample_type=None):
+        """Full-text search of sample names and descriptions, best matches
+        first. Samples are indexed as they enter the browser cache.
+
+        Queries are made of words that must all match. Use double quotes to
+        match a phrase, a leading `-` to exclude a word or phrase and `OR`
+        between alternatives:
+
+        .. code-block:: python
+
+            browser.search_text('gfp "yeast strain" -deprecated OR mcherry')
+
+        .. versionadded:: 1.1.0
+
+        :param query: the query
+        :type query: basestring
+        :param samples: samples to search. If left blank, all cached samples are
+            searched. If no samples are cached, a search to find samples will
+            be performed
+        :type samples: list
+        :param sample_type: restrict to a particular sample type
+        :type sample_type: name
+        :return: list of samples
+        :rtype: list
+        """
+        if samples is None:
+            with self._cache_lock:
+                is_empty = not self.text_index
+            if is_empty:
+                self.search(".*", sample_type=sample_type)
+            with self._cache_lock:
+                samples = list(self.model_cache.get(Sample.__name__, {}).values())
+            if sample_type is not None:
+                sample_type_id = self.find_by_name(sample_type, "SampleType").id
+                samples = [s for s in samples if s.sample_type_id == sample_type_id]
+        samples_by_id = {}
+        with self._cache_lock:
+            for s in samples:
+                self.text_index.add(s._primary_key, s.name, s.description)
+                samples_by_id[s._primary_key] = s
+            ids = self.text_index.search(query, doc_ids=samples_by_id)
+        return [samples_by_id[i] for i in ids]
+
     def close_matches(self, pattern, sample_type=None, **query):
         """Finds samples whose names closely match the pattern.
 
@@ -636,9 +1316,43 @@ class Browser(QueryInterfaceABC):
         :type query: dict
         :return: list of samples
         :rtype: list
+
+        .. versionchanged:: 1.1.0
+            Names are matched using the local
+            :meth:`name index <pydent.browser.Browser.name_index>`. The
+            pattern is compared to the sample names instead of their
+            identifiers (e.g. '12: pMOD8').
         """
+
+        def fuzzy_filter(pattern, index):
+            return index.close_matches(pattern)
+
         return self._search_helper(
-            pattern, get_close_matches, sample_type=sample_type, **query
+            pattern, fuzzy_filter, sample_type=sample_type, **query
+        )
+
+    def prefix_search(self, prefix, ignore_case=True, sample_type=None, **query):
+        """Finds samples whose names start with the prefix.
+
+        .. versionadded:: 1.1.0
+
+        :param prefix: name prefix
+        :type prefix: basestring
+        :param ignore_case: whether to ignore case (default: True)
+        :type ignore_case: bool
+        :param sample_type: sample_type_name to filter samples (optional)
+        :type sample_type: basestring
+        :param query: additional query parameters to filter by
+        :type query: dict
+        :return: list of samples
+        :rtype: list
+        """
+
+        def prefix_filter(prefix, index):
+            return index.prefix(prefix, ignore_case=ignore_case)
+
+        return self._search_helper(
+            prefix, prefix_filter, sample_type=sample_type, **query
         )
 
     def list_field_values(self, model_ids, **query):
@@ -688,6 +1402,12 @@ class Browser(QueryInterfaceABC):
         # todo: how to handle when model_attr is absent?, or just raise error?
 
         retrieve_query = relation.build_query(models)
+        if (
+            isinstance(relation, HasManyGeneric)
+            and "parent_class" not in retrieve_query
+        ):
+            # polymorphic relation; restrict to the owners' class
+            retrieve_query["parent_class"] = [models[0].get_server_model_name()]
         retrieved_models = self.where(retrieve_query, model_class2)
         self.log.info(
             "RETRIEVE retrieved {num} {cls} models using query {query}".format(
@@ -715,6 +1435,12 @@ class Browser(QueryInterfaceABC):
                             ref=ref, attr=attr, model_ref=model_ref
                         )
                     )
+            if not relation.many:
+                # same as the 'one' callback, which returns the last model
+                for model_ref, found_models in model_dict.items():
+                    model_dict[model_ref] = None
+                    if found_models:
+                        model_dict[model_ref] = max(found_models, key=lambda m: m.id)
         elif relation.QUERY_TYPE == "by_id":
             retrieved_dict = {getattr(m2, attr): m2 for m2 in retrieved_models}
             model_dict = {m1.id: None for m1 in models}
@@ -809,6 +1535,39 @@ class Browser(QueryInterfaceABC):
                 setattr(m, relationship_name, None)
         return list(set(all_models))
 
+    def _retrieve_function(
+        self,
+        models: List[ModelBase],
+        relationship_name: str,
+        strict: bool = True,
+        force_refresh: bool = False,
+    ) -> List[ModelBase]:
+        """Evaluates a :class:`Function <pydent.relationships.Function>` field
+        for a list of models after retrieving the relations the function
+        depends on (see the `depends_on` of the
+        :class:`Function <pydent.relationships.Function>`), so the function
+        itself makes no requests. Data keys in `depends_on` are skipped."""
+        relationships = models[0].get_relationships()
+        dependencies = {
+            name: sub_relations or []
+            for name, sub_relations in self._iter_relation_branches(
+                models[0].fields[relationship_name].depends_on, strict
+            )
+            if name in relationships
+        }
+        if dependencies:
+            self.recursive_retrieve(
+                models, dependencies, strict=strict, force_refresh=force_refresh
+            )
+        found_models = []
+        for model in models:
+            val = getattr(model, relationship_name)
+            if isinstance(val, list):
+                found_models += [v for v in val if isinstance(v, ModelBase)]
+            elif isinstance(val, ModelBase):
+                found_models.append(val)
+        return list(set(found_models))
+
     @staticmethod
     def _get_relation_from_model(model, relationship_name, strict):
         relationships = model.get_relationships()
@@ -865,16 +1624,36 @@ class Browser(QueryInterfaceABC):
         :type strict: bool
         :return: list of models retrieved
         :rtype: list
+
+        .. versionchanged:: 1.1.0
+            Models of different classes are grouped by class and retrieved
+            separately. `HasOneFromMany` relationships and
+            :class:`Function <pydent.relationships.Function>` fields are
+            retrieved in batches.
         """
         if not models:
             return []
         self.log.info('RETRIEVE retrieving "{}"'.format(relationship_name))
-        model_classes = {m.__class__.__name__ for m in models}
-        assert (
-            len(model_classes) == 1
-        ), "Models must be all of the same BaseModel, but found {}".format(
-            model_classes
-        )
+        grouped = {}
+        for m in models:
+            grouped.setdefault(m.__class__.__name__, []).append(m)
+        if len(grouped) > 1:
+            found_models = []
+            for group in grouped.values():
+                found_models += self.retrieve(
+                    group,
+                    relationship_name,
+                    relation=relation,
+                    strict=strict,
+                    force_refresh=force_refresh,
+                )
+            return list(set(found_models))
+        if relation is None and isinstance(
+            models[0].fields.get(relationship_name, None), Function
+        ):
+            return self._retrieve_function(
+                models, relationship_name, strict=strict, force_refresh=force_refresh
+            )
         if relation is None:
             relation = self._get_relation_from_model(
                 models[0], relationship_name, strict
@@ -895,6 +1674,7 @@ class Browser(QueryInterfaceABC):
                 )
             )
         self.log.info("RETRIEVE {}: {}".format(relationship_name, relation))
+        self.wait_for_prefetch(models[0].__class__.__name__)
 
         if not force_refresh:
             needs_refresh = [
@@ -904,6 +1684,12 @@ class Browser(QueryInterfaceABC):
         else:
             needs_refresh = models
             no_refresh = []
+        self.cache_stats.relation(
+            models[0].__class__.__name__,
+            relationship_name,
+            len(no_refresh),
+            len(needs_refresh),
+        )
 
         if needs_refresh:
             if hasattr(relation, "through_model_attr"):
@@ -930,12 +1716,43 @@ class Browser(QueryInterfaceABC):
                 found_models.append(val)
         return list(set(found_models))
 
+    @classmethod
+    def _validate_relation_spec(cls, relations, strict):
+        """Returns whether the relation spec can be retrieved. Raises a
+        BrowserException for unrecognized specs if `strict`."""
+        if isinstance(relations, cls.RELATION_SPEC_TYPES):
+            return True
+        if strict:
+            raise BrowserException(
+                "Type {} for is not recognized for recursive_retrieve".format(
+                    type(relations)
+                )
+            )
+        return False
+
+    @classmethod
+    def _iter_relation_branches(cls, relations, strict):
+        """Yields (relation_name, sub_relations) for each branch of a relation
+        spec. `sub_relations` is None for leaf branches."""
+        if isinstance(relations, str):
+            yield relations, None
+        elif isinstance(relations, dict):
+            for relation_name, sub_relations in relations.items():
+                if not cls._validate_relation_spec(sub_relations, strict):
+                    sub_relations = None
+                yield relation_name, sub_relations
+        else:
+            for relation_name in relations:
+                yield relation_name, None
+
     def recursive_retrieve(
         self,
         models: List[ModelBase],
         relations: Union[str, List[BaseRelationship], Dict],
         strict: bool = True,
         force_refresh: bool = False,
+        max_workers: int = None,
+        use_include: bool = False,
     ):
         """Efficiently retrieve a model relationship recursively from an
         iterable. The relations_dict iterable may be either a list or a
@@ -959,6 +1776,10 @@ class Browser(QueryInterfaceABC):
             }
             browser.retrieve(operations, relation_dict)
 
+        .. versionchanged:: 1.1.0
+            Sibling relations are independent of one another and are
+            retrieved concurrently on a bounded worker pool. Each nested
+            relation is scheduled as soon as its parent's models arrive.
 
         :param models: models to retrieve from
         :type models: list
@@ -968,53 +1789,507 @@ class Browser(QueryInterfaceABC):
         :param strict: wither to ignore database inconsistencies
         :param force_refresh:
         :type force_refresh: bool
+        :param max_workers: maximum number of concurrent retrievals (default: \
+            `Browser.RETRIEVE_MAX_WORKERS`). If 1, relations are retrieved serially.
+        :type max_workers: int
+        :param use_include: if True, let the server join as much of the relation \
+            tree as possible using the 'include' query option. See \
+            :meth:`include_retrieve <pydent.browser.Browser.include_retrieve>`
+        :type use_include: bool
         :return: dictionary of all models retrieved grouped by the attribute \
             name that retrieved them.
         :rtype: dictionary
         """
         self.log.info("RETRIEVE recursively retrieving {}".format(relations))
-        if isinstance(relations, str):
-            self.log.info('RETRIEVE retrieving "{}"'.format(relations))
-            return {
-                relations: self.retrieve(
-                    models, relations, strict=strict, force_refresh=force_refresh
-                )
-            }
-        elif (
-            isinstance(relations, list)
-            or isinstance(relations, set)
-            or isinstance(relations, dict)
-            or isinstance(relations, tuple)
+        if not self._validate_relation_spec(relations, strict):
+            return []
+        if use_include:
+            return self.include_retrieve(
+                models,
+                relations,
+                strict=strict,
+                force_refresh=force_refresh,
+                max_workers=max_workers,
+            )
+        if max_workers is None:
+            max_workers = self.RETRIEVE_MAX_WORKERS
+
+        # results are keyed by the branch's path in the relation tree so
+        # they can be merged in the same (depth-first) order regardless of
+        # the order in which the branches complete.
+        results = {}
+        pending = {}
+        prefetching = self._is_prefetching()
+
+        def retrieve(*args, **kwargs):
+            self._prefetch_local.active = prefetching
+            return self.retrieve(*args, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+
+            def schedule(parent_models, relations_spec, parent_path):
+                branches = self._iter_relation_branches(relations_spec, strict)
+                for i, (relation_name, sub_relations) in enumerate(branches):
+                    path = parent_path + (i,)
+                    if not parent_models:
+                        results[path] = (relation_name, [])
+                        if sub_relations is not None:
+                            schedule([], sub_relations, path)
+                        continue
+                    future = executor.submit(
+                        retrieve,
+                        parent_models,
+                        relation_name,
+                        strict=strict,
+                        force_refresh=force_refresh,
+                    )
+                    pending[future] = (path, relation_name, sub_relations)
+
+            schedule(models, relations, tuple())
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, relation_name, sub_relations = pending.pop(future)
+                    new_models = future.result()
+                    results[path] = (relation_name, new_models)
+                    if sub_relations is not None:
+                        schedule(new_models, sub_relations, path)
+
+        models_by_attr = {}
+        for path in sorted(results):
+            relation_name, new_models = results[path]
+            models_by_attr.setdefault(relation_name, [])
+            models_by_attr[relation_name] += new_models
+        return models_by_attr
+
+    @classmethod
+    def _is_includable(cls, relation: BaseRelationship) -> bool:
+        """Whether the server can join the relation using the 'include' query
+        option. Only relations that use the default find/where callbacks
+        correspond to server-side associations."""
+        if relation.__class__.__name__ not in cls.INCLUDE_RELATION_TYPES:
+            return False
+        return relation.callback in [
+            ModelBase.find_callback.__name__,
+            ModelBase.where_callback.__name__,
+        ]
+
+    @classmethod
+    def plan_include(
+        cls, model_class: str, relations: Union[str, List, Dict], strict: bool = True
+    ) -> Tuple[Dict, List[Tuple[Tuple[str, ...], str, Union[str, List, Dict]]]]:
+        """Splits a relation spec into the largest tree that can be joined by
+        the server using 'include' and the remaining branches that must be
+        retrieved hop by hop.
+
+        .. versionadded:: 1.1.0
+
+        :param model_class: name of the model class the spec starts from
+        :param relations: relation spec, as in
+            :meth:`recursive_retrieve <pydent.browser.Browser.recursive_retrieve>`
+        :param strict: if True, raise BrowserException for unrecognized specs
+        :return: tuple of the include tree (as a nested dict of relation names)
+            and a list of fallback branches as (path, relation_name, sub_relations),
+            where path is the tuple of included relation names leading to the branch
+        """
+        include = {}
+        fallback = []
+        relationships = ModelRegistry.get_model(model_class).get_relationships()
+        for relation_name, sub_relations in cls._iter_relation_branches(
+            relations, strict
         ):
-            models_by_attr = {}
-            for relation_name in relations:
+            relation = relationships.get(relation_name, None)
+            if relation is None or not cls._is_includable(relation):
+                fallback.append((tuple(), relation_name, sub_relations))
+                continue
+            if sub_relations is None:
+                include[relation_name] = {}
+                continue
+            sub_include, sub_fallback = cls.plan_include(
+                relation.nested, sub_relations, strict=strict
+            )
+            include[relation_name] = sub_include
+            for path, name, sub in sub_fallback:
+                fallback.append(((relation_name,) + path, name, sub))
+        return include, fallback
+
+    @staticmethod
+    def _server_association(relation: BaseRelationship, relation_name: str) -> str:
+        """Returns the name of the server-side association of a relation. The
+        server names a single association after its foreign key (e.g.
+        `FieldValue.sample` is `child_sample`, using `child_sample_id`)."""
+        ref = getattr(relation, "ref", None)
+        if not relation.many and ref and ref.endswith("_id"):
+            return ref[: -len("_id")]
+        return relation_name
+
+    @classmethod
+    def _include_query_option(
+        cls, model_class: str, include: Dict
+    ) -> Union[List[str], Dict]:
+        """Converts an include tree into the nested 'include' option used by
+        the Aquarium server (e.g. `{"operations": {"include": ["field_values"]}}`),
+        using the server-side association names."""
+        relationships = ModelRegistry.get_model(model_class).get_relationships()
+        names = {
+            name: cls._server_association(relationships[name], name) for name in include
+        }
+        if not any(include.values()):
+            return [names[name] for name in include]
+        option = {}
+        for name, sub in include.items():
+            option[names[name]] = {}
+            if sub:
+                nested = relationships[name].nested
+                option[names[name]]["include"] = cls._include_query_option(nested, sub)
+        return option
+
+    @classmethod
+    def _rename_included(cls, model_class: str, data, include: Dict):
+        """Renames the server-side associations in the included data to the
+        relation names of the models, in place."""
+        if isinstance(data, list):
+            for d in data:
+                cls._rename_included(model_class, d, include)
+            return
+        if not isinstance(data, dict):
+            return
+        relationships = ModelRegistry.get_model(model_class).get_relationships()
+        for name, sub_include in include.items():
+            relation = relationships[name]
+            server_name = cls._server_association(relation, name)
+            if server_name in data and server_name != name:
+                data[name] = data.pop(server_name)
+            if sub_include and name in data:
+                cls._rename_included(relation.nested, data[name], sub_include)
+
+    @staticmethod
+    def _collect_deserialized(
+        models: List[ModelBase], include: Dict, models_by_attr: Dict
+    ) -> Dict[str, List[ModelBase]]:
+        """Collects the already deserialized models along an include tree,
+        grouped by relation name."""
+        for relation_name, sub_include in include.items():
+            found = []
+            for model in models:
+                val = model._get_deserialized_data().get(relation_name, None)
+                if isinstance(val, list):
+                    found += [v for v in val if v is not None]
+                elif isinstance(val, ModelBase):
+                    found.append(val)
+            found = list(set(found))
+            models_by_attr.setdefault(relation_name, [])
+            models_by_attr[relation_name] += found
+            Browser._collect_deserialized(found, sub_include, models_by_attr)
+        return models_by_attr
+
+    @staticmethod
+    def _models_at_path(models: List[ModelBase], path: Tuple[str, ...]):
+        """Follows the deserialized relations along the path."""
+        for relation_name in path:
+            found = []
+            for model in models:
+                val = model._get_deserialized_data().get(relation_name, None)
+                if isinstance(val, list):
+                    found += [v for v in val if v is not None]
+                elif isinstance(val, ModelBase):
+                    found.append(val)
+            models = list(set(found))
+        return models
+
+    def _preserve_cached_relations(self, models: List[ModelBase]):
+        """Copies relations already deserialized on cached models onto new
+        instances of the same models, so updating the cache does not discard
+        them."""
+        with self._cache_lock:
+            for m in models:
+                cached = self.model_cache.get(m.__class__.__name__, {}).get(
+                    m._primary_key, None
+                )
+                if cached is None or cached is m:
+                    continue
+                for name, val in cached._get_deserialized_data().items():
+                    if val is not None and not m.is_deserialized(name):
+                        setattr(m, name, val)
+
+    def include_retrieve(
+        self,
+        models: List[ModelBase],
+        relations: Union[str, List, Dict],
+        strict: bool = True,
+        force_refresh: bool = False,
+        max_workers: int = None,
+    ) -> Dict[str, List[ModelBase]]:
+        """Retrieve a relation spec using as few requests as possible. The
+        part of the spec the server can join (see
+        :meth:`plan_include <pydent.browser.Browser.plan_include>`) is fetched
+        with one 'include' query per batch of root models. The nested results
+        are flattened into the cache and any branches the server cannot join
+        are retrieved hop by hop using
+        :meth:`recursive_retrieve <pydent.browser.Browser.recursive_retrieve>`.
+
+        .. versionadded:: 1.1.0
+
+        :param models: models to retrieve from
+        :param relations: the relation spec. May be a string, a list, or a dict.
+        :param strict: wither to ignore database inconsistencies
+        :param force_refresh: if True, re-fetch relations that are already
+            deserialized
+        :param max_workers: maximum number of concurrent hop by hop retrievals
+        :return: dictionary of all models retrieved grouped by the attribute
+            name that retrieved them.
+        """
+        models_by_attr = {}
+
+        def merge(other):
+            for relation_name, found in other.items():
                 models_by_attr.setdefault(relation_name, [])
-                new_models = self.retrieve(
-                    models, relation_name, strict=strict, force_refresh=force_refresh
+                models_by_attr[relation_name] += found
+
+        per_hop = dict(
+            strict=strict, force_refresh=force_refresh, max_workers=max_workers
+        )
+
+        grouped = {}
+        for m in models:
+            grouped.setdefault(m.__class__.__name__, []).append(m)
+
+        for model_class, group in grouped.items():
+            include, fallback = self.plan_include(model_class, relations, strict)
+            if not include:
+                merge(self.recursive_retrieve(group, relations, **per_hop))
+                continue
+
+            roots = []
+            remaining = []
+            for m in group:
+                if m.id is not None and (
+                    force_refresh or not all(m.is_deserialized(n) for n in include)
+                ):
+                    roots.append(m)
+                else:
+                    remaining.append(m)
+            if remaining:
+                merge(self.recursive_retrieve(remaining, relations, **per_hop))
+
+            query_include = self._include_query_option(model_class, include)
+            interface = self.interface(model_class)
+            included_roots = []
+            for batch in chunkify(roots, self.INCLUDE_BATCH_SIZE):
+                query = interface._array_query_data(
+                    "where", {"id": [m.id for m in batch]}, None, query_include, None
                 )
-                models_by_attr[relation_name] += new_models
-                if isinstance(relations, dict):
-                    _models_by_attr = self.recursive_retrieve(
-                        new_models,
-                        dict(relations).pop(relation_name),
+                try:
+                    data = interface._post_raw(query)
+                except TridentRequestError as e:
+                    self.log.error(
+                        "RETRIEVE server could not include {}. Falling back to "
+                        "retrieving relations one by one.\n{}".format(include, e)
+                    )
+                    merge(self.recursive_retrieve(batch, relations, **per_hop))
+                    continue
+                self._rename_included(model_class, data, include)
+                loaded = interface.load(data) if data is not None else []
+                self.log.info(
+                    "RETRIEVE included {} for {} {} models".format(
+                        query_include, len(batch), model_class
+                    )
+                )
+                loaded_by_id = {m.id: m for m in loaded or []}
+                missing = []
+                for m in batch:
+                    loaded_model = loaded_by_id.get(m.id, None)
+                    # the server may silently ignore an include
+                    if loaded_model is None or not _was_included(loaded_model, include):
+                        missing.append(m)
+                        continue
+                    data = loaded_model._get_deserialized_data()
+                    for relation_name in include:
+                        setattr(m, relation_name, data[relation_name])
+                    included_roots.append(m)
+                if missing:
+                    merge(self.recursive_retrieve(missing, relations, **per_hop))
+
+            included = self._collect_deserialized(included_roots, include, {})
+            memo = {}
+            ModelBase._flatten_deserialized_data(
+                [m for found in included.values() for m in found], memo
+            )
+            flattened = list(memo.values())
+            self._preserve_cached_relations(flattened)
+            self.update_cache(flattened, recursive=False)
+            merge(included)
+
+            for path, relation_name, sub_relations in fallback:
+                parents = self._models_at_path(included_roots, path)
+                spec = relation_name
+                if sub_relations is not None:
+                    spec = {relation_name: sub_relations}
+                merge(self.recursive_retrieve(parents, spec, **per_hop))
+
+        return models_by_attr
+
+    def _is_prefetching(self) -> bool:
+        """Whether the current thread is doing work for a prefetch."""
+        return getattr(self._prefetch_local, "active", False)
+
+    def _relation_classes(self, model_class: str, relations, strict: bool):
+        """Returns the names of the model classes whose models are loaded or
+        deserialized when retrieving the relation spec."""
+        model_classes = {model_class}
+        if relations is None:
+            return model_classes
+        relationships = ModelRegistry.get_model(model_class).get_relationships()
+        for relation_name, sub_relations in self._iter_relation_branches(
+            relations, strict
+        ):
+            relation = relationships.get(relation_name, None)
+            if relation is None:
+                continue
+            model_classes |= self._relation_classes(
+                relation.nested, sub_relations, strict
+            )
+        return model_classes
+
+    def wait_for_prefetch(self, *model_classes: str) -> bool:
+        """Waits for in flight prefetches of the model classes to finish. Does
+        not wait when called from a prefetch.
+
+        .. versionadded:: 1.1.0
+
+        :param model_classes: names of model classes
+        :return: whether any prefetches were waited on
+        """
+        if not self._prefetches or self._is_prefetching():
+            return False
+        with self._cache_lock:
+            futures = set()
+            for model_class in model_classes:
+                futures |= self._prefetches.get(model_class, set())
+        if not futures:
+            return False
+        self.log.info(
+            "CACHE waiting for {} prefetches of {}".format(
+                len(futures), ", ".join(model_classes)
+            )
+        )
+        wait(futures)
+        return True
+
+    def close(self, wait: bool = True):
+        """Shuts down the worker threads of :meth:`prefetch`. The threads are
+        started on the first prefetch and kept for the lifetime of the
+        browser, or until it is closed. Prefetching after closing starts new
+        threads.
+
+        .. versionadded:: 1.1.0
+
+        :param wait: whether to wait for in flight prefetches to finish
+        :return: None
+        """
+        with self._cache_lock:
+            executor = self._prefetch_executor
+            self._prefetch_executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def __del__(self):
+        executor = getattr(self, "_prefetch_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def prefetch(
+        self,
+        models_or_query: Union[List[ModelBase], Dict],
+        relations: Union[str, List, Dict] = None,
+        model_class: str = None,
+        strict: bool = True,
+        force_refresh: bool = False,
+    ) -> Future:
+        """Retrieves models and their relations on a background thread and
+        merges them into the cache. Returns immediately with a future whose
+        result is the list of prefetched models.
+
+        While a prefetch is in flight, cache lookups and relationship
+        accesses of the model classes it retrieves wait for it to finish
+        instead of making duplicate requests.
+
+        .. code-block:: python
+
+            future = browser.prefetch(
+                {"category": "Cloning"},
+                {"field_types": "allowable_field_types"},
+                model_class="OperationType",
+            )
+            # ... do other work
+            operation_types = future.result()
+
+        .. versionadded:: 1.1.0
+
+        :param models_or_query: list of models or a 'where' query
+        :param relations: optional relations to retrieve (see
+            :meth:`recursive_retrieve <pydent.browser.Browser.recursive_retrieve>`)
+        :param model_class: the model class of the query (default: the
+            browser's model class)
+        :param strict: whether to raise exceptions for invalid relations
+        :param force_refresh: if True, retrieve relations even if already
+            deserialized
+        :return: a future of the list of prefetched models
+        """
+        if isinstance(models_or_query, dict):
+            query = dict(models_or_query)
+            if model_class is None:
+                model_class = self.model_name
+            model_classes = self._relation_classes(model_class, relations, strict)
+            models = None
+        else:
+            query = None
+            models = list(models_or_query)
+            model_classes = set()
+            for name in {m.__class__.__name__ for m in models}:
+                model_classes |= self._relation_classes(name, relations, strict)
+
+        def run():
+            self._prefetch_local.active = True
+            try:
+                prefetched = models
+                if prefetched is None:
+                    prefetched = self.where(query, model_class)
+                self.log.info(
+                    "CACHE prefetching {} for {} models".format(
+                        relations, len(prefetched)
+                    )
+                )
+                if relations is not None and prefetched:
+                    self.recursive_retrieve(
+                        prefetched,
+                        relations,
                         strict=strict,
                         force_refresh=force_refresh,
                     )
-                    for attr in _models_by_attr:
-                        _models = _models_by_attr[attr]
-                        if attr in models_by_attr:
-                            models_by_attr[attr] += _models
-                        else:
-                            models_by_attr[attr] = _models_by_attr[attr]
-            return models_by_attr
-        elif not strict:
-            return []
-        else:
-            raise BrowserException(
-                "Type {} for is not recognized for recursive_retrieve".format(
-                    type(relations)
+                self.update_cache(prefetched)
+                return prefetched
+            finally:
+                self._prefetch_local.active = False
+
+        with self._cache_lock:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=self.PREFETCH_MAX_WORKERS
                 )
-            )
+            future = self._prefetch_executor.submit(run)
+            for name in model_classes:
+                self._prefetches.setdefault(name, set()).add(future)
+
+        def done(f):
+            with self._cache_lock:
+                for name in model_classes:
+                    self._prefetches[name].discard(f)
+                    if not self._prefetches[name]:
+                        del self._prefetches[name]
+
+        future.add_done_callback(done)
+        return future
 
     @classmethod
     def sample_network(
@@ -1025,6 +2300,8 @@ class Browser(QueryInterfaceABC):
         get_models: Callable = None,
         cache_func: Callable = None,
         key_func: Callable = None,
+        max_depth: int = None,
+        max_nodes: int = None,
     ) -> nx.DiGraph:
         """Build a DAG of :class:`Samples <pydent.models.Sample>` from their.
 
@@ -1036,9 +2313,14 @@ class Browser(QueryInterfaceABC):
         .. versionchanged:: 0.1.5a16
             added optional get_models, cache_func, key_func arguments
 
+        .. versionchanged:: 1.1.0
+            added optional max_depth and max_nodes arguments
+
         :param samples: list of samples
         :param reverse: whether to reverse the edges of the final graph
         :param g: the graph
+        :param max_depth: optional maximum number of hops from the starting samples
+        :param max_nodes: optional maximum number of nodes in the graph
         :return:
         """
 
@@ -1062,6 +2344,8 @@ class Browser(QueryInterfaceABC):
             reverse=reverse,
             g=g,
             key_func=key_func,
+            max_depth=max_depth,
+            max_nodes=max_nodes,
         )
 
     @classmethod
@@ -1074,14 +2358,24 @@ class Browser(QueryInterfaceABC):
         reverse: bool = False,
         g: nx.DiGraph = None,
         strict_cache: bool = True,
+        max_depth: int = None,
+        max_nodes: int = None,
     ):
         """Build a DAG of related models based on some relationships. By
         default are built from a model using (model.__class__.__name__,
         model._primary_key)
 
+        The graph is built breadth first. `cache_func` is called once for
+        each frontier of newly discovered models, so it can retrieve the
+        relationships of the whole frontier at once.
+
         .. versionadded:: 0.1.5a7
             method added
 
+        .. versionchanged:: 1.1.0
+            traversal is iterative and added optional max_depth and max_nodes
+            arguments
+
         .. seealso::
             Usage example :meth:`sample_network <pydent.browser.Browser.sample_network>`
 
@@ -1097,6 +2391,10 @@ class Browser(QueryInterfaceABC):
         :param reverse: whether to reverse the edge list
         :param strict_cache: if True, if a request occurs after the cache step,
             a ForbiddenRequestException will be raised.
+        :param max_depth: optional maximum number of hops from the starting models.
+            Models at this depth are added to the graph but not expanded.
+        :param max_nodes: optional maximum number of nodes in the graph. Once
+            reached, newly discovered models (and their edges) are ignored.
         :return: the relationship graph
         """
 
@@ -1108,58 +2406,57 @@ class Browser(QueryInterfaceABC):
         if g is None:
             g = nx.DiGraph()
 
-        models = list(models)
-
-        if not models:
-            return g
-
-        for m in models:
-            key, ndata = key_func(m)
-            g.add_node(key, attr_dict=ndata)
-
-        visited = list(g.nodes)
-
-        if cache_func:
-            cache_func(models)
-
-        new_models = []
-        new_edges = []
-
         if strict_cache:
             kwargs = {"using_requests": False, "session_swap": True}
         else:
             kwargs = {}
 
-        with models[0].session(**kwargs):
-            try:
-                for m1 in models:
-                    for m2, data in get_models(m1):
-                        if key_func(m2)[0] not in visited:
-                            new_models.append(m2)
-                        new_edges.append((key_func(m2)[0], key_func(m1)[0], data))
-            except ForbiddenRequestError as e:
-                msg = (
-                    "An exception occurred while strict_cache == True.\n"
-                    "This is most likely due to the cache_func not being thorough.\n"
-                    "{}".format(str(e))
-                )
-                raise e.__class__(msg)
+        visited = set(g.nodes)
+        frontier = {}
+        for m in models:
+            key, ndata = key_func(m)
+            g.add_node(key, attr_dict=ndata)
+            visited.add(key)
+            frontier.setdefault(key, m)
+        frontier = list(frontier.items())
+
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            if cache_func:
+                cache_func([m for _, m in frontier])
+
+            next_frontier = []
+            new_edges = []
+            with frontier[0][1].session(**kwargs):
+                try:
+                    for key1, m1 in frontier:
+                        for m2, data in get_models(m1):
+                            key2, ndata = key_func(m2)
+                            if key2 not in visited:
+                                if max_nodes is not None and len(visited) >= max_nodes:
+                                    continue
+                                visited.add(key2)
+                                g.add_node(key2, attr_dict=ndata)
+                                next_frontier.append((key2, m2))
+                            new_edges.append((key2, key1, data))
+                except ForbiddenRequestError as e:
+                    msg = (
+                        "An exception occurred while strict_cache == True.\n"
+                        "This is most likely due to the cache_func not being thorough.\n"
+                        "{}".format(str(e))
+                    )
+                    raise e.__class__(msg)
 
-        for n1, n2, edata in new_edges:
-            if reverse:
-                g.add_edge(n2, n1, attr_dict=edata)
-            else:
-                g.add_edge(n1, n2, attr_dict=edata)
+            for n1, n2, edata in new_edges:
+                if reverse:
+                    g.add_edge(n2, n1, attr_dict=edata)
+                else:
+                    g.add_edge(n1, n2, attr_dict=edata)
 
-        return cls.relationship_network(
-            new_models,
-            get_models,
-            cache_func,
-            key_func=key_func,
-            g=g,
-            reverse=reverse,
-            strict_cache=strict_cache,
-        )
+            frontier = next_frontier
+            depth += 1
+
+        return g
 
     # def relationship_network(self, models, get_models, cache_func, g=None):
     #     """
@@ -1207,9 +2504,11 @@ class Browser(QueryInterfaceABC):
         if isinstance(models, ModelBase):
             models = [models]
         elif isinstance(models, str):
-            models = list(self.model_cache.get(models, {}).values())
+            model_class = models
+            models = list(self.model_cache.get(model_class, {}).values())
             if query:
                 models, _ = self._find_matches(query, models)
+            self.cache_stats.hit(model_class, len(models))
         if relations:
             if isinstance(relations, str):
                 return self.retrieve(
@@ -0,0 +1,164 @@
+"""
+Columnar loading (:mod:`pydent.frames`)
+=======================================
+
+.. currentmodule:: pydent.frames
+
+Builds column arrays directly from server data, returned by
+``session.<Model>.frame(query, columns=...)``. No models are created, so
+tabular exports only hold the decoded page of server data and the
+columns in memory. The columns can be passed directly to a
+`pandas.DataFrame`:
+
+.. code-block:: python
+
+    import pandas
+
+    df = pandas.DataFrame(
+        session.Sample.frame({"sample_type_id": 1}, field_values=True)
+    )
+
+.. versionadded:: 1.1.0
+
+.. autosummary::
+    :toctree: generated/
+
+    ColumnBuilder
+    field_value_columns
+    data_association_columns
+"""
+from typing import Dict
+from typing import Iterable
+from typing import List
+
+from pydent.utils import json_codec
+
+FIELD_VALUES = "field_values"
+DATA_ASSOCIATIONS = "data_associations"
+
+
+def _add_value(row: dict, key: str, value):
+    if key in row:
+        prev = row[key]
+        if isinstance(prev, list):
+            prev.append(value)
+        else:
+            row[key] = [prev, value]
+    else:
+        row[key] = value
+
+
+def field_value_columns(field_values: List[dict]) -> dict:
+    """Returns the columns of a list of field value data, keyed by
+    ``field_values.<name>`` (or ``field_values.<role>.<name>`` for field
+    values with a role). The column value is the field value 'value' or,
+    for sample field values, the 'child_sample_id'. Repeated names (array
+    field values) are collected into a list.
+
+    :param field_values: list of field value data
+    :return: dictionary of column names to values
+    """
+    row = {}
+    for fv in field_values:
+        role = fv.get("role", None)
+        if role:
+            key = "{}.{}.{}".format(FIELD_VALUES, role, fv.get("name", None))
+        else:
+            key = "{}.{}".format(FIELD_VALUES, fv.get("name", None))
+        value = fv.get("value", None)
+        if value is None:
+            value = fv.get("child_sample_id", None)
+        _add_value(row, key, value)
+    return row
+
+
+def data_association_columns(data_associations: List[dict]) -> dict:
+    """Returns the columns of a list of data association data, keyed by
+    ``data_associations.<key>``. Repeated keys are collected into a list.
+
+    :param data_associations: list of data association data
+    :return: dictionary of column names to values
+    """
+    row = {}
+    for da in data_associations:
+        key = da.get("key", None)
+        obj = da.get("object", None)
+        if isinstance(obj, str):
+            obj = json_codec.loads(obj)
+        value = None
+        if isinstance(obj, dict):
+            value = obj.get(key, None)
+        _add_value(row, "{}.{}".format(DATA_ASSOCIATIONS, key), value)
+    return row
+
+
+class ColumnBuilder:
+    """Accumulates rows of server data into column arrays.
+
+    If `columns` is provided, only those columns are kept, in the given
+    order. Otherwise columns are added as they are first seen and missing
+    values are filled with None.
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[str] = None,
+        exclude: Iterable[str] = None,
+        field_values: bool = False,
+        data_associations: bool = False,
+    ):
+        """Initializer for the ColumnBuilder.
+
+        :param columns: optional list of columns to keep
+        :param exclude: keys to exclude from the columns (e.g. relationships)
+        :param field_values: whether to expand 'field_values' into columns
+        :param data_associations: whether to expand 'data_associations' into
+            columns
+        """
+        self.fixed = columns is not None
+        self.columns = {}  #: the column arrays
+        if self.fixed:
+            self.columns = {c: [] for c in columns}
+        self.exclude = frozenset(exclude or ())
+        self.field_values = field_values
+        self.data_associations = data_associations
+        self.num_rows = 0
+
+    def _row(self, data: dict) -> dict:
+        row = {k: v for k, v in data.items() if k not in self.exclude}
+        if self.field_values:
+            row.update(field_value_columns(data.get(FIELD_VALUES, None) or []))
+        if self.data_associations:
+            row.update(
+                data_association_columns(data.get(DATA_ASSOCIATIONS, None) or [])
+            )
+        return row
+
+    def add(self, data: dict):
+        """Adds the data of a single model as a row."""
+        row = self._row(data)
+        columns = self.columns
+        if self.fixed:
+            for k, col in columns.items():
+                col.append(row.get(k, None))
+        else:
+            n = self.num_rows
+            for k, v in row.items():
+                col = columns.get(k, None)
+                if col is None:
+                    columns[k] = col = [None] * n
+                col.append(v)
+            if len(row) != len(columns):
+                for col in columns.values():
+                    if len(col) == n:
+                        col.append(None)
+        self.num_rows += 1
+
+    def extend(self, data: List[dict]):
+        """Adds the data of many models as rows."""
+        for d in data:
+            self.add(d)
+
+    def build(self) -> Dict[str, list]:
+        """Returns the column arrays."""
+        return self.columns
@@ -31,6 +31,7 @@ Example:
 import json
 from abc import ABC
 from abc import abstractmethod
+from typing import Dict
 from typing import Generator
 from typing import List
 from typing import Union
@@ -42,6 +43,10 @@ from .exceptions import TridentRequestError
 from .utils import url_build
 from pydent.marshaller.base import SchemaModel
 from pydent.marshaller.registry import ModelRegistry
+from pydent.frames import ColumnBuilder
+from pydent.frames import DATA_ASSOCIATIONS
+from pydent.frames import FIELD_VALUES
+from pydent.records import load_records
 
 
 class SessionInterface:
@@ -507,34 +512,51 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
                     )
         return query
 
-    def _post_json(self, data):
-        """Posts a json request to session for this interface.
+    def _post_raw(self, data):
+        """Posts a json request to session for this interface and returns
+        the server data.
 
-        Attaches raw json and this session instance to the models it
-        retrieves.
+        .. versionadded:: 1.1.0
         """
         data_dict = {"model": self.model_name}
         data_dict = self._prepost_query_hook(data_dict)
         data_dict.update({k: v for k, v in data.items() if v})
 
         try:
-            post_response = self.crud.json_post(self.model_name, data_dict)
+            return self.crud.json_post(self.model_name, data_dict)
         except TridentRequestError as err:
             if err.response.status_code == 422:
                 return None
             else:
                 raise err
 
+    def _post_json(self, data, frozen: bool = False):
+        """Posts a json request to session for this interface.
+
+        Attaches raw json and this session instance to the models it
+        retrieves.
+
+        .. versionchanged:: 1.1.0
+            Added `frozen` to load :mod:`frozen records <pydent.records>`
+            instead of models.
+        """
+        post_response = self._post_raw(data)
         if post_response is not None and self._do_load:
-            return self.load(post_response)
+            return self.load(post_response, frozen=frozen)
         return post_response
 
-    def load(self, post_response):
+    def load(self, post_response, frozen: bool = False):
         """Loads model instance(s) from data.
 
         Model instances will be of class defined by self.model. If data
         is a list, will return a list of model instances.
+
+        .. versionchanged:: 1.1.0
+            Added `frozen` to load :mod:`frozen records <pydent.records>`
+            instead of models.
         """
+        if frozen:
+            return load_records(self.model, post_response, self.session)
         models = self.model.load_from(post_response, self.session)
         return models
 
@@ -571,8 +593,27 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
             }
         )
 
-    def array_query(self, method, args, rest=None, include=None, opts: dict = None):
+    def array_query(
+        self,
+        method,
+        args,
+        rest=None,
+        include=None,
+        opts: dict = None,
+        frozen: bool = False,
+    ):
         """Finds models based on a query."""
+        query = self._array_query_data(method, args, rest, include, opts)
+        if query is None:
+            return []
+        res = self._post_json(query, frozen=frozen)
+        if res is None:
+            return []
+        return res
+
+    def _array_query_data(self, method, args, rest, include, opts):
+        """Returns the request data for an array query, or None if no models
+        are requested."""
         if opts is None:
             opts = {}
         options = {
@@ -582,7 +623,7 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         }
         options.update(opts)
         if options.get("limit", None) == 0:
-            return []
+            return None
         if args is None:
             args = []
         query = {
@@ -594,10 +635,7 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         }
         if rest:
             query.update(rest)
-        res = self._post_json(query)
-        if res is None:
-            return []
-        return res
+        return query
 
     def all(self, methods: List[str] = None, include=None, opts: dict = None):
         """Finds all models.
@@ -628,9 +666,15 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         include: List[str] = None,
         page_size: int = None,
         opts: dict = None,
+        frozen: bool = False,
     ):
         """Performs a query for models.
 
+        .. versionchanged:: 1.1.0
+            Added `frozen`. If True, returns read-only
+            :class:`FrozenRecord <pydent.records.FrozenRecord>` instances
+            instead of models, which use much less memory for large loads.
+
         :param criteria: query to find models
         :type criteria: dict
         :param methods: server side methods to implement
@@ -638,6 +682,8 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         :param opts: additional options ("offset", "limit", "reverse", etc.)
         :type opts: dict
         :param include:
+        :param frozen: whether to return frozen records instead of models
+        :type frozen: bool
         :return: list of models
         :rtype: list
         """
@@ -649,6 +695,7 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
                 methods=methods,
                 include=include,
                 opts=opts,
+                frozen=frozen,
             ):
                 results += page
             return results
@@ -658,7 +705,12 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         if methods is not None:
             rest = {"methods": methods}
         return self.array_query(
-            method="where", args=criteria, rest=rest, include=include, opts=opts
+            method="where",
+            args=criteria,
+            rest=rest,
+            include=include,
+            opts=opts,
+            frozen=frozen,
         )
 
     # TODO: Refactor 'last' so query is an argument, not part of kwargs
@@ -748,6 +800,7 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         methods: List[str] = None,
         include: List[str] = None,
         opts: dict = None,
+        frozen: bool = False,
     ) -> Generator[list, None, None]:
         """Return pagination query (as a generator).
 
@@ -756,8 +809,21 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         :param page_size: number of models to return per page
         :param limit: total number of models to return
         :param opts: additional options
+        :param frozen: whether to return frozen records instead of models
         :return: generator of list of models
         """
+        yield from self._pages(
+            lambda _opts: self.where(
+                query, methods=methods, include=include, opts=_opts, frozen=frozen
+            ),
+            page_size,
+            opts,
+        )
+
+    @staticmethod
+    def _pages(fetch, page_size: int, opts: dict = None):
+        """Yields pages returned by `fetch`, called with the options of each
+        page, until a page is empty or the limit in `opts` is reached."""
         if opts is None:
             opts = {}
         limit = opts.get("limit", -1)
@@ -770,13 +836,107 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
             _opts = {}
         while n < limit or limit == -1:
             _opts["limit"] = page_size
+            if limit >= 0:
+                _opts["limit"] = min(page_size, limit - n)
             _opts["offset"] = n
-            models = self.where(query, methods=methods, include=include, opts=_opts)
+            models = fetch(_opts)
             if not models:
                 return
             n += len(models)
             yield models
 
+    def frame(
+        self,
+        criteria: dict,
+        columns: List[str] = None,
+        methods: List[str] = None,
+        include=None,
+        page_size: int = None,
+        opts: dict = None,
+        field_values: bool = False,
+        data_associations: bool = False,
+    ) -> Dict[str, list]:
+        """Performs a query and returns the data as columns, without creating
+        models. The columns can be passed directly to a `pandas.DataFrame`.
+
+        .. versionadded:: 1.1.0
+
+        :param criteria: query to find models
+        :type criteria: dict
+        :param columns: optional list of columns to return. By default, all
+            data keys of the models are returned.
+        :type columns: list
+        :param methods: server side methods to implement
+        :type methods: list
+        :param include: relationships to include (e.g. to expand)
+        :param page_size: if provided, requests the models in pages of this
+            size. Only one page of server data is held at a time.
+        :type page_size: int
+        :param opts: additional options ("offset", "limit", "reverse", etc.)
+        :type opts: dict
+        :param field_values: whether to expand 'field_values' into
+            ``field_values.<name>`` columns
+        :type field_values: bool
+        :param data_associations: whether to expand 'data_associations' into
+            ``data_associations.<key>`` columns
+        :type data_associations: bool
+        :return: dictionary of column names to lists of values
+        :rtype: dict
+        """
+        relationships = self.model.get_relationships()
+        expand = []
+        if field_values:
+            expand.append(FIELD_VALUES)
+        if data_associations:
+            expand.append(DATA_ASSOCIATIONS)
+        for name in expand:
+            if name not in relationships:
+                raise ValueError(
+                    "Cannot expand '{}'. {} has no relationship '{}'".format(
+                        name, self.model_name, name
+                    )
+                )
+        include = self._merge_include(include, expand)
+        rest = {}
+        if methods is not None:
+            rest = {"methods": methods}
+
+        def fetch(_opts):
+            query = self._array_query_data("where", criteria, rest, include, _opts)
+            if query is None:
+                return []
+            return self._post_raw(query) or []
+
+        if page_size is None:
+            pages = [fetch(opts)]
+        else:
+            pages = self._pages(fetch, page_size, opts)
+        builder = ColumnBuilder(
+            columns,
+            exclude=relationships,
+            field_values=field_values,
+            data_associations=data_associations,
+        )
+        for page in pages:
+            builder.extend(page)
+        return builder.build()
+
+    @staticmethod
+    def _merge_include(include, names: List[str]):
+        """Adds relationship names to an 'include' option."""
+        if not names:
+            return include
+        if include is None:
+            return list(names)
+        if isinstance(include, str):
+            include = [include]
+        if isinstance(include, dict):
+            include = dict(include)
+            for name in names:
+                include.setdefault(name, {})
+            return include
+        return list(include) + [n for n in names if n not in include]
+
     def new(self, *args, **kwargs):
         """Creates a new model instance.
 
@@ -827,7 +987,14 @@ class BrowserInterface(SessionInterface, QueryInterfaceABC):
         methods: List[str] = None,
         page_size: int = None,
         opts: dict = None,
+        frozen: bool = False,
     ):
+        if frozen:
+            # frozen records are not cached by the browser
+            interface = QueryInterface(self.model_name, self.aqhttp, self.session)
+            return interface.where(
+                criteria, methods=methods, page_size=page_size, opts=opts, frozen=True
+            )
         return self.browser.where(
             criteria,
             model_class=self.model_name,
@@ -836,6 +1003,11 @@ class BrowserInterface(SessionInterface, QueryInterfaceABC):
             page_size=page_size,
         )
 
+    def frame(self, criteria: dict, columns: List[str] = None, **kwargs):
+        # columns are loaded without models, so the browser cache is not used
+        interface = QueryInterface(self.model_name, self.aqhttp, self.session)
+        return interface.frame(criteria, columns=columns, **kwargs)
+
     def one(self, query: dict = None, first: bool = False, opts: dict = None):
         return self.browser.one(model_class=self.model_name, query=query, opts=opts)
 
@@ -1,20 +1,22 @@
 """Model base class."""
-import functools
 import inspect
-from copy import deepcopy
 from typing import Any
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Tuple
 from typing import Union
 
 from pydent.marshaller.descriptors import DataAccessor
+from pydent.marshaller.descriptors import Placeholders
 from pydent.marshaller.exceptions import SchemaException
 from pydent.marshaller.exceptions import SchemaModelException
-from pydent.marshaller.fields import Callback
 from pydent.marshaller.registry import ModelRegistry
 from pydent.marshaller.schema import DynamicSchema
 from pydent.marshaller.schema import SchemaRegistry
+from pydent.marshaller.utils import copy_data
+
+EMPTY_KEYS = frozenset()
 
 
 def add_schema(cls):
@@ -60,8 +62,16 @@ class SchemaModel(metaclass=ModelRegistry):
         """
         return getattr(self.__class__, "model_schema", None)
 
-    def add_data(self, data):
-        """Initializes fake attributes that correspond to data."""
+    def add_data(self, data, lazy: bool = False):
+        """Initializes fake attributes that correspond to data.
+
+        .. versionchanged:: 1.1.0
+            Added `lazy` parameter.
+
+        :param data: the data to add
+        :param lazy: if True, nested relationship data is deserialized on
+            first access instead of immediately
+        """
         if not self.model_schema:
             filepath = ""
             try:
@@ -79,15 +89,23 @@ class SchemaModel(metaclass=ModelRegistry):
                 )
             )
         if data is not None:
-            self.__class__.model_schema.init_data_accessors(self, data)
+            self.__class__.model_schema.init_data_accessors(self, data, lazy=lazy)
 
     def _get_data(self):
         """Return the model's data."""
         return getattr(self, self.__class__._data_key)
 
     def _get_deserialized_data(self):
-        """Return the deserialized model data."""
-        return getattr(self, self.__class__._deserialized_key)
+        """Return the deserialized model data.
+
+        .. versionchanged:: 1.1.0
+            Nested data that was loaded lazily is deserialized first.
+        """
+        data = getattr(self, self.__class__._deserialized_key)
+        lazy = [k for k, v in data.items() if v is Placeholders.LAZY]
+        for k in lazy:
+            getattr(self, k)
+        return data
 
     def get_deserialized(self, name):
         """Get deserialized data by name.
@@ -107,10 +125,13 @@ class SchemaModel(metaclass=ModelRegistry):
         .. versionadded:: 0.1.5a7
             Method added
 
+        .. versionchanged:: 1.1.0
+            Nested data that was loaded lazily counts as deserialized.
+
         :param name: name of the attribute
         :return: True if key has been deserialized.
         """
-        data = self._get_deserialized_data()
+        data = getattr(self, self.__class__._deserialized_key)
         accessor = self.fields[name]
         if name in data and data[name] is not accessor.ACCESSOR.HOLDER:
             return True
@@ -126,7 +147,7 @@ class SchemaModel(metaclass=ModelRegistry):
         :param name: name of the attribute
         :return: None
         """
-        del self._get_deserialized_data()[name]
+        del getattr(self, self.__class__._deserialized_key)[name]
 
     @classmethod
     def _set_data(cls, data, calling_obj=None):
@@ -145,6 +166,25 @@ class SchemaModel(metaclass=ModelRegistry):
         else:
             return {k: None for k in keys}
 
+    @staticmethod
+    def _dump_key_set(keys: dict) -> FrozenSet[str]:
+        if not keys:
+            return EMPTY_KEYS
+        return frozenset(keys)
+
+    @classmethod
+    def _dump_extras(cls, obj: "SchemaModel", data: dict, **kwargs):
+        """Hook for adding extra keys to the dumped data of each model in a
+        dump.
+
+        .. versionadded:: 1.1.0
+
+        :param obj: the model being dumped
+        :param data: the dumped data of the model
+        :param kwargs: the additional keyword arguments passed to `_dump`
+        :return: None
+        """
+
     @classmethod
     def _dump(
         cls,
@@ -154,61 +194,92 @@ class SchemaModel(metaclass=ModelRegistry):
         ignore: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
         **kwargs,
     ) -> dict:
+        """Dumps the model and any included nested models.
+
+        .. versionchanged:: 1.1.0
+            Dumps nested models iteratively using cached
+            :class:`DumpPlan <pydent.marshaller.schema.DumpPlan>` selections.
+            The returned data never shares containers with the models. Models
+            that occur repeatedly in the dump (with the same options) are
+            dumped once and copied.
+        """
         if not issubclass(type(obj), SchemaModel):
             return obj
 
-        only = cls._keys_to_dict(only)
-        include = cls._keys_to_dict(include)
-        ignore = cls._keys_to_dict(ignore)
-
-        data = {}
-
-        serialized_data = obj._get_data()
-
-        include_and_only = set(include).union(set(only))
-
-        for fname in include_and_only:
-            getattr(obj, fname)
-
-        keys = set(serialized_data.keys())
-        keys = keys.difference(set(ignore))
-        if only:
-            keys = keys.intersection(set(only))
-
-        model_fields = obj.__class__.model_schema.fields
-
-        callback_fields = []
-        always_dump = []
-        for fname, field in model_fields.items():
-            if hasattr(field, "nested") or issubclass(type(field), Callback):
-                callback_fields.append(fname)
-            if getattr(field, "always_dump", None):
-                always_dump.append(fname)
-
-        include_and_only = include_and_only.union(set(always_dump))
-        callback_keys = include_and_only.intersection(set(callback_fields))
-        callback_keys = callback_keys.difference(set(ignore))
-
-        data_keys = keys.difference(set(callback_fields))
-
-        for key in data_keys:
-            data[key] = serialized_data[key]
-        for key in callback_keys:
-            field = model_fields[key]
-            val = getattr(obj, key)
-            dump_kwargs = dict(
-                include=include.pop(key, None),
-                only=only.pop(key, None),
-                ignore=ignore.pop(key, None),
-            )
-            dump_kwargs.update(kwargs)
-            dump = functools.partial(cls._dump, **dump_kwargs)
-            if getattr(model_fields[key], "nested", None) and model_fields[key].many:
-                if isinstance(val, list):
-                    data[field.data_key] = [dump(v) for v in val]
+        # memo values are frames of [data, pending children, parent frame, model]
+        result = [None]
+        plans = {}
+        memo = {}
+
+        def done(frame):
+            while frame is not None:
+                frame[1] -= 1
+                if frame[1]:
+                    return
+                frame = frame[2]
+
+        stack = [(obj, only, include, ignore, result, 0, None)]
+        while stack:
+            obj, only, include, ignore, container, key, parent = stack.pop()
+            memo_key = (id(obj), id(only), id(include), id(ignore))
+            frame = memo.get(memo_key, None)
+            if frame is not None:
+                if frame[1]:
+                    raise SchemaModelException(
+                        "Cannot dump {} because it contains itself.".format(
+                            obj.__class__.__name__
+                        )
+                    )
+                container[key] = copy_data(frame[0])
+                done(parent)
+                continue
+
+            plan_key = (obj.__class__,) + memo_key[1:]
+            selection = plans.get(plan_key, None)
+            if selection is None:
+                selection = (
+                    cls._keys_to_dict(only),
+                    cls._keys_to_dict(include),
+                    cls._keys_to_dict(ignore),
+                )
+                plan = obj.__class__.model_schema.dump_plan(
+                    *[cls._dump_key_set(keys) for keys in selection]
+                )
+                plans[plan_key] = selection = (plan,) + selection
+            plan, only, include, ignore = selection
+
+            for fname in plan.access:
+                getattr(obj, fname)
+
+            container[key] = data = plan.select(obj._get_data())
+
+            children = []
+            for fname, data_key, many in plan.callbacks:
+                val = getattr(obj, fname)
+                options = (only.get(fname), include.get(fname), ignore.get(fname))
+                if many:
+                    if isinstance(val, list):
+                        data[data_key] = vals = [None] * len(val)
+                        for i, v in enumerate(val):
+                            if issubclass(type(v), SchemaModel):
+                                children.append((v,) + options + (vals, i))
+                            else:
+                                vals[i] = copy_data(v)
+                elif issubclass(type(val), SchemaModel):
+                    data[data_key] = None
+                    children.append((val,) + options + (data, data_key))
+                else:
+                    data[data_key] = copy_data(val)
+            cls._dump_extras(obj, data, **kwargs)
+
+            frame = [data, len(children), parent, obj]
+            memo[memo_key] = frame
+            if children:
+                for child in reversed(children):
+                    stack.append(child + (frame,))
             else:
-                data[field.data_key] = dump(val)
-        return data
+                done(parent)
+        return result[0]
 
     def dump(
         self,
@@ -227,7 +298,7 @@ class SchemaModel(metaclass=ModelRegistry):
         :return: the serialized data
         :rtype: dict
         """
-        return deepcopy(self._dump(self, only=only, include=include, ignore=ignore))
+        return self._dump(self, only=only, include=include, ignore=ignore)
 
     # def __dir__(self):
     #     return ['a']
@@ -256,9 +327,19 @@ class SchemaModel(metaclass=ModelRegistry):
         these descriptors.
         """
         self.__dict__ = state
+        self._add_data_accessors(state[ModelRegistry._data_key])
+
+    @classmethod
+    def _add_data_accessors(cls, data: dict):
+        """Adds data accessors to the class for keys of the data that do not
+        yet have an attribute.
 
-        # add data accessors
-        data = state[ModelRegistry._data_key]
+        .. versionadded:: 1.1.0
+            Uses the cached load plan for the keys of the data, so the keys
+            are only checked the first time.
+        """
+        if cls._model_schema.load_plan(data) is not None:
+            return
         for k in data:
-            if k not in self.__class__.__dict__:
-                setattr(self.__class__, k, DataAccessor(k, ModelRegistry._data_key))
+            if k not in cls.__dict__:
+                setattr(cls, k, DataAccessor(k, ModelRegistry._data_key))
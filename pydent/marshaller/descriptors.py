@@ -23,6 +23,7 @@ class Placeholders(Enum):
     MARSHALL = auto()  #: MARSHALL accessor holder.
     CALLBACK = auto()  #: CALLBACK accessor holder.
     DEFAULT = auto()  #: DEFAULT accessor holder.
+    LAZY = auto()  #: LAZY holder for nested data that is not yet deserialized.
 
 
 class DataAccessor:
@@ -74,9 +75,19 @@ class DataAccessor:
             instance.y
         except AttributeError:
             print("y is not set")
+
+    .. versionchanged:: 1.1.0
+        Set values are read directly from the instance dictionary. The
+        slower `_get` is only used for missing values and
+        :class:`Placeholders`. Subclasses with a `HOLDER` that is not a
+        :class:`Placeholders` member should override `__get__`.
+
+    .. versionchanged:: 1.1.0
+        Setting or deleting the value forgets the memoized values of the
+        descriptors in `dependents`.
     """
 
-    __slots__ = ["name", "accessor", "default"]
+    __slots__ = ["name", "accessor", "default", "dependents"]
     HOLDER = Placeholders.DATA
 
     def __init__(self, name, accessor=None, default=HOLDER):
@@ -85,6 +96,8 @@ class DataAccessor:
         if default is Placeholders.DEFAULT:
             default = self.HOLDER
         self.default = default
+        #: descriptors with memoized values that depend on this descriptor
+        self.dependents = ()
         if self.name == self.accessor:
             raise MarshallingAttributeAccessError(
                 "Descriptor name '{}' cannot be accessor name '{}'".format(
@@ -97,6 +110,20 @@ class DataAccessor:
         return access_data.get(self.name, self.default)
 
     def __get__(self, obj, objtype):
+        try:
+            val = obj.__dict__[self.accessor][self.name]
+        except (AttributeError, KeyError):
+            return self._get(obj)
+        if val.__class__ is Placeholders:
+            return self._get(obj)
+        return val
+
+    def _get(self, obj):
+        """Slow path of `__get__`, used when the value is missing or is a
+        placeholder.
+
+        .. versionadded:: 1.1.0
+        """
         val = self.get_val(obj)
         if val is self.HOLDER:
             raise AttributeError(
@@ -109,9 +136,21 @@ class DataAccessor:
 
     def __set__(self, obj, val):
         getattr(obj, self.accessor)[self.name] = val
+        if self.dependents:
+            self.forget_dependents(obj)
 
     def __delete__(self, obj):
         getattr(obj, self.accessor)[self.name] = self.HOLDER
+        if self.dependents:
+            self.forget_dependents(obj)
+
+    def forget_dependents(self, obj):
+        """Forgets the memoized values of the `dependents` of this descriptor.
+
+        .. versionadded:: 1.1.0
+        """
+        for descriptor in self.dependents:
+            descriptor.forget(obj)
 
 
 class MarshallingAccessor(DataAccessor):
@@ -146,6 +185,15 @@ class MarshallingAccessor(DataAccessor):
             ) from e
 
     def __get__(self, obj, objtype):
+        try:
+            val = obj.__dict__[self.deserialized_accessor][self.name]
+        except (AttributeError, KeyError):
+            return self._get(obj)
+        if val.__class__ is Placeholders:
+            return self._get(obj)
+        return val
+
+    def _get(self, obj):
         val = self.get_val(obj)
         if val is self.HOLDER:
             val = getattr(obj, self.accessor).get(self.name, self.HOLDER)
@@ -165,6 +213,8 @@ class MarshallingAccessor(DataAccessor):
             serialized = self.field.serialize(obj, deserialized)
             getattr(obj, self.deserialized_accessor)[self.name] = deserialized
             getattr(obj, self.accessor)[self.name] = serialized
+            if self.dependents:
+                self.forget_dependents(obj)
         except Exception as e:
             from traceback import format_tb
 
@@ -178,6 +228,16 @@ class MarshallingAccessor(DataAccessor):
     def __delete__(self, obj):
         del getattr(obj, self.accessor)[self.name]
         del getattr(obj, self.deserialized_accessor)[self.name]
+        if self.dependents:
+            self.forget_dependents(obj)
+
+    def forget(self, obj):
+        """Removes the deserialized value, so the value is deserialized or, for
+        callbacks, computed again on next access.
+
+        .. versionadded:: 1.1.0
+        """
+        getattr(obj, self.deserialized_accessor).pop(self.name, None)
 
 
 class CallbackAccessor(MarshallingAccessor):
@@ -197,7 +257,7 @@ class CallbackAccessor(MarshallingAccessor):
     def __init__(self, name, field, accessor, deserialized_accessor, default=HOLDER):
         super().__init__(name, field, accessor, deserialized_accessor, default=default)
 
-    def __get__(self, obj, objtype):
+    def _get(self, obj):
         val = self.get_val(obj)
         if val is self.HOLDER:
             val = self.field.fullfill(obj)
@@ -206,14 +266,92 @@ class CallbackAccessor(MarshallingAccessor):
     def __set__(self, obj, val):
         getattr(obj, self.deserialized_accessor)[self.name] = val
         getattr(obj, self.accessor)[self.name] = self.field.serialize(obj, val)
+        if self.dependents:
+            self.forget_dependents(obj)
 
 
 class RelationshipAccessor(CallbackAccessor):
     """The descriptor for a :class:`pydent.marshaller.fields.Relationship`
-    field."""
+    field.
+
+    .. versionchanged:: 1.1.0
+        Nested data may be set lazily using `set_lazy`, in which case the
+        data is deserialized on first access. A function returning the value
+        may be set using `set_deferred`, in which case it is called on first
+        access.
+    """
+
+    #: instance attribute holding the functions set using `set_deferred`
+    DEFERRED_KEY = "__deferred_data"
+
+    @staticmethod
+    def is_raw(val) -> bool:
+        """Whether the value is nested data (a dict or a list of dicts) that
+        can be set lazily."""
+        cls = type(val)
+        return cls is dict or (cls is list and bool(val) and type(val[0]) is dict)
+
+    def set_lazy(self, obj, val):
+        """Sets the nested data without deserializing it. The data is
+        deserialized the first time the attribute is accessed.
+
+        .. versionadded:: 1.1.0
+        """
+        getattr(obj, self.accessor)[self.name] = val
+        getattr(obj, self.deserialized_accessor)[self.name] = Placeholders.LAZY
+        if self.dependents:
+            self.forget_dependents(obj)
+
+    def set_deferred(self, obj, func):
+        """Sets a function that returns the value of the attribute. The
+        function is called, and its result set, the first time the attribute
+        is accessed.
+
+        .. versionadded:: 1.1.0
+        """
+        obj.__dict__.setdefault(self.DEFERRED_KEY, {})[self.name] = func
+        getattr(obj, self.deserialized_accessor)[self.name] = Placeholders.LAZY
+        if self.dependents:
+            self.forget_dependents(obj)
+
+    def set_deserialized(self, obj, val):
+        """Sets an already deserialized value without serializing it, e.g. to
+        point an inverse relationship back to a loaded model.
+
+        .. versionadded:: 1.1.0
+        """
+        getattr(obj, self.deserialized_accessor)[self.name] = val
+        if self.dependents:
+            self.forget_dependents(obj)
+
+    def materialize(self, obj):
+        """Deserializes nested data set using `set_lazy`, or calls the
+        function set using `set_deferred`.
+
+        .. versionadded:: 1.1.0
+        """
+        deferred = obj.__dict__.get(self.DEFERRED_KEY, None)
+        if deferred and self.name in deferred:
+            func = deferred.pop(self.name)
+            if not deferred:
+                del obj.__dict__[self.DEFERRED_KEY]
+            self.__set__(obj, func())
+        else:
+            self.__set__(obj, getattr(obj, self.accessor)[self.name])
+
+    def _get(self, obj):
+        val = self.get_val(obj)
+        if val is Placeholders.LAZY:
+            self.materialize(obj)
+            val = self.get_val(obj)
+        if val is self.HOLDER:
+            val = self.field.fullfill(obj)
+        return val
 
     def __set__(self, obj, val):
         deserialized = self.field.deserialize(obj, val)
         serialized = self.field.serialize(obj, deserialized)
         getattr(obj, self.deserialized_accessor)[self.name] = deserialized
         getattr(obj, self.accessor)[self.name] = serialized
+        if self.dependents:
+            self.forget_dependents(obj)
@@ -142,6 +142,9 @@ class Field(FieldABC):
                     default=self.default,
                 ),
             )
+            schema = getattr(objtype, "_model_schema", None)
+            if schema is not None:
+                schema.invalidate()
 
     def __str__(self) -> str:
         return "<{cls} key='{objtype}.{key}' many={many} allow_none={allow_none}>".format(
@@ -192,16 +195,31 @@ class Nested(Field):
         if allow_none is None:
             allow_none = self._FIELD_ALLOW_NONE_DEFAULT
         super().__init__(many, data_key, allow_none)
+        self._model = None
+        self._models = None
+        self._models_version = None
 
     def get_model(self):
-        return ModelRegistry.get_model(self.nested)
+        """Returns the nested model class.
+
+        .. versionchanged:: 1.1.0
+            The model class is memoized until a model is registered or the
+            registry is replaced.
+        """
+        models = ModelRegistry.models
+        if self._models is not models or self._models_version != ModelRegistry.version:
+            self._model = ModelRegistry.get_model(self.nested)
+            self._models = models
+            self._models_version = ModelRegistry.version
+        return self._model
 
     def _deserialize(self, owner, data: dict):
         if data is None and self.allow_none:
             return None
-        elif self.lazy and isinstance(data, self.get_model()):
+        model = self.get_model()
+        if self.lazy and isinstance(data, model):
             return data
-        return self.get_model()._set_data(data, owner)
+        return model._set_data(data, owner)
 
     def _serialize(self, owner, obj):
         if obj is None and self.allow_none:
@@ -289,9 +307,9 @@ class Callback(Field):
     def get_callback_args(self, owner, extra_args: dict = None) -> List[Any]:
         """Processes the callback args."""
         args = []
-        callback_args = list(self.callback_args)
+        callback_args = self.callback_args
         if extra_args:
-            callback_args += list(extra_args)
+            callback_args += tuple(extra_args)
         try:
             for a in callback_args:
                 if a is self.SELF:
@@ -313,9 +331,9 @@ class Callback(Field):
     def get_callback_kwargs(self, owner, extra_kwargs: dict) -> dict:
         """Processes the callback kwargs."""
         kwargs = {}
-        callback_kwargs = dict(self.callback_kwargs)
+        callback_kwargs = self.callback_kwargs
         if extra_kwargs:
-            callback_kwargs.update(extra_kwargs)
+            callback_kwargs = dict(callback_kwargs, **extra_kwargs)
         try:
             for k, v in callback_kwargs.items():
                 if callable(v):
@@ -364,7 +382,7 @@ class Callback(Field):
         callback_kwargs = self.get_callback_kwargs(owner, extra_kwargs=extra_kwargs)
 
         try:
-            val = func(*tuple(callback_args), **callback_kwargs)
+            val = func(*callback_args, **callback_kwargs)
         except AttributeError as e:
             raise RunTimeCallbackAttributeError(
                 "There was an calling '{signature}' due to:\n{e}".format(
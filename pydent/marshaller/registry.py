@@ -1,19 +1,57 @@
 """Model and schema registry meta-classes."""
 from collections import defaultdict
+from collections.abc import Mapping
 from pprint import pformat
+from types import MappingProxyType
 
+from pydent.marshaller.descriptors import RelationshipAccessor
 from pydent.marshaller.exceptions import ModelRegistryError
 from pydent.marshaller.exceptions import SchemaRegistryError
 from pydent.utils.loggable import condense_long_lists
 from pydent.utils.logging_helpers import did_you_mean
 
 
+EMPTY_FIELDS = MappingProxyType({})
+
+
+class GroupedFields(Mapping):
+    """A read-only mapping of field class names to read-only mappings of
+    field names to fields. Missing field classes return an empty mapping.
+
+    .. versionadded:: 1.1.0
+    """
+
+    __slots__ = ["_groups"]
+
+    def __init__(self, groups: dict):
+        self._groups = {k: MappingProxyType(dict(v)) for k, v in groups.items()}
+
+    def __getitem__(self, key):
+        return self._groups.get(key, EMPTY_FIELDS)
+
+    def __contains__(self, key):
+        return key in self._groups
+
+    def __iter__(self):
+        return iter(self._groups)
+
+    def __len__(self):
+        return len(self._groups)
+
+    def get(self, key, default=None):
+        return self._groups.get(key, default)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, self._groups)
+
+
 class SchemaRegistry(type):
     """Stores a list of models that can be accessed by name."""
 
     schemas = {}  # the registry of Schemas instantiated
     _fields = None  # list of fields instantiated
     _model_class = None  # reference to model class the schema is attached to
+    _grouped_fields = None  # cached fields grouped by their base classes
     BASE = "DynamicSchema"
 
     def __init__(cls, name, bases, selfdict):
@@ -37,17 +75,23 @@ class SchemaRegistry(type):
         return cls._fields
 
     @property
-    def grouped_fields(cls):
+    def grouped_fields(cls) -> GroupedFields:
         """Fields grouped by their base classes.
 
         Returns empty list of base class not in fields.
+
+        .. versionchanged:: 1.1.0
+            Grouped fields are computed once per schema and returned as a
+            read-only mapping.
         """
-        grouped = defaultdict(dict)
-        for fname, field in cls.fields.items():
-            mro = field.__class__.__mro__
-            for b in mro[:-2]:
-                grouped[b.__name__][fname] = field
-        return grouped
+        if cls._grouped_fields is None:
+            grouped = defaultdict(dict)
+            for fname, field in cls.fields.items():
+                mro = field.__class__.__mro__
+                for b in mro[:-2]:
+                    grouped[b.__name__][fname] = field
+            cls._grouped_fields = GroupedFields(grouped)
+        return cls._grouped_fields
 
     @staticmethod
     def make_schema_name(name):
@@ -83,13 +127,18 @@ class ModelRegistry(type):
     _deserialized_key = (
         "__deserialized_data"  # the attribute key used to store serialized data
     )
+    #: the attribute key used to store functions returning deferred relationships
+    _deferred_key = RelationshipAccessor.DEFERRED_KEY
     BASE = "SchemaModel"
+    #: incremented each time a model is registered, invalidating memoized lookups
+    version = 0
 
     def __init__(cls, name, bases, selfdict):
         """Saves model to the registry."""
         super().__init__(name, bases, selfdict)
         if bases != () and bases[0].__name__ != ModelRegistry.BASE:
             ModelRegistry.models[name] = cls
+            ModelRegistry.version += 1
 
     @property
     def model_schema(cls):
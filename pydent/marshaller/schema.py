@@ -1,17 +1,155 @@
 """Model serialization/deserialization schema."""
 import inspect
+from typing import FrozenSet
+from typing import Tuple
 from typing import Type
+from typing import Union
 
 from pydent.marshaller.descriptors import DataAccessor
+from pydent.marshaller.descriptors import RelationshipAccessor
 from pydent.marshaller.exceptions import CallbackValidationError
 from pydent.marshaller.exceptions import MultipleValidationError
 from pydent.marshaller.exceptions import SchemaException
 from pydent.marshaller.fields import Callback
 from pydent.marshaller.fields import Field
 from pydent.marshaller.registry import SchemaRegistry
+from pydent.marshaller.utils import ATOMIC_TYPES
+from pydent.marshaller.utils import copy_data
 from pydent.marshaller.utils import make_signature_str
 
 
+class LoadPlan:
+    """A precompiled plan for setting data with a particular sequence of keys
+    on instances of a model class.
+
+    Each key is either ignored, written straight into the instance's
+    serialized data (for plain :class:`DataAccessor` attributes) or set
+    using the attribute's descriptor (e.g. for fields that need
+    deserialization). Nested data for relationships may be set lazily.
+
+    .. versionadded:: 1.1.0
+    """
+
+    __slots__ = ["keys", "steps", "ignored", "data_key"]
+
+    DIRECT = 1
+    DESCRIPTOR = 2
+    RELATIONSHIP = 3
+
+    def __init__(self, schema: Type["DynamicSchema"], keys: Tuple[str, ...]):
+        """Compiles the plan, adding data accessors for keys that do not yet
+        have an attribute on the model class.
+
+        :param schema: the model schema
+        :param keys: the data keys
+        """
+        model_class = schema.model_class
+        self.keys = keys
+        self.data_key = model_class._data_key
+        self.steps = []
+        self.ignored = []
+        for k in keys:
+            if k in schema.ignore:
+                self.ignored.append(k)
+                continue
+            if k not in model_class.__dict__:
+                setattr(model_class, k, DataAccessor(k, model_class._data_key))
+            descriptor = model_class.__dict__[k]
+            if (
+                type(descriptor) is DataAccessor
+                and descriptor.name == k
+                and descriptor.accessor == model_class._data_key
+                and not descriptor.dependents
+            ):
+                self.steps.append((k, self.DIRECT, descriptor))
+            elif isinstance(descriptor, RelationshipAccessor):
+                self.steps.append((k, self.RELATIONSHIP, descriptor))
+            else:
+                self.steps.append((k, self.DESCRIPTOR, descriptor))
+
+    def apply(self, instance, data: dict, lazy: bool = False):
+        """Sets the data on the instance.
+
+        :param instance: the model instance
+        :param data: the data
+        :param lazy: if True, nested relationship data is deserialized on
+            first access instead of immediately
+        :return: None
+        """
+        for k in self.ignored:
+            data.pop(k, None)
+        serialized = getattr(instance, self.data_key)
+        for k, step, descriptor in self.steps:
+            if step is self.DIRECT:
+                serialized[k] = data[k]
+            elif step is self.RELATIONSHIP and lazy and descriptor.is_raw(data[k]):
+                descriptor.set_lazy(instance, data[k])
+            else:
+                setattr(instance, k, data[k])
+
+
+class DumpPlan:
+    """A precompiled selection of keys used to dump instances of a model class
+    with a particular set of top-level `only`, `include` and `ignore` keys.
+
+    .. versionadded:: 1.1.0
+    """
+
+    __slots__ = ["access", "only", "excluded", "callbacks"]
+
+    def __init__(
+        self,
+        schema: Type["DynamicSchema"],
+        only: FrozenSet[str],
+        include: FrozenSet[str],
+        ignore: FrozenSet[str],
+    ):
+        """Compiles the plan.
+
+        :param schema: the model schema
+        :param only: the top-level `only` keys
+        :param include: the top-level `include` keys
+        :param ignore: the top-level `ignore` keys
+        """
+        callback_fields = set()
+        always_dump = set()
+        for fname, field in schema.fields.items():
+            if hasattr(field, "nested") or issubclass(type(field), Callback):
+                callback_fields.add(fname)
+            if getattr(field, "always_dump", None):
+                always_dump.add(fname)
+
+        #: attributes to access before dumping, e.g. to fullfill callbacks
+        self.access = tuple(include.union(only))
+        self.only = only or None
+        self.excluded = frozenset(ignore.union(callback_fields))
+
+        callbacks = []
+        for fname in include.union(only, always_dump):
+            if fname in callback_fields and fname not in ignore:
+                field = schema.fields[fname]
+                many = bool(getattr(field, "nested", None) and field.many)
+                callbacks.append((fname, field.data_key, many))
+        #: tuple of (name, data_key, many) of callback fields to dump
+        self.callbacks = tuple(callbacks)
+
+    def select(self, serialized_data: dict) -> dict:
+        """Returns a copy of the serialized data to dump."""
+        excluded = self.excluded
+        only = self.only
+        if only is None:
+            return {
+                k: v if type(v) in ATOMIC_TYPES else copy_data(v)
+                for k, v in serialized_data.items()
+                if k not in excluded
+            }
+        return {
+            k: v if type(v) in ATOMIC_TYPES else copy_data(v)
+            for k, v in serialized_data.items()
+            if k in only and k not in excluded
+        }
+
+
 class DynamicSchema(metaclass=SchemaRegistry):
     """A dynamically added schema.
 
@@ -20,6 +158,11 @@ class DynamicSchema(metaclass=SchemaRegistry):
 
     ignore = ()
     fields = dict()
+    MAX_LOAD_PLANS = 256  #: maximum number of load plans cached per schema
+    MAX_DUMP_PLANS = 256  #: maximum number of dump plans cached per schema
+    _load_plans = None
+    _dump_plans = None
+    _relationships = None  #: cached relationships of the model class
 
     @classmethod
     def _get_model_fields(cls):
@@ -34,21 +177,71 @@ class DynamicSchema(metaclass=SchemaRegistry):
         """
         for field_name, field in cls._get_model_fields().items():
             field.register(field_name, cls.model_class)
+        for field_name, field in cls._get_model_fields().items():
+            cls.init_dependencies(field_name, field)
 
     @classmethod
-    def init_data_accessors(cls, instance, data, add_extra=True):
+    def init_dependencies(cls, name: str, field: Field):
+        """Adds the descriptor of a cached field to the `dependents` of the
+        descriptors of the attributes listed in its `depends_on`, so its
+        memoized value is forgotten when one of them is set. A
+        :class:`DataAccessor` is added for attributes that have no
+        descriptor yet. Only the top level names of `depends_on` are used.
+
+        .. versionadded:: 1.1.0
+
+        :param name: the name of the field
+        :param field: the field
+        :return: None
+        :raises SchemaException: if an attribute is not a data accessor
+        """
+        depends_on = getattr(field, "depends_on", ())
+        if not depends_on or not getattr(field, "cache", False):
+            return
+        model_class = cls.model_class
+        descriptor = model_class.__dict__[name]
+        for key in depends_on:
+            if key not in model_class.__dict__:
+                if hasattr(model_class, key):
+                    raise SchemaException(
+                        "Field '{}' of '{}' cannot depend on inherited attribute '{}'".format(
+                            name, model_class.__name__, key
+                        )
+                    )
+                setattr(model_class, key, DataAccessor(key, model_class._data_key))
+            dependency = model_class.__dict__[key]
+            if not isinstance(dependency, DataAccessor):
+                raise SchemaException(
+                    "Field '{}' of '{}' cannot depend on '{}' because it is not a "
+                    "data accessor".format(name, model_class.__name__, key)
+                )
+            if descriptor not in dependency.dependents:
+                dependency.dependents += (descriptor,)
+
+    @classmethod
+    def init_data_accessors(cls, instance, data, add_extra=True, lazy=False):
         """Initializes data accessors.
 
+        .. versionchanged:: 1.1.0
+            Added `lazy` parameter.
+
         :param instance:
         :type instance:
         :param data:
         :type data:
         :param add_extra:
+        :param lazy: if True, nested relationship data is deserialized on
+            first access instead of immediately
         :return:
         :rtype:
         """
         if cls.model_class is not instance.__class__:
             raise SchemaException("Instance and model class are different")
+        if add_extra:
+            plan = cls.load_plan(data)
+            if plan is not None:
+                plan.apply(instance, data, lazy=lazy)
+                return
         for k, v in dict(data).items():
             if k in cls.ignore:
                 data.pop(k, None)
@@ -63,11 +256,92 @@ class DynamicSchema(metaclass=SchemaRegistry):
                 )
             if k not in cls.model_class.__dict__:
                 setattr(cls.model_class, k, DataAccessor(k, cls.model_class._data_key))
+            descriptor = cls.model_class.__dict__[k]
+            if (
+                lazy
+                and isinstance(descriptor, RelationshipAccessor)
+                and descriptor.is_raw(v)
+            ):
+                descriptor.set_lazy(instance, v)
+                continue
             try:
                 setattr(instance, k, v)
             except AttributeError as e:
                 raise e
 
+    @classmethod
+    def load_plan(cls, data: dict) -> Union[LoadPlan, None]:
+        """Returns the cached :class:`LoadPlan` for the keys of the data,
+        compiling it on first use. Returns None if the data is not a dict or
+        too many plans are already cached for the schema.
+
+        .. versionadded:: 1.1.0
+
+        :param data: the data to load
+        :return: the load plan or None
+        """
+        if type(data) is not dict:
+            return None
+        keys = tuple(data)
+        plan = cls._load_plans.get(keys, None)
+        if plan is None:
+            if len(cls._load_plans) >= cls.MAX_LOAD_PLANS:
+                return None
+            plan = LoadPlan(cls, keys)
+            cls._load_plans[keys] = plan
+        return plan
+
+    @classmethod
+    def dump_plan(
+        cls, only: FrozenSet[str], include: FrozenSet[str], ignore: FrozenSet[str]
+    ) -> DumpPlan:
+        """Returns the cached :class:`DumpPlan` for the top-level dump keys,
+        compiling it on first use.
+
+        .. versionadded:: 1.1.0
+
+        :param only: the top-level `only` keys
+        :param include: the top-level `include` keys
+        :param ignore: the top-level `ignore` keys
+        :return: the dump plan
+        """
+        key = (only, include, ignore)
+        plan = cls._dump_plans.get(key, None)
+        if plan is None:
+            plan = DumpPlan(cls, only, include, ignore)
+            if len(cls._dump_plans) < cls.MAX_DUMP_PLANS:
+                cls._dump_plans[key] = plan
+        return plan
+
+    @classmethod
+    def invalidate(cls):
+        """Clears cached load and dump plans, grouped fields and
+        relationships. Called when fields are registered to the model class.
+
+        .. versionadded:: 1.1.0
+        """
+        cls._load_plans = {}
+        cls._dump_plans = {}
+        cls._grouped_fields = None
+        cls._relationships = None
+
+    @classmethod
+    def add_field(cls, name: str, field: Field):
+        """Adds a field to the schema and its model class.
+
+        .. versionadded:: 1.1.0
+
+        :param name: the name of the field
+        :param field: the field
+        :return: None
+        """
+        if field.data_key is None:
+            field.data_key = name
+        cls._fields[name] = field
+        field.register(name, cls.model_class)
+        cls.init_dependencies(name, field)
+        cls.invalidate()
+
     @classmethod
     def validate_callbacks(cls):
         """Validates expected callback signature found in any callback in the
@@ -171,6 +445,7 @@ class DynamicSchema(metaclass=SchemaRegistry):
         :rtype: None
         """
         setattr(model_class, "_model_schema", cls)
+        cls.invalidate()
 
         schema_fields = {}
         ignored_fields = {}
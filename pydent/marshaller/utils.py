@@ -1,5 +1,32 @@
+from copy import deepcopy
+
+
 def make_signature_str(_args, _kwargs):
     return "({}, {})".format(
         ", ".join([str(_a) for _a in _args]),
         ", ".join(["{}={}".format(name, val) for name, val in _kwargs.items()]),
     )
+
+
+ATOMIC_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def copy_data(value):
+    """Copies json-like data, creating new dicts and lists. Values of any
+    other type are deep-copied.
+
+    .. versionadded:: 1.1.0
+
+    :param value: the value to copy
+    :return: the copied value
+    """
+    cls = type(value)
+    if cls in ATOMIC_TYPES:
+        return value
+    elif cls is dict:
+        return {
+            k: v if type(v) in ATOMIC_TYPES else copy_data(v) for k, v in value.items()
+        }
+    elif cls is list:
+        return [v if type(v) in ATOMIC_TYPES else copy_data(v) for v in value]
+    return deepcopy(value)
@@ -192,6 +192,7 @@ information from the Aquarium server if necesssary.
     HasOneFromMany
     JSON
     Many
+    MemoizedFunction
     One
     Raw
 
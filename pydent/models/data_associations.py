@@ -258,10 +258,8 @@ class Upload(ModelBase):
         return http.get("krill/uploads?job={}".format(self.job_id))["uploads"]
 
     def temp_url(self):
-        data = self.session.Upload.where({"id": self.id}, methods=["expiring_url"])[
-            0
-        ].raw
-        return data["expiring_url"]
+        upload = self.session.Upload.where({"id": self.id}, methods=["expiring_url"])[0]
+        return upload.expiring_url
 
     @staticmethod
     def _download_file_from_url(url, outpath):
@@ -69,12 +69,14 @@ class FieldType(FieldMixin, ModelBase):
     """A FieldType model."""
 
     fields = dict(
-        allowable_field_types=HasMany("AllowableFieldType", "FieldType"),
+        allowable_field_types=HasMany(
+            "AllowableFieldType", "FieldType", inverse="field_type"
+        ),
         operation_type=HasOne(
             "OperationType", callback="find_field_parent", ref="parent_id"
         ),
         sample_type=HasOne("SampleType", callback="find_field_parent", ref="parent_id"),
-        field_values=HasMany("FieldValue", "FieldType"),
+        field_values=HasMany("FieldValue", "FieldType", inverse="field_type"),
     )
 
     def __init__(
@@ -199,12 +201,14 @@ class FieldValue(FieldMixin, JSONSaveMixin, JSONDeleteMixin, ModelBase):
         object_type=HasOne("ObjectType"),
         operation=HasOne("Operation", callback="find_field_parent", ref="parent_id"),
         parent_sample=HasOne("Sample", callback="find_field_parent", ref="parent_id"),
-        sid=Function("get_sid"),
+        sid=Function("get_sid", depends_on="sample"),
         child_sample_name=Function(
-            lambda fv: fv.sid, callback_args=(fields.Callback.SELF,)
+            lambda fv: fv.sid,
+            callback_args=(fields.Callback.SELF,),
+            depends_on="sample",
         ),
-        wires_as_source=HasMany("Wire", ref="from_id"),
-        wires_as_dest=HasMany("Wire", ref="to_id"),
+        wires_as_source=HasMany("Wire", ref="from_id", inverse="source"),
+        wires_as_dest=HasMany("Wire", ref="to_id", inverse="destination"),
         # allowable_child_types=Function('get_allowable_child_types'),
     )
 
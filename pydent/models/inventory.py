@@ -30,7 +30,10 @@ from pydent.utils.matrix_mapper import MatrixMappingFactory
 class ObjectType(SaveMixin, ModelBase):
     """A ObjectType model that represents the type of container an item is."""
 
-    fields = dict(items=HasMany("Item", "ObjectType"), sample_type=HasOne("SampleType"))
+    fields = dict(
+        items=HasMany("Item", "ObjectType", inverse="object_type"),
+        sample_type=HasOne("SampleType"),
+    )
 
     def __str__(self):
         return self._to_str("id", "name")
@@ -121,7 +124,7 @@ class Item(DataAssociatorMixin, ItemLocationMixin, ModelBase):
         data=Raw(),
         ignore=("locator_id",),
         part_associations=HasMany(
-            "PartAssociation", ref="part_id"
+            "PartAssociation", ref="part_id", inverse="part"
         ),  # TODO: add to change log
         collections=HasManyThrough(
             "Collection", "PartAssociation"
@@ -256,7 +259,9 @@ class Collection(
         data_associations=HasManyGeneric(
             "DataAssociation", additional_args={"parent_class": "Collection"}
         ),
-        part_associations=HasMany("PartAssociation", "Collection"),
+        part_associations=HasMany(
+            "PartAssociation", "Collection", inverse="collection"
+        ),
         parts=HasManyThrough("Item", "PartAssociation", ref="part_id"),
     )
     query_hook = {"methods": ["dimensions"]}
@@ -12,7 +12,7 @@ class Job(ModelBase):
     """A Job model."""
 
     fields = dict(
-        job_associations=HasMany("JobAssociation", "Job"),
+        job_associations=HasMany("JobAssociation", "Job", inverse="job"),
         operations=HasManyThrough("Operation", "JobAssociation"),
         state=JSON(),
     )
@@ -22,18 +22,27 @@ class Operation(FieldValueInterface, DataAssociatorMixin, ModelBase):
 
     fields = dict(
         field_values=HasMany(
-            "FieldValue", ref="parent_id", additional_args={"parent_class": "Operation"}
+            "FieldValue",
+            ref="parent_id",
+            additional_args={"parent_class": "Operation"},
+            inverse="operation",
         ),
         data_associations=HasManyGeneric(
             "DataAssociation", additional_args={"parent_class": "Operation"}
         ),
         operation_type=HasOne("OperationType"),
-        job_associations=HasMany("JobAssociation", "Operation"),
+        job_associations=HasMany("JobAssociation", "Operation", inverse="operation"),
         jobs=HasManyThrough("Job", "JobAssociation"),
-        plan_associations=HasMany("PlanAssociation", "Operation"),
+        plan_associations=HasMany("PlanAssociation", "Operation", inverse="operation"),
         plans=HasManyThrough("Plan", "PlanAssociation"),
         status=Raw(default="planning"),
-        routing=Function("get_routing"),
+        routing=Function(
+            "get_routing",
+            depends_on={
+                "field_values": ["sample", "field_type"],
+                "operation_type": "field_types",
+            },
+        ),
         user=HasOne("User"),
     )
 
@@ -303,11 +312,12 @@ class OperationType(FieldTypeInterface, SaveMixin, ModelBase):
     Aquarium."""
 
     fields = dict(
-        operations=HasMany("Operation", "OperationType"),
+        operations=HasMany("Operation", "OperationType", inverse="operation_type"),
         field_types=HasMany(
             "FieldType",
             ref="parent_id",
             additional_args={"parent_class": "OperationType"},
+            inverse="operation_type",
         ),
         codes=HasManyGeneric("Code"),
         cost_model=HasOneFromMany(
@@ -27,7 +27,7 @@ class Plan(DataAssociatorMixin, SaveMixin, DeleteMixin, ModelBase):
         data_associations=HasManyGeneric(
             "DataAssociation", additional_args={"parent_class": "Plan"}
         ),
-        plan_associations=HasMany("PlanAssociation", "Plan"),
+        plan_associations=HasMany("PlanAssociation", "Plan", inverse="plan"),
         operations=HasManyThrough("Operation", "PlanAssociation"),
         wires=Many("Wire", callback="_get_wires_from_server"),
         layout=JSON(),
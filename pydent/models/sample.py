@@ -22,9 +22,12 @@ class Sample(FieldValueInterface, ModelBase):
     fields = dict(
         # sample relationships
         sample_type=HasOne("SampleType"),
-        items=HasMany("Item", ref="sample_id"),
+        items=HasMany("Item", ref="sample_id", inverse="sample"),
         field_values=HasMany(
-            "FieldValue", ref="parent_id", additional_args={"parent_class": "Sample"}
+            "FieldValue",
+            ref="parent_id",
+            additional_args={"parent_class": "Sample"},
+            inverse="parent_sample",
         ),
         user=HasOne("User"),
     )
@@ -257,9 +260,12 @@ class SampleType(FieldTypeInterface, JSONSaveMixin, ModelBase):
     """A SampleType model."""
 
     fields = dict(
-        samples=HasMany("Sample", "SampleType"),
+        samples=HasMany("Sample", "SampleType", inverse="sample_type"),
         field_types=HasMany(
-            "FieldType", ref="parent_id", additional_args={"parent_class": "SampleType"}
+            "FieldType",
+            ref="parent_id",
+            additional_args={"parent_class": "SampleType"},
+            inverse="sample_type",
         ),
         # TODO: operation_type_afts
         # TODO: property_afts
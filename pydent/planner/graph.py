@@ -55,38 +55,22 @@ class PlannerGraph:
             for fv in op.field_values:
                 fv_to_op_dict[fv.rid] = op
 
+        # workers only collect edges; the graph is built on this thread
         @make_async(10, progress_bar=False)
-        def add_wires(wires):
-            if not wires:
-                return
-            missing_operations = []
+        def get_edges(wires):
+            edges = []
             for wire in wires:
-                # TODO:
-                try:
-                    from_id = _id_getter(fv_to_op_dict[wire.source.rid])
-                    to_id = _id_getter(fv_to_op_dict[wire.destination.rid])
-                except KeyError as e:
-                    pass
-                    raise e
+                from_id = _id_getter(fv_to_op_dict[wire.source.rid])
+                to_id = _id_getter(fv_to_op_dict[wire.destination.rid])
                 if from_id is not None and to_id is not None:
-                    if from_id not in G:
-                        missing_operations.append(from_id)
-                    if to_id not in G:
-                        missing_operations.append(to_id)
-                    if from_id in G and to_id in G:
-                        G.add_edge(from_id, to_id, wire=wire)
-            return wires
+                    edges.append((from_id, to_id, wire))
+            return edges
 
-        @make_async(10, progress_bar=False)
-        def add_ops(ops: Iterable[Operation]):
-            if not ops:
-                return
-            for op in ops:
-                planner_graph._add_operation(op)
-            return ops
-
-        add_ops(plan.operations)
-        add_wires(plan.wires)
+        for op in plan.operations:
+            planner_graph._add_operation(op)
+        for from_id, to_id, wire in get_edges(plan.wires or []):
+            if from_id in G and to_id in G:
+                G.add_edge(from_id, to_id, wire=wire)
 
         # fix operation coordinates if None
         for op in planner_graph.operations:
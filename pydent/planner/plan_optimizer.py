@@ -1,4 +1,3 @@
-import json
 from collections import OrderedDict
 from hashlib import sha1
 from typing import List
@@ -8,6 +7,7 @@ import networkx as nx
 from pydent.exceptions import PlannerException
 from pydent.models import Operation
 from pydent.utils import Loggable
+from pydent.utils import json_codec
 from pydent.utils import logger
 
 # TODO: make this independent of planner
@@ -69,7 +69,7 @@ class PlanOptimizer:
                 fvhash["item"]["row"] = fv.row
                 fvhash["item"]["column"] = fv.column
 
-        return json.dumps(fvhash, indent=2)
+        return json_codec.dumps(fvhash)
 
     def _fv_array_to_hash(self, fv_array, ft, sort=True, sep="*"):
         arr = [self._fv_to_hash(fv, ft) for fv in fv_array]
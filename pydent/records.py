@@ -0,0 +1,272 @@
+"""
+Frozen records (:mod:`pydent.records`)
+======================================
+
+.. currentmodule:: pydent.records
+
+Compact, read-only records of server data, returned by
+``session.<Model>.where(query, frozen=True)``. Records hold the data of a
+model in ``__slots__`` and have none of the accessor machinery of
+:class:`ModelBase <pydent.base.ModelBase>` instances, so they are much
+cheaper to keep in memory for large read-only loads. Relationships that
+were not included in the query are resolved using the session's
+:class:`Browser <pydent.browser.Browser>`, which returns models.
+
+.. versionadded:: 1.1.0
+
+.. autosummary::
+    :toctree: generated/
+
+    FrozenRecord
+    RecordRelationship
+    record_class
+    load_records
+"""
+import threading
+from types import MappingProxyType
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from pydent.exceptions import TridentBaseException
+from pydent.marshaller import fields
+from pydent.marshaller import ModelRegistry
+from pydent.marshaller import SchemaModel
+
+
+class FrozenRecordError(TridentBaseException, AttributeError):
+    """Raised when modifying a frozen record or accessing a relationship that
+    cannot be resolved for a record."""
+
+
+class RecordRelationship:
+    """Descriptor for a relationship of a :class:`FrozenRecord`.
+
+    Returns the included records, if the relationship was included in
+    the query, or resolves the relationship using the session's browser.
+    """
+
+    __slots__ = ["name", "field", "index"]
+
+    def __init__(self, name: str, field: fields.Relationship, index: int = None):
+        self.name = name
+        self.field = field
+        self.index = index  #: position of the included data in the record
+
+    def __get__(self, record, objtype):
+        if record is None:
+            return self
+        if self.index is not None:
+            included = record._included[self.index]
+            if included is not None:
+                return included
+        return self.resolve(record)
+
+    def resolve(self, record: "FrozenRecord"):
+        """Resolves the relationship using the record's session browser."""
+        field = self.field
+        try:
+            args = field.get_callback_args(record)
+            kwargs = field.get_callback_kwargs(record, None)
+        except fields.RunTimeCallbackAttributeError:
+            return None
+        nested, args = args[0], args[1:]
+        browser = record._session.browser
+        if field.callback == "find_callback":
+            if args[0] is None:
+                return None
+            return browser.find(args[0], model_class=nested)
+        elif field.callback == "where_callback":
+            query = args[0]
+            if not isinstance(query, dict) or None in query.values():
+                return None
+            return browser.where(query, model_class=nested, **kwargs)
+        elif field.callback == "one_callback":
+            return browser.one(model_class=nested, query=args[0])
+        raise FrozenRecordError(
+            "Relationship '{}.{}' cannot be resolved for a frozen record.".format(
+                record.model_class.__name__, self.name
+            )
+        )
+
+
+class FrozenRecord:
+    """Base class for frozen records.
+
+    Record classes are generated per model class and set of data keys
+    using :func:`record_class`.
+    """
+
+    __slots__ = ["_session", "_included"]
+
+    model_class = None  #: the model class of the record
+    _fields = ()  #: the data keys stored by the record
+    _relationships = MappingProxyType({})  #: relationships of the model class
+    _data_fields = MappingProxyType({})  #: fields that deserialize data keys
+
+    def __init__(self, *args, **kwargs):
+        raise TypeError(
+            "{} cannot be initialized directly. Use 'from_data'.".format(
+                self.__class__.__name__
+            )
+        )
+
+    @classmethod
+    def from_data(cls, data: dict, session) -> "FrozenRecord":
+        """Creates a record from server data.
+
+        :param data: the data of a single model
+        :param session: the session
+        :return: the record
+        """
+        record = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(record, "_session", session)
+        included = []
+        for k, v in data.items():
+            relationship = cls._relationships.get(k, None)
+            if relationship is None:
+                field = cls._data_fields.get(k, None)
+                if field is not None:
+                    v = field.deserialize(record, v)
+                setattr_(record, k, v)
+            else:
+                if v is not None:
+                    v = load_records(
+                        ModelRegistry.get_model(relationship.field.nested), v, session
+                    )
+                included.append(v)
+        setattr_(record, "_included", tuple(included))
+        return record
+
+    def __setattr__(self, name, value):
+        raise FrozenRecordError(
+            "Cannot set '{}' on frozen record {}".format(name, self.__class__.__name__)
+        )
+
+    def __delattr__(self, name):
+        raise FrozenRecordError(
+            "Cannot delete '{}' on frozen record {}".format(
+                name, self.__class__.__name__
+            )
+        )
+
+    @property
+    def session(self):
+        return self._session
+
+    def _asdict(self) -> Dict:
+        """Returns the record data as a new dictionary."""
+        return {k: getattr(self, k) for k in self._fields}
+
+    def _values(self) -> Tuple:
+        return tuple(getattr(self, k) for k in self._fields)
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenRecord):
+            return NotImplemented
+        return (
+            self.model_class is other.model_class
+            and self._fields == other._fields
+            and self._values() == other._values()
+        )
+
+    def __hash__(self):
+        return hash((self.model_class, getattr(self, "id", None)))
+
+    def __repr__(self):
+        return "<{}({})>".format(
+            self.__class__.__name__,
+            ", ".join("{}={!r}".format(k, getattr(self, k)) for k in self._fields),
+        )
+
+
+MAX_RECORD_CLASSES = 256  #: maximum number of record classes cached per model class
+_record_classes = {}  #: model class to record classes by data keys
+_record_classes_lock = threading.Lock()
+
+
+def record_class(
+    model_class: Type[SchemaModel], keys: Tuple[str, ...]
+) -> Type[FrozenRecord]:
+    """Returns the record class for the model class and data keys. Data keys
+    are stored in ``__slots__``, relationship keys are exposed using
+    :class:`RecordRelationship` descriptors.
+
+    Up to :data:`MAX_RECORD_CLASSES` record classes are cached per model
+    class. Once the cache is full, new record classes are not cached.
+
+    :param model_class: the model class
+    :param keys: the data keys
+    :return: the record class
+    """
+    cls = _record_classes.get(model_class, {}).get(keys, None)
+    if cls is not None:
+        return cls
+    with _record_classes_lock:
+        classes = _record_classes.setdefault(model_class, {})
+        cls = classes.get(keys, None)
+        if cls is None:
+            relationships = {
+                name: field
+                for name, field in model_class.get_relationships().items()
+                if isinstance(field, fields.Relationship)
+            }
+            slots = [k for k in keys if k not in relationships]
+            included = [k for k in keys if k in relationships]
+            relationships = {
+                name: RecordRelationship(
+                    name, field, included.index(name) if name in included else None
+                )
+                for name, field in relationships.items()
+            }
+            data_fields = {
+                k: model_class.fields[k]
+                for k in slots
+                if not isinstance(
+                    model_class.fields.get(k, None), (type(None), fields.Callback)
+                )
+            }
+            namespace = dict(relationships)
+            namespace.update(
+                {
+                    "__slots__": slots,
+                    "model_class": model_class,
+                    "_fields": tuple(slots),
+                    "_relationships": MappingProxyType(relationships),
+                    "_data_fields": MappingProxyType(data_fields),
+                    "__module__": __name__,
+                }
+            )
+            cls = type(
+                "{}Record".format(model_class.__name__), (FrozenRecord,), namespace
+            )
+            if len(classes) < MAX_RECORD_CLASSES:
+                classes[keys] = cls
+    return cls
+
+
+def load_records(
+    model_class: Type[SchemaModel], data: Union[dict, List[dict]], session
+) -> Union[FrozenRecord, List[FrozenRecord]]:
+    """Creates frozen records from server data.
+
+    :param model_class: the model class of the data
+    :param data: the data of a single model or a list of data
+    :param session: the session
+    :return: a record or list of records
+    """
+    if isinstance(data, list):
+        records = []
+        cls = None
+        last_keys = None
+        for d in data:
+            keys = tuple(d)
+            if keys != last_keys:
+                cls = record_class(model_class, keys)
+                last_keys = keys
+            records.append(cls.from_data(d, session))
+        return records
+    return record_class(model_class, tuple(data)).from_data(data, session)
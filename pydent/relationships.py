@@ -10,14 +10,17 @@ Relationships (:mod:`pydent.relationships`)
     BaseRelationship
     BaseRelationshipAccessor
     Function
+    MemoizedFunction
 """
-import json
 
 import inflection
 
 from pydent.base import ModelBase
 from pydent.marshaller import fields
+from pydent.marshaller.descriptors import Placeholders
 from pydent.marshaller.exceptions import ModelValidationError
+from pydent.marshaller.registry import ModelRegistry
+from pydent.utils import json_codec
 
 
 class FieldValidationError(ModelValidationError):
@@ -39,10 +42,10 @@ class JSON(Raw):
     def _deserialize(self, owner, data):
         if isinstance(data, dict):
             return data
-        return json.loads(data)
+        return json_codec.loads(data)
 
     def _serialize(self, owner, data):
-        return json.dumps(data)
+        return json_codec.dumps(data)
 
 
 class Function(fields.Callback):
@@ -50,6 +53,21 @@ class Function(fields.Callback):
 
     Similar to the @property decorator in python, but will search and
     find an instance method using the method name.
+
+    .. versionchanged:: 1.1.0
+        Added `depends_on`, the relations the function reads. The
+        :class:`Browser <pydent.browser.Browser>` retrieves them in batches
+        before evaluating the function for many models.
+
+    .. code-block:: python
+
+        class Operation(ModelBase):
+            fields = dict(
+                routing=Function(
+                    "get_routing",
+                    depends_on={"field_values": ["sample", "field_type"]},
+                )
+            )
     """
 
     def __init__(
@@ -62,7 +80,18 @@ class Function(fields.Callback):
         many=None,
         allow_none=True,
         always_dump=True,
+        depends_on=None,
     ):
+        """Function initializer.
+
+        :param callback: name of the callback function or a callable
+        :param callback_args: a tuple of arguments to use in the callback
+        :param callback_kwargs: a dictionary of kwargs to use in the callback
+        :param depends_on: relation spec (a name, a list of names or a dict, as
+            in :meth:`Browser.recursive_retrieve
+            <pydent.browser.Browser.recursive_retrieve>`) of the relations the
+            function reads
+        """
         super().__init__(
             callback,
             callback_args,
@@ -73,6 +102,63 @@ class Function(fields.Callback):
             allow_none,
             always_dump,
         )
+        if isinstance(depends_on, str):
+            depends_on = (depends_on,)
+        self.depends_on = depends_on or ()
+
+
+class MemoizedFunction(Function):
+    """A :class:`Function` whose value is memoized on the instance until one
+    of the data keys or relationships it depends on is set or deleted.
+
+    .. code-block:: python
+
+        class FieldValue(ModelBase):
+            fields = dict(
+                sid=MemoizedFunction(
+                    "get_sid", depends_on=("sample", "child_sample_id")
+                ),
+            )
+
+    Only the top level names of `depends_on` are tracked. Changes made
+    within a dependency (e.g. renaming the sample above) are not tracked.
+
+    .. versionadded:: 1.1.0
+    """
+
+    def __init__(
+        self,
+        callback,
+        depends_on,
+        callback_args=None,
+        callback_kwargs=None,
+        data_key=None,
+        many=None,
+        allow_none=True,
+        always_dump=True,
+    ):
+        """Memoized function initializer.
+
+        :param callback: name of the callback function or a callable
+        :param depends_on: names of the data keys and relationships the
+            function depends on, or a relation spec as in :class:`Function`
+        :param callback_args: a tuple of arguments to use in the callback
+        :param callback_kwargs: a dictionary of kwargs to use in the callback
+        """
+        super().__init__(
+            callback,
+            callback_args,
+            callback_kwargs,
+            True,
+            data_key,
+            many,
+            allow_none,
+            always_dump,
+            depends_on=depends_on,
+        )
+
+    def cache_result(self, owner, val):
+        getattr(owner, ModelRegistry._deserialized_key)[self.data_key] = val
 
 
 class BaseRelationshipAccessor(fields.RelationshipAccessor):
@@ -81,6 +167,15 @@ class BaseRelationshipAccessor(fields.RelationshipAccessor):
 
     HOLDER = None
 
+    def __get__(self, obj, objtype):
+        try:
+            val = obj.__dict__[self.deserialized_accessor][self.name]
+        except (AttributeError, KeyError):
+            return self._get(obj)
+        if val is None or val.__class__ is Placeholders:
+            return self._get(obj)
+        return val
+
 
 class BaseRelationship(fields.Relationship):
     """Base class for relationships.
@@ -88,6 +183,29 @@ class BaseRelationship(fields.Relationship):
     By default, if the value is None, attempt a callback. If that fails,
     fallback to None. If successful, deserialize data to the nested
     model.
+
+    .. versionchanged:: 1.1.0
+        Relationships may declare an `inverse`, the name of the
+        relationship on the nested models that points back to the owner.
+        Deserialized models get their inverse relationship set to the
+        owner, so accessing it does not need a callback.
+
+        .. code-block:: python
+
+            @add_schema
+            class Author(ModelBase):
+                fields = dict(books=HasMany("Book", "Author", inverse="author"))
+
+            @add_schema
+            class Book(ModelBase):
+                fields = dict(author=HasOne("Author"))
+
+        The inverse is only set on models whose inverse relationship is not
+        yet deserialized and only if the nested model's reference matches the
+        owner (e.g. `book.author_id == author.id`). Inverse relationships that
+        return many models are never set, since a single owner is not
+        necessarily all of them (e.g. an operation may belong to several
+        plans).
     """
 
     QUERY_TYPE = None
@@ -103,6 +221,7 @@ class BaseRelationship(fields.Relationship):
         callback_kwargs=None,
         many=None,
         allow_none=True,
+        inverse=None,
     ):
         if (ref is None and attr is not None) or (attr is None and ref is not None):
             raise ModelValidationError(
@@ -113,6 +232,7 @@ class BaseRelationship(fields.Relationship):
             ref, att = self._get_ref_attr(nested=nested, ref=ref, attr=attr)
         self.attr = attr
         self.ref = ref
+        self.inverse = inverse
         super().__init__(
             nested,
             callback,
@@ -167,6 +287,20 @@ class BaseRelationship(fields.Relationship):
         return ref, attr
 
     def fullfill(self, owner, cache=None, extra_args=None, extra_kwargs=None):
+        """Fullfills the relationship using the callback.
+
+        .. versionchanged:: 1.1.0
+            If the owner's model class is being prefetched by its session's
+            browser, waits for the prefetch and returns the relationship if
+            the prefetch deserialized it.
+        """
+        browser = getattr(owner.session, "browser", None)
+        if (
+            browser is not None
+            and browser.wait_for_prefetch(owner.__class__.__name__)
+            and owner.is_deserialized(self.data_key)
+        ):
+            return getattr(owner, self.data_key)
         try:
             return super().fullfill(
                 owner, cache, extra_args=extra_args, extra_kwargs=extra_kwargs
@@ -174,6 +308,49 @@ class BaseRelationship(fields.Relationship):
         except fields.RunTimeCallbackAttributeError:
             return BaseRelationshipAccessor.HOLDER
 
+    def deserialize(self, owner, val):
+        val = super().deserialize(owner, val)
+        if self.inverse is not None and val is not None:
+            self.set_inverse(owner, val)
+        return val
+
+    def set_inverse(self, owner, val):
+        """Sets the `inverse` relationship of the deserialized models to the
+        owner. Models whose inverse relationship is already set, returns many
+        models, or whose reference does not match the owner are skipped.
+
+        .. versionadded:: 1.1.0
+
+        :param owner: the owner of this relationship
+        :param val: the deserialized model or models
+        :return: None
+        :raises FieldValidationError: if a nested model has no relationship
+            named by `inverse`
+        """
+        models = val if self.many else (val,)
+        for model in models:
+            if not isinstance(model, ModelBase):
+                continue
+            inverse = model.get_relationships().get(self.inverse, None)
+            if inverse is None:
+                raise FieldValidationError(
+                    "Inverse relationship '{}' of '{}' not found on '{}'".format(
+                        self.inverse, self.data_key, model.__class__.__name__
+                    )
+                )
+            current = getattr(model, ModelRegistry._deserialized_key).get(
+                self.inverse, None
+            )
+            if current is not None and (
+                current.__class__ is not Placeholders or current is Placeholders.LAZY
+            ):
+                continue
+            if inverse.many or getattr(model, inverse.ref, None) != getattr(
+                owner, inverse.attr, None
+            ):
+                continue
+            model.__class__.__dict__[self.inverse].set_deserialized(model, owner)
+
     def build_query(self, models):
         """Bundles all of the callback args for the models into a single
         query."""
@@ -217,6 +394,7 @@ class One(BaseRelationship):
         callback=None,
         callback_args=None,
         callback_kwargs=None,
+        inverse=None,
         **kwargs,
     ):
         """One initializer. Uses "find" callback by default.
@@ -240,6 +418,7 @@ class One(BaseRelationship):
             callback_args=callback_args,
             callback_kwargs=callback_kwargs,
             many=False,
+            inverse=inverse,
         )
 
 
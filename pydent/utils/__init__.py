@@ -11,7 +11,9 @@ Submodules
     :toctree: _autosummary
 
     async_requests
+    json_codec
     logger
+    search_index
 
 """
 import pprint as pprint_module
@@ -0,0 +1,175 @@
+"""JSON codecs used to encode requests and decode responses.
+
+The fastest installed codec is selected by default (`orjson`, if
+installed, otherwise the standard library :mod:`json`). Use
+:func:`set_codec` to select a codec explicitly:
+
+.. code-block:: python
+
+    from pydent.utils import json_codec
+
+    json_codec.set_codec("json")
+    json_codec.dumps({"id": 1})
+
+.. versionadded:: 1.1.0
+"""
+import json
+import math
+from typing import Dict
+from typing import List
+from typing import Type
+from typing import Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def _check_finite(obj):
+    """Raises a ValueError if the object contains NaN or infinite floats."""
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            _check_finite(v)
+    elif isinstance(obj, (list, tuple)):
+        for v in obj:
+            _check_finite(v)
+
+
+class JSONCodec:
+    """JSON codec using the standard library :mod:`json` module."""
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]):
+        """Decodes a JSON document.
+
+        :raises json.JSONDecodeError: if the document is not valid JSON
+        """
+        return json.loads(data)
+
+    def dumps(self, obj, sort_keys: bool = False, indent: bool = False) -> str:
+        """Encodes an object as a JSON string.
+
+        :param obj: the object to encode
+        :param sort_keys: whether to sort the keys of dictionaries
+        :param indent: whether to indent the output (with two spaces)
+        :return: the JSON string
+        """
+        return json.dumps(obj, sort_keys=sort_keys, indent=2 if indent else None)
+
+    def dumps_bytes(self, obj, sort_keys: bool = False, indent: bool = False) -> bytes:
+        """Encodes an object as UTF-8 JSON bytes, e.g. for a request body.
+
+        :raises ValueError: if the object contains NaN or infinite floats,
+            which are not valid JSON
+        """
+        return json.dumps(
+            obj, sort_keys=sort_keys, indent=2 if indent else None, allow_nan=False
+        ).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec using `orjson`.
+
+    Falls back to the standard library for data `orjson` does not support,
+    such as integers larger than 64 bits or non-string dictionary keys.
+    `orjson` encodes NaN and infinite floats as `null`, so
+    :meth:`dumps_bytes` rejects them like the standard library codec.
+    """
+
+    name = "orjson"
+
+    def loads(self, data: Union[str, bytes]):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+    @staticmethod
+    def _dumps(obj, sort_keys: bool, indent: bool) -> Union[bytes, None]:
+        option = 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            return None
+
+    def dumps_bytes(self, obj, sort_keys: bool = False, indent: bool = False) -> bytes:
+        data = self._dumps(obj, sort_keys, indent)
+        if data is None:
+            return super().dumps_bytes(obj, sort_keys=sort_keys, indent=indent)
+        if b"null" in data:
+            _check_finite(obj)
+        return data
+
+    def dumps(self, obj, sort_keys: bool = False, indent: bool = False) -> str:
+        data = self._dumps(obj, sort_keys, indent)
+        if data is None:
+            return super().dumps(obj, sort_keys=sort_keys, indent=indent)
+        return data.decode("utf-8")
+
+
+#: codec classes by name, in order of preference
+CODECS: Dict[str, Type[JSONCodec]] = {}
+if orjson is not None:
+    CODECS[OrjsonCodec.name] = OrjsonCodec
+CODECS[JSONCodec.name] = JSONCodec
+
+_codec = None
+
+
+def available_codecs() -> List[str]:
+    """Returns the names of the installed codecs, in order of preference."""
+    return list(CODECS)
+
+
+def set_codec(codec: Union[str, JSONCodec] = None) -> JSONCodec:
+    """Sets the codec used by trident.
+
+    :param codec: a codec name (see :func:`available_codecs`), a codec
+        instance or None to select the fastest installed codec
+    :return: the codec
+    """
+    global _codec
+    if codec is None:
+        codec = available_codecs()[0]
+    if isinstance(codec, str):
+        if codec not in CODECS:
+            raise ValueError(
+                "JSON codec '{}' is not available. Select from {}".format(
+                    codec, available_codecs()
+                )
+            )
+        codec = CODECS[codec]()
+    _codec = codec
+    return codec
+
+
+def get_codec() -> JSONCodec:
+    """Returns the codec used by trident."""
+    return _codec
+
+
+def loads(data: Union[str, bytes]):
+    """Decodes a JSON document using the selected codec."""
+    return _codec.loads(data)
+
+
+def dumps(obj, sort_keys: bool = False, indent: bool = False) -> str:
+    """Encodes an object as a JSON string using the selected codec."""
+    return _codec.dumps(obj, sort_keys=sort_keys, indent=indent)
+
+
+def dumps_bytes(obj, sort_keys: bool = False) -> bytes:
+    """Encodes an object as UTF-8 JSON bytes using the selected codec."""
+    return _codec.dumps_bytes(obj, sort_keys=sort_keys)
+
+
+set_codec()
@@ -0,0 +1,352 @@
+"""In-memory search indices used by the :class:`Browser <pydent.browser.Browser>`.
+
+.. versionadded:: 1.1.0
+"""
+import math
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from difflib import get_close_matches
+from typing import Iterable
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+try:
+    import re._parser as sre_parse
+    from re._constants import LITERAL
+except ImportError:  # python < 3.11
+    import sre_parse
+    from sre_constants import LITERAL
+
+
+class NameIndex:
+    """An index of model names for regular expression, fuzzy and prefix
+    search.
+
+    Aquarium identifiers (e.g. '12: pMOD8') are indexed by their
+    lower-cased character trigrams. Searches narrow the candidate names
+    using the trigram postings and only run the regular expression (or
+    `difflib`) on the candidates. Regular expressions are matched against
+    the identifiers, fuzzy matches against the names. A sorted array of
+    names answers prefix queries.
+
+    The `watermark` is the largest model id added to the index, which is
+    used to incrementally add newer models.
+    """
+
+    NGRAM = 3
+    MAX_FUZZY_CANDIDATES = 200
+
+    def __init__(self, entries: Iterable[Tuple[int, str]] = None):
+        self.names = {}
+        self.ngrams = defaultdict(set)
+        self.watermark = 0
+        self._prefix_array = None
+        if entries is not None:
+            self.update(entries)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, model_id):
+        return model_id in self.names
+
+    @classmethod
+    def tokenize(cls, text: str) -> Set[str]:
+        """Returns the set of lower-cased trigrams in the text."""
+        text = text.lower()
+        return {text[i : i + cls.NGRAM] for i in range(len(text) - cls.NGRAM + 1)}
+
+    @staticmethod
+    def parse_identifier(identifier: str) -> Tuple[int, str]:
+        """Parses an Aquarium identifier (e.g. '12: pMOD8') into a tuple of
+        id and name."""
+        model_id, name = identifier.split(": ", 1)
+        return int(model_id), name
+
+    @staticmethod
+    def identifier(model_id: int, name: str) -> str:
+        return "{}: {}".format(model_id, name)
+
+    def add(self, model_id: int, name: str):
+        """Adds or renames a model in the index."""
+        if name is None:
+            return
+        old = self.names.get(model_id, None)
+        if old == name:
+            return
+        if old is not None:
+            self.remove(model_id)
+        self.names[model_id] = name
+        for gram in self.tokenize(self.identifier(model_id, name)):
+            self.ngrams[gram].add(model_id)
+        self.watermark = max(self.watermark, model_id)
+        self._prefix_array = None
+
+    def remove(self, model_id: int):
+        name = self.names.pop(model_id, None)
+        if name is None:
+            return
+        for gram in self.tokenize(self.identifier(model_id, name)):
+            ids = self.ngrams[gram]
+            ids.discard(model_id)
+            if not ids:
+                del self.ngrams[gram]
+        self._prefix_array = None
+
+    def update(self, entries: Iterable[Union[Tuple[int, str], str]]):
+        """Adds entries to the index. Entries are either (id, name) tuples or
+        Aquarium identifiers ('id: name')."""
+        for entry in entries:
+            if isinstance(entry, str):
+                entry = self.parse_identifier(entry)
+            self.add(*entry)
+
+    def _candidates(self, literals: Iterable[str]) -> Union[Set[int], None]:
+        """Returns the ids of names containing all of the literals, or None if
+        the literals are too short to narrow the search."""
+        candidates = None
+        for literal in literals:
+            for gram in self.tokenize(literal):
+                ids = self.ngrams.get(gram, set())
+                if candidates is None:
+                    candidates = set(ids)
+                else:
+                    candidates &= ids
+                if not candidates:
+                    return set()
+        return candidates
+
+    @staticmethod
+    def required_literals(pattern: str) -> List[str]:
+        """Returns literal strings that must appear in any match of the
+        regular expression. Only top-level runs of literal characters are
+        considered, so the result may be empty."""
+        try:
+            parsed = sre_parse.parse(pattern)
+        except re.error:
+            return []
+        literals = []
+        run = []
+        for op, arg in parsed:
+            if op is LITERAL:
+                run.append(chr(arg))
+            else:
+                if run:
+                    literals.append("".join(run))
+                run = []
+        if run:
+            literals.append("".join(run))
+        return literals
+
+    def search(self, pattern: str, ignore_case: bool = True) -> List[int]:
+        """Returns the ids of models whose identifiers (e.g. '12: pMOD8')
+        match the regular expression."""
+        flags = re.IGNORECASE if ignore_case else 0
+        regex = re.compile(pattern, flags)
+        candidates = self._candidates(self.required_literals(pattern))
+        if candidates is None:
+            candidates = self.names
+        return sorted(
+            i for i in candidates if regex.search(self.identifier(i, self.names[i]))
+        )
+
+    def prefix(self, prefix: str, ignore_case: bool = True) -> List[int]:
+        """Returns the ids of models whose names start with the prefix."""
+        if self._prefix_array is None:
+            self._prefix_array = sorted(
+                (name.lower(), model_id) for model_id, name in self.names.items()
+            )
+        lower = prefix.lower()
+        found = []
+        for i in range(
+            bisect_left(self._prefix_array, (lower,)), len(self._prefix_array)
+        ):
+            name, model_id = self._prefix_array[i]
+            if not name.startswith(lower):
+                break
+            if ignore_case or self.names[model_id].startswith(prefix):
+                found.append(model_id)
+        return sorted(found)
+
+    def close_matches(self, word: str, n: int = 3, cutoff: float = 0.6) -> List[int]:
+        """Returns the ids of models whose names closely match the word, best
+        matches first (see :func:`difflib.get_close_matches`)."""
+        grams = self.tokenize(word)
+        if grams:
+            counts = defaultdict(int)
+            for gram in grams:
+                for model_id in self.ngrams.get(gram, ()):
+                    counts[model_id] += 1
+            candidates = sorted(counts, key=lambda i: -counts[i])
+            candidates = candidates[: self.MAX_FUZZY_CANDIDATES]
+        else:
+            candidates = list(self.names)
+        by_name = defaultdict(list)
+        for model_id in candidates:
+            by_name[self.names[model_id]].append(model_id)
+        matches = get_close_matches(word, list(by_name), n=n, cutoff=cutoff)
+        return [model_id for name in matches for model_id in by_name[name]]
+
+
+class TextIndex:
+    """An inverted index over tokenized text for ranked full-text search.
+
+    Each document is tokenized into lower-cased words. The postings map
+    each word to the positions it occurs at in each document, which are used
+    to answer phrase queries. Results are ranked by tf-idf.
+
+    Queries are a sequence of terms that must all match. Double quotes
+    match a phrase, a leading `-` excludes a term or phrase and `OR`
+    separates alternative sets of terms:
+
+    .. code-block:: python
+
+        index.search('gfp "yeast strain" -deprecated OR mcherry')
+    """
+
+    TOKEN_PATTERN = re.compile(r"\w+")
+    QUERY_PATTERN = re.compile(r'-?"[^"]*"|\S+')
+
+    def __init__(self):
+        self.postings = defaultdict(dict)
+        self.lengths = {}
+        self.terms = {}
+        self.texts = {}
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.lengths
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        if not text:
+            return []
+        return cls.TOKEN_PATTERN.findall(text.lower())
+
+    def add(self, doc_id, *texts: str):
+        """Adds or replaces a document made up of the texts. Documents whose
+        texts did not change are not re-indexed."""
+        if self.texts.get(doc_id, None) == texts:
+            return
+        self.remove(doc_id)
+        tokens = []
+        for text in texts:
+            tokens += self.tokenize(text)
+        for position, token in enumerate(tokens):
+            self.postings[token].setdefault(doc_id, []).append(position)
+        self.lengths[doc_id] = len(tokens)
+        self.terms[doc_id] = set(tokens)
+        self.texts[doc_id] = texts
+
+    def remove(self, doc_id):
+        if self.lengths.pop(doc_id, None) is None:
+            return
+        del self.texts[doc_id]
+        for token in self.terms.pop(doc_id):
+            docs = self.postings[token]
+            del docs[doc_id]
+            if not docs:
+                del self.postings[token]
+
+    def candidates(self, literals: Iterable[str]) -> Union[Set, None]:
+        """Returns the documents that may contain all of the literals (e.g.
+        the :meth:`required literals <NameIndex.required_literals>` of a
+        regular expression), ignoring case, or None if the literals contain
+        no words. Each word of a literal may be part of a longer word in the
+        document, so the vocabulary is scanned for words containing it.
+
+        .. versionadded:: 1.1.0
+        """
+        candidates = None
+        for literal in literals:
+            for token in self.tokenize(literal):
+                docs = set()
+                for term, term_docs in self.postings.items():
+                    if token in term:
+                        docs.update(term_docs)
+                if candidates is None:
+                    candidates = docs
+                else:
+                    candidates &= docs
+                if not candidates:
+                    return set()
+        return candidates
+
+    def _phrase_docs(self, tokens: List[str]) -> Set:
+        """Returns the documents containing the tokens as a phrase."""
+        if not tokens:
+            return set()
+        docs = set(self.postings.get(tokens[0], {}))
+        for token in tokens[1:]:
+            docs &= set(self.postings.get(token, {}))
+        if len(tokens) == 1:
+            return docs
+        found = set()
+        for doc_id in docs:
+            starts = set(self.postings[tokens[0]][doc_id])
+            for offset, token in enumerate(tokens[1:], 1):
+                starts &= {p - offset for p in self.postings[token][doc_id]}
+                if not starts:
+                    break
+            if starts:
+                found.add(doc_id)
+        return found
+
+    def parse(self, query: str) -> List[List[Tuple[bool, List[str]]]]:
+        """Parses a query into alternative clauses. Each clause is a list of
+        (negated, tokens) tuples."""
+        clauses = [[]]
+        for term in self.QUERY_PATTERN.findall(query):
+            if term == "OR":
+                clauses.append([])
+                continue
+            negated = term.startswith("-") and len(term) > 1
+            if negated:
+                term = term[1:]
+            tokens = self.tokenize(term.strip('"'))
+            if tokens:
+                clauses[-1].append((negated, tokens))
+        return [c for c in clauses if c]
+
+    def score(self, doc_id, tokens: Iterable[str]) -> float:
+        """The tf-idf score of the tokens for a document."""
+        score = 0.0
+        num_docs = len(self.lengths)
+        for token in tokens:
+            docs = self.postings.get(token, {})
+            if doc_id in docs:
+                tf = len(docs[doc_id]) / self.lengths[doc_id]
+                score += tf * math.log(1 + num_docs / len(docs))
+        return score
+
+    def search(self, query: str, doc_ids: Iterable = None) -> List:
+        """Returns the ids of documents matching the query, best matches
+        first.
+
+        :param query: the query
+        :param doc_ids: optional ids to restrict the search to
+        :return: list of document ids
+        """
+        found = set()
+        tokens = set()
+        for clause in self.parse(query):
+            docs = None
+            excluded = set()
+            for negated, phrase in clause:
+                phrase_docs = self._phrase_docs(phrase)
+                if negated:
+                    excluded |= phrase_docs
+                    continue
+                tokens.update(phrase)
+                docs = phrase_docs if docs is None else docs & phrase_docs
+            if docs is None:
+                docs = set(self.lengths)
+            found |= docs - excluded
+        if doc_ids is not None:
+            found &= set(doc_ids)
+        return sorted(found, key=lambda d: (-self.score(d, tokens), d))
@@ -123,6 +123,23 @@ class TestSpeed:
         instance = model(self, base)._set_data(self.random_data())
         benchmark(self.access, instance, num, "mydata")
 
+    @pytest.mark.parametrize("model", models)
+    @pytest.mark.parametrize("attr", ["field", "mydata"])
+    def test_read_throughput(self, benchmark, base, model, attr):
+        """Compares attribute reads of loaded data to the ControlModel."""
+        benchmark.group = "read throughput: {}".format(attr)
+        instance = model(self, base)._set_data(self.random_data())
+        benchmark(self.access, instance, 1000, attr)
+
+    @pytest.mark.parametrize("model", [CachedCallback, ControlModel])
+    def test_cached_callback_read_throughput(self, benchmark, base, model):
+        """Compares reads of a cached callback to the ControlModel."""
+        benchmark.group = "read throughput: cached callback"
+        instance = model(self, base)._set_data(self.random_data())
+        instance.field2 = 125
+        benchmark(self.access, instance, 1000, "field2")
+        assert instance.field2 == 125
+
     @pytest.mark.parametrize("num", [1, 10, 100, 1000])
     @pytest.mark.parametrize("model", [CachedCallback, NoCacheCallback])
     def test_access_to_missing(self, benchmark, base, model, num):
@@ -244,3 +261,33 @@ class TestBenchmarkRelationships:
         instance = ModelRegistry.get_model(model)()
         benchmark(instance.dump, include=include)
         assert instance.dump(include=include) == expected
+
+
+@pytest.mark.benchmark
+class TestBenchmarkGroupedFields:
+    @pytest.fixture(scope="function")
+    def Model(self, base):
+        @add_schema
+        class Model(base):
+            fields = dict(
+                a=Relationship("Model", "find"),
+                b=Relationship("Model", "find"),
+                c=Callback("find"),
+                d=Field(),
+            )
+
+            def find(self, *args):
+                return None
+
+        return Model
+
+    @staticmethod
+    def grouped_fields(model, cached):
+        for _ in range(100):
+            if not cached:
+                model.model_schema.invalidate()
+            model.model_schema.grouped_fields["Relationship"]
+
+    @pytest.mark.parametrize("cached", [True, False], ids=["cached", "uncached"])
+    def test_grouped_fields(self, benchmark, Model, cached):
+        benchmark(self.grouped_fields, Model, cached)
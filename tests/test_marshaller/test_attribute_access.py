@@ -3,6 +3,7 @@ from uuid import uuid4
 import pytest
 
 from pydent.marshaller.base import add_schema
+from pydent.marshaller.descriptors import Placeholders
 from pydent.marshaller.exceptions import ModelValidationError
 from pydent.marshaller.fields import Callback
 from pydent.marshaller.fields import Field
@@ -301,3 +302,109 @@ class TestCallbackAccess:
         assert not mymodel.is_deserialized("field")
         assert mymodel.field == 5
         assert mymodel.is_deserialized("field")
+
+
+class TestLoadPlan:
+    def test_plan_is_reused(self, base):
+        @add_schema
+        class MyModel(base):
+            fields = dict(field=Field())
+
+        m1 = MyModel._set_data({"id": 1, "field": 2, "name": "a"})
+        plan = MyModel.model_schema.load_plan({"id": 1, "field": 2, "name": "a"})
+        m2 = MyModel._set_data({"id": 3, "field": 4, "name": "b"})
+        assert (
+            MyModel.model_schema.load_plan({"id": 5, "field": 6, "name": "c"}) is plan
+        )
+        assert {k: step for k, step, _ in plan.steps} == {
+            "id": plan.DIRECT,
+            "field": plan.DESCRIPTOR,
+            "name": plan.DIRECT,
+        }
+        assert (m1.id, m1.field, m1.name) == (1, 2, "a")
+        assert (m2.id, m2.field, m2.name) == (3, 4, "b")
+
+    def test_plan_deserializes_fields(self, base):
+        @add_schema
+        class Other(base):
+            pass
+
+        @add_schema
+        class MyModel(base):
+            fields = dict(other=Relationship("Other", "find"))
+
+            def find(self, model_name):
+                return None
+
+        for i in range(2):
+            model = MyModel._set_data({"id": i, "other": {"id": i + 10}})
+            assert isinstance(model.other, Other)
+            assert model.other.id == i + 10
+
+    def test_plan_drops_ignored_keys(self, base):
+        @add_schema
+        class MyModel(base):
+            fields = dict(ignore=("secret",))
+
+        for i in range(2):
+            data = {"id": i, "secret": "x"}
+            model = MyModel._set_data(data)
+            assert "secret" not in data
+            assert not hasattr(model, "secret")
+
+    def test_register_field_invalidates_plans(self, base):
+        @add_schema
+        class MyModel(base):
+            pass
+
+        MyModel._set_data({"id": 1, "value": 2})
+        assert MyModel.model_schema._load_plans
+        Field().register("other", MyModel)
+        assert not MyModel.model_schema._load_plans
+
+    def test_too_many_plans(self, base):
+        @add_schema
+        class MyModel(base):
+            pass
+
+        MyModel.model_schema.MAX_LOAD_PLANS = 2
+        for i in range(4):
+            model = MyModel._set_data({"key{}".format(i): i})
+            assert getattr(model, "key{}".format(i)) == i
+        assert len(MyModel.model_schema._load_plans) == 2
+
+    @pytest.mark.parametrize("max_plans", [256, 0], ids=["plan", "no plan"])
+    def test_lazy_relationship_data(self, base, max_plans):
+        @add_schema
+        class Other(base):
+            pass
+
+        @add_schema
+        class MyModel(base):
+            fields = dict(
+                other=Relationship("Other", "find"),
+                others=Relationship("Other", "find", many=True),
+            )
+
+            def find(self, model_name):
+                raise AssertionError("Callback should not be called.")
+
+        MyModel.model_schema.MAX_LOAD_PLANS = max_plans
+        model = MyModel()
+        model.add_data(
+            {"id": 1, "other": {"id": 2}, "others": [{"id": 3}, {"id": 4}]},
+            lazy=True,
+        )
+        deserialized = getattr(model, MyModel._deserialized_key)
+        assert deserialized["other"] is Placeholders.LAZY
+        assert deserialized["others"] is Placeholders.LAZY
+        assert model.is_deserialized("other")
+
+        other = model.other
+        assert isinstance(other, Other)
+        assert other.id == 2
+        assert model.other is other
+        assert deserialized["others"] is Placeholders.LAZY
+
+        assert [o.id for o in model._get_deserialized_data()["others"]] == [3, 4]
+        assert model._get_data()["others"] == [{"id": 3}, {"id": 4}]
@@ -7,6 +7,7 @@ from pydent.marshaller.exceptions import ModelValidationError
 from pydent.marshaller.exceptions import SchemaException
 from pydent.marshaller.exceptions import SchemaRegistryError
 from pydent.marshaller.fields import Callback
+from pydent.marshaller.fields import Field
 from pydent.marshaller.fields import Relationship
 from pydent.marshaller.schema import SchemaRegistry
 
@@ -106,6 +107,45 @@ class TestSchemaConstructors:
         assert MyFirstModel.model_schema is not MySecondModel.model_schema
 
 
+class TestGroupedFields:
+    @pytest.fixture(scope="function")
+    def MyModel(self, base):
+        @add_schema
+        class MyModel(base):
+            fields = dict(field=Field(), callback=Callback("find"))
+
+            def find(self):
+                return 1
+
+        return MyModel
+
+    def test_grouped_fields(self, MyModel):
+        grouped = MyModel.model_schema.grouped_fields
+        assert set(grouped["Field"]) == {"field", "callback"}
+        assert set(grouped["Callback"]) == {"callback"}
+        assert dict(grouped["Relationship"]) == {}
+        assert "Relationship" not in grouped
+
+    def test_grouped_fields_are_cached(self, MyModel):
+        schema = MyModel.model_schema
+        assert schema.grouped_fields is schema.grouped_fields
+
+    def test_grouped_fields_are_read_only(self, MyModel):
+        grouped = MyModel.model_schema.grouped_fields
+        with pytest.raises(TypeError):
+            grouped["Field"]["other"] = Field()
+        with pytest.raises(TypeError):
+            grouped["Other"] = {}
+
+    def test_add_field_invalidates_grouped_fields(self, MyModel):
+        schema = MyModel.model_schema
+        grouped = schema.grouped_fields
+        schema.add_field("other", Field())
+        assert schema.grouped_fields is not grouped
+        assert "other" in schema.grouped_fields["Field"]
+        assert MyModel._set_data({"other": 5}).other == 5
+
+
 class TestRelationshipConstructors:
     @pytest.fixture(scope="function")
     def base(self):
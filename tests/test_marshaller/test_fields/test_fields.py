@@ -3,10 +3,12 @@ import json
 import pytest
 
 from pydent.marshaller.base import add_schema
+from pydent.marshaller.exceptions import ModelRegistryError
 from pydent.marshaller.fields import Callback
 from pydent.marshaller.fields import Field
 from pydent.marshaller.fields import Nested
 from pydent.marshaller.fields import Relationship
+from pydent.marshaller.registry import ModelRegistry
 
 
 def test_default(base):
@@ -110,3 +112,44 @@ def test_ignore(ignore, init, base):
         assert e in m.dump(), "Should have attribute {}".format(e)
         assert getattr(m, e) == expected[e]
         assert m.dump()[e] == expected[e]
+
+
+def test_nested_model_is_memoized_until_registry_changes(base):
+    @add_schema
+    class MemoizedA(base):
+        pass
+
+    @add_schema
+    class MemoizedB(base):
+        pass
+
+    field = Nested("MemoizedA")
+    assert field.get_model() is MemoizedA
+    ModelRegistry.models["MemoizedA"] = MemoizedB
+    try:
+        assert field.get_model() is MemoizedA
+
+        @add_schema
+        class MemoizedC(base):
+            pass
+
+        assert field.get_model() is MemoizedB
+    finally:
+        ModelRegistry.models["MemoizedA"] = MemoizedA
+
+
+def test_nested_model_memo_invalidated_by_replaced_registry(base):
+    @add_schema
+    class MemoizedD(base):
+        pass
+
+    field = Nested("MemoizedD")
+    assert field.get_model() is MemoizedD
+    models = ModelRegistry.models
+    ModelRegistry.models = {}
+    try:
+        with pytest.raises(ModelRegistryError):
+            field.get_model()
+    finally:
+        ModelRegistry.models = models
+    assert field.get_model() is MemoizedD
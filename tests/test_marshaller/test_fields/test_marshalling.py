@@ -4,6 +4,7 @@ import pytest
 
 from pydent.marshaller.base import add_schema
 from pydent.marshaller.base import ModelRegistry
+from pydent.marshaller.exceptions import SchemaModelException
 from pydent.marshaller.fields import Alias
 from pydent.marshaller.fields import Callback
 from pydent.marshaller.fields import Field
@@ -180,6 +181,74 @@ class TestDump:
         assert m.dump(include="field1") == {"field1": 100, "field2": 100}
         assert m.dump(ignore="field2") == {}
 
+    def test_dump_does_not_share_data(self, base):
+        """Expect dumped data to be a copy of the model data."""
+
+        @add_schema
+        class MyModel(base):
+            pass
+
+        model = MyModel._set_data({"id": 5, "data": {"values": [1, 2]}})
+        data = model.dump()
+        assert data == {"id": 5, "data": {"values": [1, 2]}}
+        data["data"]["values"].append(3)
+        assert model.data == {"values": [1, 2]}
+
+    def test_dump_repeated_nested_model(self, base):
+        """Expect a model that appears more than once in a dump to be dumped
+        to separate copies."""
+
+        @add_schema
+        class Child(base):
+            pass
+
+        @add_schema
+        class Parent(base):
+            fields = dict(children=Relationship("Child", "find", many=True))
+
+            def find(self, model_name):
+                child = ModelRegistry.get_model(model_name)._set_data(
+                    {"id": 1, "tags": ["a"]}
+                )
+                return [child, child]
+
+        model = Parent()
+        data = model.dump(include="children")
+        assert data == {"children": [{"id": 1, "tags": ["a"]}] * 2}
+        assert data["children"][0] is not data["children"][1]
+        assert data["children"][0]["tags"] is not data["children"][1]["tags"]
+
+    def test_dump_plans_are_cached(self, base):
+        @add_schema
+        class MyModel(base):
+            fields = dict(field1=Callback("find"))
+
+            def find(self):
+                return 100
+
+        model = MyModel._set_data({"id": 5})
+        assert model.dump(include="field1") == {"id": 5, "field1": 100}
+        plans = dict(MyModel.model_schema._dump_plans)
+        assert len(plans) == 1
+
+        model.dump(include=["field1"])
+        assert MyModel.model_schema._dump_plans == plans
+
+        MyModel.model_schema.add_field("field2", Callback("find", always_dump=True))
+        assert not MyModel.model_schema._dump_plans
+        assert model.dump(include="field1") == {"id": 5, "field1": 100, "field2": 100}
+
+    def test_dump_self_reference_raises(self, base):
+        @add_schema
+        class MyModel(base):
+            fields = dict(me=Callback("find", always_dump=True))
+
+            def find(self):
+                return self
+
+        with pytest.raises(SchemaModelException):
+            MyModel().dump()
+
     def test_empty_list_field(self, base):
         """Expect."""
 
@@ -0,0 +1,35 @@
+import gc
+import tracemalloc
+
+import pytest
+
+from pydent.models import Item
+from pydent.records import load_records
+from tests.test_pydent.benchmark.test_raw_policy import item_payloads
+
+
+def retained_bytes(load, num):
+    """Returns the memory retained by loading `num` items with `load`."""
+    payloads = item_payloads(num)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = load(payloads)
+        del payloads
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(items) == num
+    return after - before
+
+
+@pytest.mark.benchmark
+class TestFrozenRecordMemory:
+    def test_memory_per_10k_records(self, benchmark, fake_session):
+        def load(data):
+            return load_records(Item, data, fake_session)
+
+        benchmark.extra_info["bytes_per_10k_items"] = retained_bytes(load, 10000)
+        benchmark.pedantic(load, (item_payloads(100),), rounds=5)
@@ -0,0 +1,122 @@
+import pytest
+
+from pydent.utils import json_codec
+
+TIMESTAMP = "2019-01-01T00:00:00.000-08:00"
+
+
+def field_value(i, role, name):
+    return {
+        "id": i,
+        "name": name,
+        "role": role,
+        "parent_class": "Operation",
+        "parent_id": i // 4,
+        "field_type_id": 100 + i % 4,
+        "allowable_field_type_id": 200 + i % 4,
+        "child_sample_id": 1000 + i,
+        "child_item_id": 5000 + i,
+        "row": None,
+        "column": None,
+        "value": None,
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+        "sample": {
+            "id": 1000 + i,
+            "name": "sample {}".format(i),
+            "description": "a plasmid used in the benchmark",
+            "sample_type_id": 3,
+            "project": "benchmark",
+            "user_id": 1,
+        },
+        "item": {
+            "id": 5000 + i,
+            "location": "M20.{}.{}.{}".format(i % 10, i % 7, i % 5),
+            "object_type_id": 4,
+            "sample_id": 1000 + i,
+            "data": None,
+        },
+    }
+
+
+def plan_payload(num_operations):
+    """Returns data shaped like a plan retrieved with its operations, field
+    values, wires and data associations included."""
+    operations = []
+    wires = []
+    for i in range(num_operations):
+        fvs = [
+            field_value(i * 4 + j, role, name)
+            for j, (role, name) in enumerate(
+                [
+                    ("input", "Template"),
+                    ("input", "Forward Primer"),
+                    ("input", "Reverse Primer"),
+                    ("output", "Fragment"),
+                ]
+            )
+        ]
+        operations.append(
+            {
+                "id": i,
+                "operation_type_id": 10 + i % 3,
+                "status": "pending",
+                "user_id": 1,
+                "x": 32.0 * i,
+                "y": 64.0,
+                "parent_id": 0,
+                "created_at": TIMESTAMP,
+                "updated_at": TIMESTAMP,
+                "field_values": fvs,
+                "data_associations": [
+                    {
+                        "id": i,
+                        "key": "note",
+                        "object": '{"note": "operation %d"}' % i,
+                        "parent_class": "Operation",
+                        "parent_id": i,
+                    }
+                ],
+            }
+        )
+        if i:
+            wires.append(
+                {
+                    "id": i,
+                    "from_id": (i - 1) * 4 + 3,
+                    "to_id": i * 4,
+                    "active": True,
+                }
+            )
+    return {
+        "id": 1,
+        "name": "benchmark plan",
+        "status": "planning",
+        "user_id": 1,
+        "layout": '{"id": 0, "children": [], "wires": [], "name": "no_name"}',
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+        "operations": operations,
+        "wires": wires,
+    }
+
+
+@pytest.fixture(params=json_codec.available_codecs())
+def codec(request):
+    return json_codec.CODECS[request.param]()
+
+
+@pytest.mark.benchmark
+class TestBenchmarkJSONCodec:
+    @pytest.mark.parametrize("num_operations", [10, 500])
+    def test_dumps_plan(self, benchmark, codec, num_operations):
+        data = plan_payload(num_operations)
+        benchmark.extra_info["bytes"] = len(codec.dumps_bytes(data))
+        encoded = benchmark(codec.dumps_bytes, data)
+        assert codec.loads(encoded) == data
+
+    @pytest.mark.parametrize("num_operations", [10, 500])
+    def test_loads_plan(self, benchmark, codec, num_operations):
+        data = plan_payload(num_operations)
+        encoded = codec.dumps_bytes(data)
+        assert benchmark(codec.loads, encoded) == data
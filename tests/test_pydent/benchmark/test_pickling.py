@@ -0,0 +1,46 @@
+import pickle
+
+import pytest
+
+
+def sample_payloads(num):
+    return [
+        {
+            "id": i,
+            "name": "sample {}".format(i),
+            "description": "a plasmid used in the benchmark",
+            "sample_type_id": 3,
+            "items": [
+                {
+                    "id": i * 10 + j,
+                    "sample_id": i,
+                    "object_type_id": 4,
+                    "location": "M20.{}.{}.{}".format(i % 10, i % 7, j),
+                    "object_type": {"id": 4, "name": "Plasmid Stock"},
+                }
+                for j in range(5)
+            ],
+        }
+        for i in range(num)
+    ]
+
+
+@pytest.fixture(scope="function")
+def samples(fake_session):
+    samples = fake_session.Sample.load(sample_payloads(500))
+    for s in samples:
+        for i in s.items:
+            i.object_type
+    return samples
+
+
+@pytest.mark.benchmark
+class TestBenchmarkPickling:
+    def test_dumps(self, benchmark, samples):
+        benchmark.extra_info["bytes"] = len(pickle.dumps(samples))
+        benchmark(pickle.dumps, samples)
+
+    def test_loads(self, benchmark, samples):
+        pickled = pickle.dumps(samples)
+        loaded = benchmark(pickle.loads, pickled)
+        assert len(loaded) == len(samples)
@@ -0,0 +1,50 @@
+import gc
+import tracemalloc
+
+import pytest
+
+from pydent.base import RawPolicy
+
+
+def item_payloads(num):
+    return [
+        {
+            "id": i,
+            "sample_id": i % 100,
+            "object_type_id": 3,
+            "location": "M20.{}.{}.{}".format(i % 10, i % 7, i % 5),
+            "data": None,
+            "created_at": "2019-01-01T00:00:00.000-08:00",
+            "updated_at": "2019-01-01T00:00:00.000-08:00",
+            "object_type": {"id": 3, "name": "Fragment Stock"},
+        }
+        for i in range(num)
+    ]
+
+
+def retained_bytes(session, num):
+    """Returns the memory retained by loading `num` items."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = session.Item.load(item_payloads(num))
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(items) == num
+    return after - before
+
+
+@pytest.mark.benchmark
+class TestRawPolicyMemory:
+    @pytest.mark.parametrize(
+        "policy", list(RawPolicy), ids=[p.value for p in RawPolicy]
+    )
+    def test_memory_per_10k_items(self, benchmark, fake_session, policy):
+        fake_session.raw_policy = policy
+        benchmark.extra_info["bytes_per_10k_items"] = retained_bytes(
+            fake_session, 10000
+        )
+        benchmark.pedantic(fake_session.Item.load, (item_payloads(100),), rounds=5)
@@ -66,6 +66,7 @@ def fake_response():
         response = requests.Response()
         response.body = body
         response.json = lambda: body
+        response._content = json.dumps(body).encode("utf-8")
         response.status_code = status_code
         response.request = FakeRequest(status_code=status_code, url=url, method=method)
         return response
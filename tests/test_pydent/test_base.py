@@ -1,4 +1,5 @@
 """Tests for pydent.base.py."""
+
 import copy
 
 import pytest
@@ -277,6 +278,55 @@ def test_load_many(base, fake_session):
     assert parent.children[0].name == "Child1"
 
 
+def test_load_uses_init_defaults(base, fake_session):
+    calls = []
+
+    @add_schema
+    class Child(base):
+        def __init__(self, name="default", tags=None):
+            calls.append(name)
+            super().__init__(name=name, tags=[], status="new")
+
+    c1 = Child.load_from({"id": 1, "name": "c1"}, fake_session)
+    c2 = Child.load_from({"id": 2}, fake_session)
+    assert len(calls) == 1
+    assert (c1.name, c1.status, c1.tags) == ("c1", "new", [])
+    assert (c2.name, c2.status, c2.tags) == ("default", "new", [])
+    assert c1.tags is not c2.tags
+    assert c1.rid != c2.rid
+    assert c2.dump() == {
+        "id": 2,
+        "rid": c2.rid,
+        "name": "default",
+        "tags": [],
+        "status": "new",
+    }
+
+
+def test_get_relationships_is_cached(base):
+    @add_schema
+    class Child(base):
+        pass
+
+    @add_schema
+    class Parent(base):
+        fields = dict(
+            children=fields.Relationship("Child", "get_children", many=True),
+            kids=fields.Alias("children"),
+        )
+
+        def get_children(self, model_name):
+            return None
+
+    relationships = Parent.get_relationships()
+    assert set(relationships) == {"children", "kids"}
+    assert relationships["kids"] is relationships["children"]
+    assert Parent.get_relationships() is relationships
+    assert "kids" not in Parent.model_schema.grouped_fields["Relationship"]
+    with pytest.raises(TypeError):
+        relationships["other"] = relationships["kids"]
+
+
 def test_uri(base):
     """Expect with with the `include_uri` key includes the default URI."""
 
@@ -104,3 +104,43 @@ def test_nested_model_type(fake_session):
     data = a.dump(include="books", include_model_type=True)
     assert data["__model__"] == "Author"
     assert data["books"][0]["__model__"] == "Book"
+
+
+def sample_chain(session, length):
+    """Returns a sample linked to `length` other samples through field
+    values (sample -> field value -> sample -> ...)"""
+    sample = session.Sample.load({"id": 1})
+    root = sample
+    for i in range(1, length + 1):
+        fv = session.FieldValue.load({"id": i})
+        next_sample = session.Sample.load({"id": i + 1})
+        fv.sample = next_sample
+        sample.field_values = [fv]
+        sample = next_sample
+    return root
+
+
+def test_flatten_deep_relationships(fake_session):
+    root = sample_chain(fake_session, 2000)
+    flattened = root._rid_dict()
+    assert len(flattened) == 4001
+    assert list(flattened.values())[:3] == [
+        root,
+        root.field_values[0],
+        root.field_values[0].sample,
+    ]
+
+
+def test_flatten_cyclic_relationships(fake_session):
+    root = sample_chain(fake_session, 2)
+    last = root.field_values[0].sample.field_values[0].sample
+    last.field_values = [root.field_values[0]]
+    assert len(root._rid_dict()) == 5
+
+
+def test_update_cache_deep_relationships(fake_session):
+    root = sample_chain(fake_session, 2000)
+    updated = fake_session.browser.update_cache([root])
+    assert len(updated["Sample"]) == 2001
+    assert len(updated["FieldValue"]) == 2000
+    assert fake_session.browser.model_cache["Sample"][1] is root
@@ -0,0 +1,210 @@
+import threading
+import time
+from copy import deepcopy
+from types import SimpleNamespace
+
+import pytest
+
+from pydent.aqhttp import AqHTTP
+from pydent.exceptions import TridentRequestError
+from pydent.marshaller import ModelRegistry
+
+
+class FakeAquarium:
+    """An in-memory stand-in for the Aquarium JSON controller.
+
+    Answers 'find' and 'where' queries posted by
+    :class:`QueryInterface <pydent.interfaces.QueryInterface>` and
+    records each request it receives.
+    """
+
+    #: server-side association names that differ from the relation names
+    ASSOCIATIONS = {
+        "FieldValue": {"child_sample": "sample", "child_item": "item"},
+        "Wire": {"from": "source", "to": "destination"},
+    }
+
+    def __init__(self, latency=0.0):
+        self.tables = {}
+        self.requests = []
+        self.latency = latency
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def add(self, model_name, **data):
+        self.tables.setdefault(model_name, {})[data["id"]] = data
+        return data
+
+    @staticmethod
+    def _match(record, criteria):
+        for k, v in criteria.items():
+            if isinstance(v, list):
+                if record.get(k, None) not in v:
+                    return False
+            elif record.get(k, None) != v:
+                return False
+        return True
+
+    def _include(self, model_name, record, include):
+        """Nests related records into a copy of the record, mimicking the
+        'include' option of the server for HasOne and HasMany relations.
+        Unknown associations raise an error, as they do on the server."""
+        if isinstance(include, (str, list)):
+            include = {
+                name: {}
+                for name in ([include] if isinstance(include, str) else include)
+            }
+        record = deepcopy(record)
+        relationships = ModelRegistry.get_model(model_name).get_relationships()
+        for name, sub in include.items():
+            relation_name = self.ASSOCIATIONS.get(model_name, {}).get(name, name)
+            relation = relationships.get(relation_name, None)
+            if relation is None or (
+                relation_name == name
+                and name in self.ASSOCIATIONS.get(model_name, {}).values()
+            ):
+                raise TridentRequestError(
+                    "Association named '{}' was not found on {}".format(
+                        name, model_name
+                    ),
+                    SimpleNamespace(status_code=500),
+                )
+            records = self.tables.get(relation.nested, {}).values()
+            if relation.many:
+                found = [
+                    r
+                    for r in records
+                    if r.get(relation.ref, None) == record.get(relation.attr, None)
+                    and r.get("parent_class", model_name) == model_name
+                ]
+                record[name] = [
+                    self._include(relation.nested, r, sub.get("include", {}))
+                    for r in found
+                ]
+            else:
+                found = [
+                    r
+                    for r in records
+                    if r.get(relation.attr, None) == record.get(relation.ref, None)
+                ]
+                record[name] = None
+                if found:
+                    record[name] = self._include(
+                        relation.nested, found[0], sub.get("include", {})
+                    )
+        return record
+
+    def query(self, data):
+        records = self.tables.get(data["model"], {})
+        if "id" in data:
+            if isinstance(data["id"], list):
+                return deepcopy([records[i] for i in data["id"] if i in records])
+            record = records.get(data["id"], None)
+            return deepcopy(record)
+        method = data.get("method", None)
+        if method == "where":
+            found = [
+                r for r in records.values() if self._match(r, data.get("arguments", {}))
+            ]
+        elif method == "all":
+            found = list(records.values())
+        else:
+            raise NotImplementedError("method '{}' not supported".format(method))
+        options = data.get("options", {})
+        if options.get("reverse", False):
+            found = found[::-1]
+        offset = options.get("offset", -1)
+        if offset > 0:
+            found = found[offset:]
+        limit = options.get("limit", -1)
+        if limit >= 0:
+            found = found[:limit]
+        include = data.get("include", None)
+        if include:
+            return [self._include(data["model"], r, include) for r in found]
+        return deepcopy(found)
+
+    def sample_list(self, sample_type_id=None):
+        return [
+            "{}: {}".format(r["id"], r["name"])
+            for r in self.tables.get("Sample", {}).values()
+            if sample_type_id is None or r["sample_type_id"] == sample_type_id
+        ]
+
+    def get(self, path, **kwargs):
+        with self._lock:
+            self.requests.append(path)
+        tokens = path.split("/")
+        if tokens[0] == "sample_list":
+            return self.sample_list(*[int(t) for t in tokens[1:]])
+        raise NotImplementedError("path '{}' not supported".format(path))
+
+    def post(self, path, json_data=None, **kwargs):
+        with self._lock:
+            self.requests.append(json_data)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            return self.query(json_data)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture(scope="function")
+def fake_aquarium(monkeypatch):
+    """Returns an in-memory Aquarium server that answers requests made by the
+    session."""
+    server = FakeAquarium()
+
+    def fake_post(self, path, json_data=None, **kwargs):
+        return server.post(path, json_data=json_data, **kwargs)
+
+    def fake_get(self, path, **kwargs):
+        return server.get(path, **kwargs)
+
+    monkeypatch.setattr(AqHTTP, "post", fake_post)
+    monkeypatch.setattr(AqHTTP, "get", fake_get)
+    return server
+
+
+@pytest.fixture(scope="function")
+def sample_inventory(fake_aquarium):
+    """Adds a small inventory of samples, sample types, items and object types
+    to the fake server."""
+    server = fake_aquarium
+    server.add("SampleType", id=1, name="Primer")
+    server.add("SampleType", id=2, name="Plasmid")
+    server.add("ObjectType", id=1, name="Primer Aliquot", sample_type_id=1)
+    server.add("ObjectType", id=2, name="Plasmid Stock", sample_type_id=2)
+    for i in range(1, 11):
+        st = 1 + i % 2
+        server.add(
+            "Sample",
+            id=i,
+            name="sample{}".format(i),
+            description="description of sample {}".format(i),
+            sample_type_id=st,
+            user_id=None,
+        )
+        for j in range(2):
+            server.add(
+                "Item",
+                id=i * 10 + j,
+                sample_id=i,
+                object_type_id=st,
+                location="bench",
+            )
+        server.add(
+            "FieldValue",
+            id=100 + i,
+            name="template",
+            role=None,
+            parent_class="Sample",
+            parent_id=i,
+            child_sample_id=1 + i % 10,
+        )
+    return server
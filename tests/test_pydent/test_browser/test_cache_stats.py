@@ -0,0 +1,82 @@
+import pytest
+
+from pydent.browser import Browser
+
+
+@pytest.fixture(scope="function")
+def browser(fake_session, sample_inventory):
+    return Browser(fake_session)
+
+
+def test_find_hits_and_misses(browser):
+    browser.find(1, "Sample")
+    browser.find(1, "Sample")
+    browser.find(2, "Sample")
+    counts = browser.stats()["models"]["Sample"]
+    assert counts["hits"] == 1
+    assert counts["misses"] == 2
+    assert counts["fallbacks"] == 2
+    assert counts["cached"] == 2
+    assert counts["bytes"] > 0
+
+
+def test_where_hits_and_misses(browser, sample_inventory):
+    browser.where({"id": [1, 2]}, "Sample")
+    browser.where({"id": [1, 2, 3]}, "Sample")
+    counts = browser.stats()["models"]["Sample"]
+    assert counts["hits"] == 2
+    assert counts["misses"] == 3
+    assert counts["fallbacks"] == 2
+
+    browser.where({"id": [1, 2, 3]}, "Sample")
+    counts = browser.stats()["models"]["Sample"]
+    assert counts["hits"] == 5
+    assert counts["fallbacks"] == 2
+    assert len(sample_inventory.requests) == 2
+
+
+def test_get_counts_hits(browser):
+    browser.where({"id": [1, 2]}, "Sample")
+    browser.reset_stats()
+    assert browser.get("Sample") == browser.where({"id": [1, 2]}, "Sample")
+    assert browser.stats()["models"]["Sample"]["hits"] == 4
+
+
+def test_retrieve_relation_counts(browser):
+    samples = browser.where({"id": [1, 2, 3]}, "Sample")
+    browser.retrieve(samples[:2], "items")
+    browser.retrieve(samples, "items")
+    stats = browser.stats()
+    assert stats["relations"][("Sample", "items")] == {
+        "hits": 2,
+        "misses": 3,
+        "fallbacks": 0,
+    }
+    assert stats["models"]["Item"]["misses"] == 6
+
+
+def test_reset_stats(browser):
+    browser.find(1, "Sample")
+    browser.reset_stats()
+    counts = browser.stats()["models"]["Sample"]
+    assert counts["hits"] == counts["misses"] == counts["fallbacks"] == 0
+    assert counts["cached"] == 1
+
+
+def test_network_relations_without_cache(fake_session, sample_inventory):
+    item = fake_session.Item.find(10)
+    assert item.sample.id == 1
+    stats = fake_session.browser.stats()
+    assert stats["network_relations"] == {("Item", "Sample"): 1}
+
+
+def test_network_relations_with_cache(fake_session, sample_inventory):
+    session = fake_session.with_cache()
+    session.browser.find(1, "Sample")
+    item = session.Item.find(10)
+    assert item.sample.id == 1
+    assert session.browser.stats()["network_relations"] == {}
+
+    item = session.Item.find(20)
+    assert item.sample.id == 2
+    assert session.browser.stats()["network_relations"] == {("Item", "Sample"): 1}
@@ -0,0 +1,94 @@
+import pytest
+
+from pydent.frames import ColumnBuilder
+from pydent.frames import data_association_columns
+from pydent.frames import field_value_columns
+
+
+def test_frame(fake_session, sample_inventory):
+    columns = fake_session.Sample.frame({"sample_type_id": 1})
+    assert columns["id"] == [2, 4, 6, 8, 10]
+    assert columns["name"] == ["sample2", "sample4", "sample6", "sample8", "sample10"]
+    assert set(columns) == {"id", "name", "description", "sample_type_id", "user_id"}
+
+
+def test_frame_selected_columns(fake_session, sample_inventory):
+    columns = fake_session.Item.frame({"sample_id": 1}, columns=["id", "missing"])
+    assert columns == {"id": [10, 11], "missing": [None, None]}
+
+
+def test_frame_pagination(fake_session, sample_inventory):
+    columns = fake_session.Item.frame({}, columns=["id"], page_size=3)
+    assert columns["id"] == sorted(sample_inventory.tables["Item"])
+    assert len(sample_inventory.requests) == 8
+
+
+def test_frame_limit(fake_session, sample_inventory):
+    columns = fake_session.Item.frame(
+        {}, columns=["id"], page_size=3, opts={"limit": 4}
+    )
+    assert columns["id"] == [10, 11, 20, 21]
+
+
+def test_frame_field_values(fake_session, sample_inventory):
+    columns = fake_session.Sample.frame(
+        {"id": [1, 2]}, columns=["name", "field_values.template"], field_values=True
+    )
+    assert columns == {"name": ["sample1", "sample2"], "field_values.template": [2, 3]}
+    assert sample_inventory.requests[0]["include"] == ["field_values"]
+
+
+def test_frame_data_associations(fake_session, sample_inventory):
+    sample_inventory.add(
+        "DataAssociation",
+        id=1,
+        key="concentration",
+        object='{"concentration": 50}',
+        parent_class="Item",
+        parent_id=10,
+    )
+    columns = fake_session.Item.frame(
+        {"sample_id": 1}, include="sample", data_associations=True
+    )
+    assert columns["data_associations.concentration"] == [50, None]
+    assert "sample" not in columns
+    assert "data_associations" not in columns
+    assert sample_inventory.requests[0]["include"] == ["sample", "data_associations"]
+
+
+def test_frame_invalid_expansion(fake_session, sample_inventory):
+    with pytest.raises(ValueError):
+        fake_session.Sample.frame({}, data_associations=True)
+
+
+def test_frame_does_not_cache(fake_session, sample_inventory):
+    session = fake_session.with_cache()
+    columns = session.Item.frame({"sample_id": 1}, columns=["id"])
+    assert columns == {"id": [10, 11]}
+    assert "Item" not in session.browser.model_cache
+
+
+def test_column_builder_fills_missing_values():
+    builder = ColumnBuilder(exclude=["items"])
+    builder.extend([{"id": 1, "items": []}, {"id": 2, "name": "a"}, {"id": 3}])
+    assert builder.build() == {"id": [1, 2, 3], "name": [None, "a", None]}
+
+
+def test_field_value_columns():
+    fvs = [
+        {"name": "a", "role": "input", "value": None, "child_sample_id": 3},
+        {"name": "b", "role": None, "value": "5"},
+        {"name": "b", "role": None, "value": "6"},
+    ]
+    assert field_value_columns(fvs) == {
+        "field_values.input.a": 3,
+        "field_values.b": ["5", "6"],
+    }
+
+
+def test_data_association_columns():
+    das = [{"key": "x", "object": {"x": 1}}, {"key": "y", "object": '{"y": [2]}'}]
+    assert data_association_columns(das) == {
+        "data_associations.x": 1,
+        "data_associations.y": [2],
+    }
@@ -0,0 +1,109 @@
+import pytest
+
+from pydent import records
+from pydent.models import Item
+from pydent.models import Sample
+from pydent.records import FrozenRecord
+from pydent.records import FrozenRecordError
+from pydent.records import load_records
+from pydent.records import record_class
+
+
+def test_where_frozen(fake_session, sample_inventory):
+    records = fake_session.Item.where({"sample_id": [1, 2]}, frozen=True)
+    assert len(records) == 4
+    for r in records:
+        assert isinstance(r, FrozenRecord)
+        assert r.model_class is Item
+        assert r.sample_id in [1, 2]
+        assert r.location == "bench"
+        assert not hasattr(r, "__dict__")
+    assert type(records[0]) is type(records[1])
+
+
+def test_record_is_immutable(fake_session, sample_inventory):
+    record = fake_session.Item.where({"id": 10}, frozen=True)[0]
+    with pytest.raises(FrozenRecordError):
+        record.location = "freezer"
+    with pytest.raises(FrozenRecordError):
+        del record.location
+    with pytest.raises(TypeError):
+        type(record)()
+
+
+def test_included_relationships_are_records(fake_session, sample_inventory):
+    sample = fake_session.Sample.where({"id": 1}, include="items", frozen=True)[0]
+    assert [i.id for i in sample.items] == [10, 11]
+    assert all(isinstance(i, FrozenRecord) for i in sample.items)
+    assert sample.items[0].model_class is Item
+    assert len(sample_inventory.requests) == 1
+
+
+def test_relationships_resolve_through_browser(fake_session, sample_inventory):
+    item = fake_session.Item.where({"id": 10}, frozen=True)[0]
+    sample = item.sample
+    assert isinstance(sample, Sample)
+    assert sample.id == 1
+    assert fake_session.browser.find(1, "Sample") is sample
+
+    sample_record = fake_session.Sample.where({"id": 1}, frozen=True)[0]
+    assert [i.id for i in sample_record.items] == [10, 11]
+
+
+def test_missing_relationship_ref(fake_session, sample_inventory):
+    record = load_records(Item, {"id": 5, "sample_id": None}, fake_session)
+    assert record.sample is None
+
+
+def test_json_fields_are_deserialized(fake_session):
+    data = {"id": 1, "key": "x", "object": '{"x": 5}', "parent_class": "Item"}
+    record = fake_session.DataAssociation.load(data, frozen=True)
+    assert record.object == {"x": 5}
+
+
+def test_record_equality(fake_session):
+    data = {"id": 1, "location": "bench"}
+    r1 = load_records(Item, data, fake_session)
+    r2 = load_records(Item, dict(data), fake_session)
+    assert r1 == r2
+    assert hash(r1) == hash(r2)
+    assert r1._asdict() == data
+    assert r1 != load_records(Sample, data, fake_session)
+
+
+def test_record_classes_are_cached():
+    cls = record_class(Item, ("id", "location"))
+    assert record_class(Item, ("id", "location")) is cls
+    assert cls.__name__ == "ItemRecord"
+    assert cls.__slots__ == ["id", "location"]
+    assert record_class(Item, ("id",)) is not cls
+
+
+def test_records_with_dict_data_are_hashable(fake_session):
+    r1 = load_records(Item, {"id": 1, "data": {"k": 1}}, fake_session)
+    r2 = load_records(Item, {"id": 1, "data": {"k": 1}}, fake_session)
+    assert {r1, r2} == {r1}
+
+
+def test_record_class_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(records, "MAX_RECORD_CLASSES", 2)
+    monkeypatch.setattr(records, "_record_classes", {})
+    cls1 = record_class(Item, ("id",))
+    cls2 = record_class(Item, ("id", "location"))
+    cls3 = record_class(Item, ("location",))
+    assert record_class(Item, ("id",)) is cls1
+    assert record_class(Item, ("id", "location")) is cls2
+    assert record_class(Item, ("location",)) is not cls3
+    assert record_class(Sample, ("id",)) is record_class(Sample, ("id",))
+
+
+def test_frozen_pagination(fake_session, sample_inventory):
+    records = fake_session.Item.where({}, page_size=3, frozen=True)
+    assert sorted(r.id for r in records) == sorted(sample_inventory.tables["Item"])
+
+
+def test_browser_interface_frozen(fake_session, sample_inventory):
+    session = fake_session.with_cache()
+    records = session.Item.where({"sample_id": 1}, frozen=True)
+    assert all(isinstance(r, FrozenRecord) for r in records)
+    assert "Item" not in session.browser.model_cache
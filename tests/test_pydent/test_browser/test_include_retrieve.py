@@ -0,0 +1,127 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pydent.browser import Browser
+from pydent.exceptions import TridentRequestError
+
+
+@pytest.fixture(scope="function")
+def browser(fake_session, sample_inventory):
+    return Browser(fake_session)
+
+
+def test_plan_include():
+    include, fallback = Browser.plan_include(
+        "Sample", {"items": "object_type", "field_values": ["sample", "parent_sample"]}
+    )
+    assert include == {"items": {"object_type": {}}, "field_values": {"sample": {}}}
+    assert fallback == [(("field_values",), "parent_sample", None)]
+
+
+def test_include_query_option():
+    assert Browser._include_query_option(
+        "Sample", {"items": {}, "sample_type": {}}
+    ) == ["items", "sample_type"]
+    assert Browser._include_query_option(
+        "Sample", {"items": {"object_type": {}}, "sample_type": {}}
+    ) == {"items": {"include": ["object_type"]}, "sample_type": {}}
+
+
+def test_include_query_option_uses_server_associations():
+    """Single relations are included using the name of the server-side
+    association, which follows the foreign key."""
+    assert Browser._include_query_option(
+        "FieldValue", {"sample": {}, "item": {}, "field_type": {}}
+    ) == ["child_sample", "child_item", "field_type"]
+    assert Browser._include_query_option(
+        "Operation", {"field_values": {"sample": {}}}
+    ) == {"field_values": {"include": ["child_sample"]}}
+
+
+def test_include_retrieve(browser, sample_inventory):
+    samples = browser.where({"id": list(range(1, 11))}, "Sample")
+    num_requests = len(sample_inventory.requests)
+    results = browser.recursive_retrieve(
+        samples,
+        {"items": "object_type", "field_values": ["sample", "parent_sample"]},
+        use_include=True,
+    )
+    requests = sample_inventory.requests[num_requests:]
+
+    # one 'include' query; 'parent_sample' is then found in the cache
+    assert requests[0]["include"] == {
+        "items": {"include": ["object_type"]},
+        "field_values": {"include": ["child_sample"]},
+    }
+    assert len(requests) == 1
+
+    assert set(results) == {
+        "items",
+        "object_type",
+        "field_values",
+        "sample",
+        "parent_sample",
+    }
+    assert len(results["items"]) == 20
+    assert {ot.id for ot in results["object_type"]} == {1, 2}
+    for s in samples:
+        assert s.is_deserialized("items")
+        for item in s.items:
+            assert item.object_type.id == s.sample_type_id
+        for fv in s.field_values:
+            assert fv.sample.id == fv.child_sample_id
+            assert fv.parent_sample.id == s.id
+
+    # included models are flattened into the cache
+    assert browser.find(11, "Item") is not None
+    assert len(sample_inventory.requests) == num_requests + 1
+
+
+def test_include_retrieve_falls_back_on_request_error(
+    browser, sample_inventory, monkeypatch
+):
+    samples = browser.where({"id": list(range(1, 11))}, "Sample")
+    query = sample_inventory.query
+
+    def no_include(data):
+        if data.get("include", None):
+            raise TridentRequestError(
+                "include not supported", SimpleNamespace(status_code=500)
+            )
+        return query(data)
+
+    monkeypatch.setattr(sample_inventory, "query", no_include)
+    results = browser.recursive_retrieve(
+        samples, {"items": "object_type"}, use_include=True
+    )
+    assert len(results["items"]) == 20
+    assert {ot.id for ot in results["object_type"]} == {1, 2}
+
+
+def test_include_retrieve_falls_back_if_nested_include_is_ignored(
+    browser, sample_inventory, monkeypatch
+):
+    samples = browser.where({"id": list(range(1, 11))}, "Sample")
+    query = sample_inventory.query
+
+    def ignore_nested_include(data):
+        results = query(data)
+        if data.get("include", None):
+            for r in results:
+                for item in r["items"]:
+                    item.pop("object_type", None)
+        return results
+
+    monkeypatch.setattr(sample_inventory, "query", ignore_nested_include)
+    num_requests = len(sample_inventory.requests)
+    results = browser.recursive_retrieve(
+        samples, {"items": "object_type"}, use_include=True
+    )
+    # the include query, then the object types that were not included
+    assert len(sample_inventory.requests) == num_requests + 2
+    assert len(results["items"]) == 20
+    assert {ot.id for ot in results["object_type"]} == {1, 2}
+    for s in samples:
+        for item in s.items:
+            assert item.object_type.id == s.sample_type_id
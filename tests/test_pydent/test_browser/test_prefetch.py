@@ -0,0 +1,85 @@
+import pytest
+
+from pydent.browser import Browser
+from pydent.browser import BrowserException
+
+
+@pytest.fixture(scope="function")
+def browser(fake_session, sample_inventory):
+    return Browser(fake_session)
+
+
+def test_prefetch_query(browser, sample_inventory):
+    future = browser.prefetch({"id": [1, 2, 3]}, "items", model_class="Sample")
+    samples = future.result()
+    assert sorted(s.id for s in samples) == [1, 2, 3]
+    assert sorted(browser.model_cache["Sample"]) == [1, 2, 3]
+    assert len(browser.model_cache["Item"]) == 6
+    for s in samples:
+        assert s.is_deserialized("items")
+    assert not browser._prefetches
+
+
+def test_prefetch_models(browser, sample_inventory):
+    samples = browser.where({"id": [1, 2]}, "Sample")
+    future = browser.prefetch(samples, {"items": "object_type"})
+    assert future.result() == samples
+    for s in samples:
+        assert s.is_deserialized("items")
+        for item in s.items:
+            assert item.is_deserialized("object_type")
+    assert "ObjectType" in browser.model_cache
+
+
+def test_find_waits_for_prefetch(browser, sample_inventory):
+    sample_inventory.latency = 0.05
+    future = browser.prefetch({"id": [1, 2, 3]}, "items", model_class="Sample")
+    sample = browser.find(1, "Sample")
+    item = browser.find(10, "Item")
+    assert future.done()
+    assert item in sample.items
+    assert len(sample_inventory.requests) == 2
+
+
+def test_relationship_access_waits_for_prefetch(fake_session, sample_inventory):
+    samples = fake_session.Sample.find([1, 2])
+    sample_inventory.latency = 0.05
+    future = fake_session.browser.prefetch(samples, "items")
+    assert len(samples[0].items) == 2
+    assert future.done()
+    assert len(sample_inventory.requests) == 2
+
+
+def test_failed_prefetch_does_not_block(browser, sample_inventory):
+    future = browser.prefetch({"id": [1]}, "not_a_relation", model_class="Sample")
+    with pytest.raises(BrowserException):
+        future.result()
+    assert browser.find(1, "Sample").id == 1
+    assert not browser._prefetches
+
+
+def test_wait_without_prefetches_does_not_lock(browser, sample_inventory):
+    class FailingLock:
+        def __enter__(self):
+            raise AssertionError("Unexpected lock")
+
+        def __exit__(self, *args):
+            pass
+
+    browser._cache_lock = FailingLock()
+    assert browser.wait_for_prefetch("Sample") is False
+
+
+def test_close_shuts_down_prefetch_threads(browser, sample_inventory):
+    sample_inventory.latency = 0.05
+    future = browser.prefetch({"id": [1, 2]}, "items", model_class="Sample")
+    executor = browser._prefetch_executor
+    browser.close()
+    assert future.done()
+    assert browser._prefetch_executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+    # prefetching after closing starts new threads
+    assert len(browser.prefetch({"id": [3]}, model_class="Sample").result()) == 1
+    browser.close()
@@ -0,0 +1,77 @@
+import pytest
+
+from pydent.browser import Browser
+from pydent.browser import BrowserException
+
+
+@pytest.fixture(scope="function")
+def browser(fake_session, sample_inventory):
+    return Browser(fake_session)
+
+
+def test_recursive_retrieve_nested(browser, sample_inventory):
+    samples = browser.where({"id": list(range(1, 11))}, "Sample")
+    results = browser.recursive_retrieve(
+        samples, {"items": "object_type", "sample_type": {}, "field_values": "sample"}
+    )
+    assert set(results) == {
+        "items",
+        "object_type",
+        "sample_type",
+        "field_values",
+        "sample",
+    }
+    assert len(results["items"]) == 20
+    assert {ot.id for ot in results["object_type"]} == {1, 2}
+    assert {st.id for st in results["sample_type"]} == {1, 2}
+    assert len(results["field_values"]) == 10
+    for s in samples:
+        assert s.is_deserialized("items")
+        assert s.is_deserialized("sample_type")
+        for item in s.items:
+            assert item.is_deserialized("object_type")
+            assert item.object_type.id == s.sample_type_id
+
+
+def test_recursive_retrieve_runs_siblings_concurrently(browser, sample_inventory):
+    samples = browser.where({"id": list(range(1, 11))}, "Sample")
+    sample_inventory.latency = 0.05
+    browser.recursive_retrieve(samples, ["items", "sample_type", "field_values"])
+    assert sample_inventory.max_active > 1
+
+
+def test_recursive_retrieve_serial(browser, sample_inventory):
+    samples = browser.where({"id": list(range(1, 11))}, "Sample")
+    sample_inventory.latency = 0.01
+    results = browser.recursive_retrieve(
+        samples, ["items", "sample_type", "field_values"], max_workers=1
+    )
+    assert sample_inventory.max_active == 1
+    assert len(results["items"]) == 20
+
+
+def test_recursive_retrieve_order_is_deterministic(browser, sample_inventory):
+    samples = browser.where({"id": list(range(1, 11))}, "Sample")
+    results1 = browser.recursive_retrieve(
+        samples, {"items": "object_type", "field_values": "sample"}, max_workers=1
+    )
+    results2 = browser.recursive_retrieve(
+        samples, {"items": "object_type", "field_values": "sample"}, max_workers=8
+    )
+    assert list(results1) == list(results2)
+
+
+def test_recursive_retrieve_empty_models(browser):
+    results = browser.recursive_retrieve([], {"items": "object_type"})
+    assert results == {"items": [], "object_type": []}
+
+
+def test_recursive_retrieve_raises_with_unrecognized_relation(
+    browser, sample_inventory
+):
+    samples = browser.where({"id": [1, 2]}, "Sample")
+    with pytest.raises(BrowserException):
+        browser.recursive_retrieve(samples, {"items": 5})
+    with pytest.raises(BrowserException):
+        browser.recursive_retrieve(samples, 5)
+    assert browser.recursive_retrieve(samples, 5, strict=False) == []
@@ -0,0 +1,59 @@
+import sys
+
+import pytest
+
+from pydent.browser import Browser
+
+
+@pytest.fixture(scope="function")
+def browser(fake_session, sample_inventory):
+    return fake_session.browser
+
+
+def test_sample_network(browser, sample_inventory):
+    samples = browser.where({"id": [1]}, "Sample")
+    g = Browser.sample_network(samples)
+    # each sample i is a template for sample 1 + i % 10
+    assert g.number_of_nodes() == 10
+    assert g.number_of_edges() == 10
+    assert g.has_edge(("Sample", 2), ("Sample", 1))
+
+
+def test_sample_network_max_depth(browser, sample_inventory):
+    samples = browser.where({"id": [1]}, "Sample")
+    g = Browser.sample_network(samples, max_depth=3)
+    assert set(g.nodes) == {("Sample", i) for i in [1, 2, 3, 4]}
+
+
+def test_sample_network_max_nodes(browser, sample_inventory):
+    samples = browser.where({"id": [1]}, "Sample")
+    g = Browser.sample_network(samples, max_nodes=5)
+    assert g.number_of_nodes() == 5
+    assert g.number_of_edges() == 4
+
+
+def test_relationship_network_batches_frontiers(fake_session):
+    """A lineage deeper than the recursion limit is traversed with one cache
+    call per frontier."""
+    depth = sys.getrecursionlimit() + 100
+    samples = [fake_session.Sample.new(name=str(i)) for i in range(depth)]
+    parents = {s.name: samples[i + 1] for i, s in enumerate(samples[:-1])}
+    frontiers = []
+
+    def get_models(m):
+        if m.name in parents:
+            yield parents[m.name], {}
+
+    def key_func(m):
+        return m.name, {}
+
+    g = Browser.relationship_network(
+        samples[:1],
+        get_models=get_models,
+        cache_func=frontiers.append,
+        key_func=key_func,
+        strict_cache=False,
+    )
+    assert g.number_of_nodes() == depth
+    assert g.number_of_edges() == depth - 1
+    assert len(frontiers) == depth
@@ -0,0 +1,111 @@
+import pytest
+
+from pydent.browser import Browser
+
+
+@pytest.fixture(scope="function")
+def browser(fake_session, sample_inventory):
+    return Browser(fake_session)
+
+
+def num_requests(server, since):
+    return len(server.requests) - since
+
+
+def test_retrieve_has_many_generic_heterogeneous_models(browser, sample_inventory):
+    server = sample_inventory
+    server.add("Collection", id=10, object_type_id=1, location="bench")
+    server.add("DataAssociation", id=1, key="a", parent_class="Item", parent_id=10)
+    server.add(
+        "DataAssociation", id=2, key="b", parent_class="Collection", parent_id=10
+    )
+    item = browser.find(10, "Item")
+    collection = browser.find(10, "Collection")
+
+    n = len(server.requests)
+    found = browser.retrieve([item, collection], "data_associations")
+    assert num_requests(server, n) == 2
+    assert {da.id for da in found} == {1, 2}
+    assert [da.id for da in item.data_associations] == [1]
+    assert [da.id for da in collection.data_associations] == [2]
+    for request in server.requests[n:]:
+        assert request["arguments"]["parent_class"] in (["Item"], ["Collection"])
+
+
+def test_retrieve_has_one_from_many(browser, sample_inventory):
+    server = sample_inventory
+    server.add("OperationType", id=1, name="op1")
+    server.add("OperationType", id=2, name="op2")
+    for cid, name in [(1, "protocol"), (2, "protocol"), (3, "cost_model")]:
+        server.add("Code", id=cid, name=name, parent_class="OperationType", parent_id=1)
+    ots = browser.where({"id": [1, 2]}, "OperationType")
+
+    n = len(server.requests)
+    found = browser.retrieve(ots, "protocol")
+    assert num_requests(server, n) == 1
+    assert {c.id for c in found} == {1, 2}
+    ot1 = [ot for ot in ots if ot.id == 1][0]
+    assert ot1.protocol.id == 2
+    assert num_requests(server, n) == 1
+
+
+def test_retrieve_function(browser, sample_inventory):
+    server = sample_inventory
+    fvs = browser.where({"parent_class": "Sample"}, "FieldValue")
+
+    n = len(server.requests)
+    assert browser.retrieve(fvs, "sid") == []
+    assert num_requests(server, n) == 1
+    for fv in fvs:
+        assert fv.is_deserialized("sample")
+        assert fv.sid == "{}: {}".format(fv.child_sample_id, fv.sample.name)
+    assert num_requests(server, n) == 1
+
+
+def test_retrieve_function_dependencies_are_declared_on_the_field(
+    browser, sample_inventory
+):
+    """Operation.routing reads the samples and field types of the field
+    values, which are retrieved in batches regardless of the number of
+    operations."""
+    server = sample_inventory
+    server.add("OperationType", id=1, name="Make PCR")
+    for ft_id, name in [(1, "Template"), (2, "Fragment")]:
+        server.add(
+            "FieldType",
+            id=ft_id,
+            name=name,
+            role="input" if ft_id == 1 else "output",
+            routing=name[0],
+            parent_class="OperationType",
+            parent_id=1,
+        )
+    for op_id in range(1, 6):
+        server.add("Operation", id=op_id, operation_type_id=1, status="pending")
+        for ft_id, name in [(1, "Template"), (2, "Fragment")]:
+            server.add(
+                "FieldValue",
+                id=1000 + op_id * 10 + ft_id,
+                name=name,
+                role="input" if ft_id == 1 else "output",
+                parent_class="Operation",
+                parent_id=op_id,
+                field_type_id=ft_id,
+                child_sample_id=op_id,
+            )
+    ops = browser.where({"id": list(range(1, 6))}, "Operation")
+
+    n = len(server.requests)
+    browser.retrieve(ops, "routing")
+    requested = [r["model"] for r in server.requests[n:]]
+    # field types may be found in the cache by one of the two relations
+    assert len(requested) <= 5
+    assert set(requested) == {"FieldValue", "OperationType", "FieldType", "Sample"}
+
+    n = len(server.requests)
+    for op in ops:
+        assert op.routing == {
+            "T": "{}: sample{}".format(op.id, op.id),
+            "F": "{}: sample{}".format(op.id, op.id),
+        }
+    assert num_requests(server, n) == 0
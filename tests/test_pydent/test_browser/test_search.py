@@ -0,0 +1,110 @@
+import re
+
+import pytest
+
+from pydent import browser as browser_module
+from pydent.browser import Browser
+
+
+@pytest.fixture(scope="function")
+def browser(fake_session, sample_inventory):
+    return Browser(fake_session)
+
+
+def test_search_uses_local_index(browser, sample_inventory):
+    assert {s.id for s in browser.search("sample1")} == {1, 10}
+    n = len(sample_inventory.requests)
+    assert {s.id for s in browser.search("sample1$")} == {1}
+    # only the matching sample is requested
+    assert len(sample_inventory.requests[n:]) == 1
+    assert "sample_list" not in sample_inventory.requests[n:]
+
+
+def test_search_matches_identifiers(browser, sample_inventory):
+    """Patterns are matched against Aquarium identifiers ('id: name')."""
+    assert [s.id for s in browser.search("^3: ")] == [3]
+    assert {s.id for s in browser.search(r"^\d: sample\d$")} == set(range(1, 10))
+    assert browser.search("^sample") == []
+
+
+def test_search_with_sample_type(browser, sample_inventory):
+    samples = browser.search("sample", sample_type="Primer")
+    assert {s.id for s in samples} == {2, 4, 6, 8, 10}
+
+
+def test_close_matches(browser, sample_inventory):
+    assert browser.close_matches("sampel3")[0].id == 3
+
+
+def test_prefix_search(browser, sample_inventory):
+    assert {s.id for s in browser.prefix_search("SAMPLE1")} == {1, 10}
+
+
+def test_refresh_name_index(browser, sample_inventory):
+    index = browser.name_index()
+    assert index.watermark == 10
+    sample_inventory.add(
+        "Sample", id=11, name="new sample", description="", sample_type_id=1
+    )
+    assert browser.search("new") == []
+    assert browser.refresh_name_index(page_size=3) == 1
+    assert [s.id for s in browser.search("new")] == [11]
+    assert browser.refresh_name_index() == 0
+
+
+def test_search_description(browser, sample_inventory):
+    samples = browser.search(".*")
+    assert [s.id for s in browser.search_description("SAMPLE 3$", samples)] == [3]
+    assert browser.search_description("SAMPLE 3$", samples, ignore_case=False) == []
+    assert len(browser.search_description(r"of \w+ \d", samples)) == 10
+    assert len(browser.search_description(".*", samples)) == 10
+
+
+def test_search_description_only_matches_candidates(
+    browser, sample_inventory, monkeypatch
+):
+    samples = browser.search(".*")
+    searched = []
+    compile_regex = re.compile
+
+    class Regex:
+        def __init__(self, pattern, flags):
+            self.regex = compile_regex(pattern, flags)
+
+        def search(self, text):
+            searched.append(text)
+            return self.regex.search(text)
+
+    monkeypatch.setattr(browser_module.re, "compile", Regex)
+    assert [s.id for s in browser.search_description("sample 1", samples)] == [1, 10]
+    assert sorted(searched) == ["description of sample 1", "description of sample 10"]
+
+    # descriptions changed locally are re-indexed
+    samples[1].description = "renamed sample 1"
+    searched.clear()
+    found = browser.search_description("sample 1", samples)
+    assert {s.id for s in found} == {1, 2, 10}
+
+
+def test_search_description_uses_cached_samples(browser, sample_inventory):
+    assert [s.id for s in browser.search_description("SAMPLE 3$")] == [3]
+    n = len(sample_inventory.requests)
+    assert [s.id for s in browser.search_description("sample 1")] == [1, 10]
+    assert len(browser.search_description(".*")) == 10
+    assert len(sample_inventory.requests) == n
+    found = browser.search_description("sample", sample_type="Primer")
+    assert [s.id for s in found] == [2, 4, 6, 8, 10]
+
+
+def test_search_text(browser, sample_inventory):
+    samples = browser.search_text('"sample 3" OR "sample 10"')
+    assert {s.id for s in samples} == {3, 10}
+    n = len(sample_inventory.requests)
+    assert [s.id for s in browser.search_text("description -sample")] == []
+    assert len(browser.search_text("description")) == 10
+    assert len(sample_inventory.requests) == n
+
+
+def test_search_text_indexes_cached_samples(browser, sample_inventory):
+    browser.where({"id": [4]}, "Sample")
+    assert [s.id for s in browser.search_text("sample4")] == [4]
@@ -0,0 +1,157 @@
+import pickle
+
+import pytest
+
+from pydent.browser import Browser
+from pydent.browser import BrowserException
+from pydent.browser import LazyModelDict
+
+
+@pytest.fixture(scope="function")
+def browser(fake_session, sample_inventory):
+    browser = Browser(fake_session)
+    samples = browser.where({"id": list(range(1, 11))}, "Sample")
+    browser.get(samples, {"items": "object_type", "sample_type": {}})
+    return browser
+
+
+def test_snapshot_and_restore(browser, fake_session, sample_inventory, tmpdir):
+    path = str(tmpdir.join("cache.snapshot"))
+    num_models = browser.snapshot(path)
+    assert num_models == len(browser.models)
+
+    restored = Browser(fake_session)
+    assert restored.restore(path) == num_models
+    assert isinstance(restored.model_cache["Sample"], LazyModelDict)
+    assert not restored.model_cache["Sample"].decoded
+
+    n = len(sample_inventory.requests)
+    sample = restored.find(3, "Sample")
+    assert sample.name == "sample3"
+    assert sample.is_deserialized("items")
+    assert {item.id for item in sample.items} == {30, 31}
+    for item in sample.items:
+        assert item.object_type.id == sample.sample_type_id
+        # relationships resolve to the same cached instances
+        assert item is restored.find(item.id, "Item")
+    assert sample.sample_type.name == "Plasmid"
+    assert len(sample_inventory.requests) == n
+
+    # only the models connected to sample 3 were decoded
+    assert len(restored.model_cache["Sample"].decoded) == 1
+    assert len(restored.model_cache["Sample"]) == 10
+    samples = restored.where({"id": [2, 4]}, "Sample")
+    assert [s.sample_type_id for s in samples] == [1, 1]
+    assert len(sample_inventory.requests) == n
+
+
+def test_restore_keeps_cached_models(browser, fake_session, tmpdir):
+    path = str(tmpdir.join("cache.snapshot"))
+    browser.snapshot(path)
+    other = Browser(fake_session)
+    sample = other.find(1, "Sample")
+    other.restore(path)
+    assert other.find(1, "Sample") is sample
+    assert len(other.model_cache["Sample"]) == 10
+
+
+def test_restore_invalid_file(fake_session, tmpdir):
+    path = tmpdir.join("not_a_snapshot")
+    path.write("hello world, this is not a snapshot")
+    with pytest.raises(BrowserException):
+        Browser(fake_session).restore(str(path))
+
+
+def test_copy_restored_model(browser, fake_session, tmpdir):
+    path = str(tmpdir.join("cache.snapshot"))
+    browser.snapshot(path)
+    fake_session.init_cache()
+    restored = fake_session.browser
+    restored.restore(path)
+    copied = restored.find(1, "Sample").copy()
+    assert copied.name == "sample1"
+
+
+def sample_chain(session, length):
+    """Returns samples linked by field values (sample i has a field value
+    whose sample is sample i + 1)."""
+    samples = [
+        session.Sample.load({"id": i, "name": "s{}".format(i)})
+        for i in range(1, length + 2)
+    ]
+    field_values = []
+    for i, sample in enumerate(samples[:-1], 1):
+        fv = session.FieldValue.load(
+            {
+                "id": i,
+                "parent_class": "Sample",
+                "parent_id": i,
+                "child_sample_id": i + 1,
+            }
+        )
+        fv.sample = samples[i]
+        sample.field_values = [fv]
+        field_values.append(fv)
+    return samples + field_values
+
+
+def num_decoded(browser):
+    return sum(
+        len(cache.decoded)
+        for cache in browser.model_cache.values()
+        if isinstance(cache, LazyModelDict)
+    )
+
+
+@pytest.mark.parametrize("length", [50, 3000])
+def test_restore_decodes_relationships_on_access(fake_session, tmpdir, length):
+    browser = Browser(fake_session)
+    browser.update_cache(sample_chain(fake_session, length))
+    path = str(tmpdir.join("cache.snapshot"))
+    assert browser.snapshot(path) == 2 * length + 1
+
+    restored = Browser(fake_session)
+    restored.restore(path)
+    sample = restored.find(1, "Sample")
+    assert sample.name == "s1"
+    assert num_decoded(restored) == 1
+
+    assert sample.is_deserialized("field_values")
+    fv = sample.field_values[0]
+    assert num_decoded(restored) == 2
+    assert fv.sample.name == "s2"
+    assert num_decoded(restored) == 3
+    assert fv.parent_sample is sample
+
+    for _ in range(length):
+        sample = sample.field_values[0].sample
+    assert sample.id == length + 1
+    assert num_decoded(restored) == 2 * length + 1
+
+
+def test_restore_closes_snapshot(browser, fake_session, tmpdir):
+    path = str(tmpdir.join("cache.snapshot"))
+    browser.snapshot(path)
+
+    restored = Browser(fake_session)
+    restored.restore(path)
+    buffer = restored.model_cache["Sample"].data
+    assert not buffer.closed
+    restored.models
+    assert buffer.closed
+    assert restored.find(3, "Sample").items[0].sample.id == 3
+
+    restored = Browser(fake_session)
+    restored.restore(path)
+    buffer = restored.model_cache["Sample"].data
+    restored.clear()
+    assert buffer.closed
+
+
+def test_pickle_restored_model(browser, fake_session, tmpdir):
+    path = str(tmpdir.join("cache.snapshot"))
+    browser.snapshot(path)
+    restored = Browser(fake_session)
+    restored.restore(path)
+    sample = pickle.loads(pickle.dumps(restored.find(3, "Sample")))
+    assert {item.id for item in sample.items} == {30, 31}
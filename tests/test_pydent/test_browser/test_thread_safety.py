@@ -0,0 +1,118 @@
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pydent.browser import Browser
+
+
+@pytest.fixture(scope="function")
+def browser(fake_session, sample_inventory):
+    return Browser(fake_session)
+
+
+@pytest.fixture(scope="function")
+def fast_switching():
+    """Switches threads more often to make races more likely."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_cache_stress(browser, sample_inventory):
+    """Many workers finding, querying and re-caching overlapping models must
+    leave exactly one cached instance per model."""
+    sample_ids = list(range(1, 11))
+    item_ids = [i * 10 + j for i in sample_ids for j in range(2)]
+
+    def worker(seed):
+        rand = random.Random(seed)
+        found = []
+        for _ in range(50):
+            choice = rand.randint(0, 3)
+            if choice == 0:
+                found.append(browser.find(rand.choice(sample_ids), "Sample"))
+            elif choice == 1:
+                found.append(browser.find(rand.choice(item_ids), "Item"))
+            elif choice == 2:
+                found += browser.where({"id": rand.sample(item_ids, 5)}, "Item")
+            else:
+                models = browser.interface("Sample").find(rand.sample(sample_ids, 3))
+                found += browser.update_cache(models)["Sample"]
+        return found
+
+    with ThreadPoolExecutor(16) as executor:
+        results = list(executor.map(worker, range(32)))
+
+    assert sorted(browser.model_cache["Sample"]) == sample_ids
+    assert sorted(browser.model_cache["Item"]) == item_ids
+    for found in results:
+        for model in found:
+            cached = browser.model_cache[model.__class__.__name__][model.id]
+            assert model is cached
+    assert len(browser.models) == len(sample_ids) + len(item_ids)
+
+
+def test_restore_keeps_concurrent_updates(
+    browser, fake_session, tmpdir, fast_switching
+):
+    """Models cached while a snapshot is restored must not be dropped."""
+    path = str(tmpdir.join("cache.snapshot"))
+    browser.where({"id": list(range(1, 11))}, "Sample")
+    browser.snapshot(path)
+    restored = Browser(fake_session)
+
+    def update(i):
+        model = fake_session.Sample.load({"id": 1000 + i, "name": str(i)})
+        return restored.update_cache([model])["Sample"][0]
+
+    with ThreadPoolExecutor(8) as executor:
+        futures = []
+        restores = []
+        for i in range(500):
+            futures.append(executor.submit(update, i))
+            if i % 10 == 0:
+                restores.append(executor.submit(restored.restore, path))
+        models = [future.result() for future in futures]
+        for future in restores:
+            future.result()
+
+    cache = restored.model_cache["Sample"]
+    for model in models:
+        assert cache[model.id] is model
+    assert len(cache) == 10 + len(models)
+
+
+def test_clear_during_updates(browser, fake_session, tmpdir, fast_switching):
+    """Clearing the cache while models are cached must leave every cached
+    model reachable."""
+    path = str(tmpdir.join("cache.snapshot"))
+    browser.where({"id": list(range(1, 11))}, "Sample")
+    browser.snapshot(path)
+
+    def update(i):
+        model = fake_session.Sample.load({"id": 1000 + i, "name": str(i)})
+        return browser.update_cache([model])["Sample"][0]
+
+    def clear_and_restore():
+        browser.clear()
+        browser.restore(path)
+
+    with ThreadPoolExecutor(8) as executor:
+        futures = []
+        for i in range(500):
+            futures.append(executor.submit(update, i))
+            if i % 10 == 0:
+                futures.append(executor.submit(clear_and_restore))
+        for future in futures:
+            future.result()
+
+    cache = browser.model_cache["Sample"]
+    for key in range(1, 11):
+        assert cache[key].id == key
+    for key in list(cache):
+        model = cache[key]
+        assert browser.update_cache([model])["Sample"][0] is model
+    assert [s.id for s in browser.search_text("sample3")] == [3]
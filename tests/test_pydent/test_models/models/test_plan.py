@@ -1,5 +1,6 @@
 import pytest
 
+from pydent.aqhttp import AqHTTP
 from pydent.models import Plan
 
 
@@ -212,3 +213,52 @@ def test_plan_copy(example_plan):
 #         if op.operation_type.name == "Make PCR Fragment":
 #             op.set_input('Template', item=session.Item.find(57124))
 #             newplan.patch(newplan.to_save_json())
+
+
+def test_nested_models_point_to_their_parents(fake_session, monkeypatch):
+    """Loading a plan with nested operations and field values sets the
+    inverse relationships without requests."""
+    plan = fake_session.Plan.load(
+        {
+            "id": 1,
+            "operations": [
+                {
+                    "id": 2,
+                    "field_values": [
+                        {"id": 3, "parent_id": 2, "parent_class": "Operation"},
+                        {"id": 4, "parent_id": 2, "parent_class": "Operation"},
+                    ],
+                }
+            ],
+        }
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Unexpected request")
+
+    monkeypatch.setattr(AqHTTP, "get", fail)
+    monkeypatch.setattr(AqHTTP, "post", fail)
+
+    op = plan.operations[0]
+    assert not op.is_deserialized("plans")
+    assert [fv.operation for fv in op.field_values] == [op, op]
+
+
+def test_operation_in_two_plans_is_not_truncated(fake_session, monkeypatch):
+    """An operation nested in a plan still retrieves all of its plans."""
+    plan = fake_session.Plan.load({"id": 1, "operations": [{"id": 2}]})
+    op = plan.operations[0]
+
+    def fake_post(*_, **kwargs):
+        json_data = kwargs["json_data"]
+        if json_data["model"] == "PlanAssociation":
+            return [
+                {"id": 10, "plan_id": 1, "operation_id": 2},
+                {"id": 11, "plan_id": 3, "operation_id": 2},
+            ]
+        if json_data["model"] == "Plan":
+            return [{"id": 1}, {"id": 3}]
+
+    monkeypatch.setattr(AqHTTP, "post", fake_post)
+
+    assert [p.id for p in op.plans] == [1, 3]
@@ -8,3 +8,17 @@ def test_all_models():
 
     msg = "Missing models in pydent.models.__all__: {}"
     assert len(missing_models) == 0, msg.format(", ".join(missing_models))
+
+
+def test_inverse_relationships():
+    """Ensure every declared inverse relationship exists on the nested model
+    and points back to the owner model."""
+    for name, model in ModelRegistry.models.items():
+        for key, relationship in model.get_relationships().items():
+            inverse = getattr(relationship, "inverse", None)
+            if inverse is None:
+                continue
+            nested = ModelRegistry.get_model(relationship.nested)
+            assert inverse in nested.get_relationships(), "{}.{}".format(name, key)
+            assert nested.get_relationships()[inverse].nested == name
+            assert not nested.get_relationships()[inverse].many
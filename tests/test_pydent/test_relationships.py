@@ -1,10 +1,19 @@
 """Test for pydent.relationships.py."""
+import pytest
+
 from pydent import ModelBase
+from pydent import ModelRegistry
+from pydent.marshaller import add_schema
+from pydent.marshaller import fields
+from pydent.marshaller import SchemaRegistry
+from pydent.marshaller.exceptions import SchemaException
+from pydent.relationships import FieldValidationError
 from pydent.relationships import HasMany
 from pydent.relationships import HasManyGeneric
 from pydent.relationships import HasManyThrough
 from pydent.relationships import HasOne
 from pydent.relationships import Many
+from pydent.relationships import MemoizedFunction
 from pydent.relationships import One
 
 
@@ -194,3 +203,135 @@ def test_has_many_through():
     fxn = hasmanythrough.callback_args[1]
     assert fxn(this_model) == expected_fxn(this_model)
     assert fxn(this_model) == {"id": [4]}
+
+
+@pytest.fixture(scope="function")
+def base():
+    old_schemas = dict(SchemaRegistry.schemas)
+    old_models = dict(ModelRegistry.models)
+
+    yield ModelBase
+
+    for s in set(SchemaRegistry.schemas).difference(old_schemas):
+        SchemaRegistry.schemas.pop(s)
+    for m in set(ModelRegistry.models).difference(old_models):
+        ModelRegistry.models.pop(m)
+
+
+@pytest.fixture(scope="function")
+def memo_model(base):
+    @add_schema
+    class MemoModel(base):
+        fields = dict(
+            label=MemoizedFunction("get_label", depends_on=("name", "parent")),
+            parent=fields.Relationship("MemoModel", "get_parent"),
+        )
+        calls = 0
+
+        def get_label(self):
+            MemoModel.calls += 1
+            name = getattr(self, "name", None)
+            if self.parent is None:
+                return name
+            return "{}/{}".format(self.parent.name, name)
+
+        def get_parent(self, model_name):
+            return None
+
+    return MemoModel
+
+
+def test_memoized_function(memo_model, fake_session):
+    model = memo_model.load_from({"id": 1, "name": "a"}, fake_session.utils)
+    assert model.label == "a"
+    assert model.label == "a"
+    assert memo_model.calls == 1
+    assert model.dump()["label"] == "a"
+    assert "label" not in model._get_data()
+
+    model.description = "not a dependency"
+    assert model.label == "a"
+    assert memo_model.calls == 1
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(lambda m: setattr(m, "name", "b"), id="set data"),
+        pytest.param(lambda m: m.add_data({"name": "b"}), id="add data"),
+        pytest.param(
+            lambda m: setattr(
+                m, "parent", m.__class__.load_from({"name": "p"}, m.session)
+            ),
+            id="set relationship",
+        ),
+        pytest.param(lambda m: delattr(m, "name"), id="delete"),
+    ],
+)
+def test_memoized_function_invalidation(memo_model, fake_session, change):
+    model = memo_model.load_from({"id": 1, "name": "a"}, fake_session.utils)
+    model.label
+    change(model)
+    model.label
+    assert memo_model.calls == 2
+
+
+def test_memoized_function_invalid_dependency(base):
+    with pytest.raises(SchemaException):
+
+        @add_schema
+        class BadMemoModel(base):
+            fields = dict(label=MemoizedFunction("get_label", depends_on="get_label"))
+
+            def get_label(self):
+                return None
+
+
+@pytest.fixture(scope="function")
+def author_model(base):
+    @add_schema
+    class InverseAuthor(base):
+        fields = dict(
+            books=HasMany("InverseBook", "InverseAuthor", inverse="author"),
+            editions=HasMany("InverseBook", "InverseAuthor", inverse="missing"),
+        )
+
+    @add_schema
+    class InverseBook(base):
+        fields = dict(author=HasOne("InverseAuthor"))
+
+    return InverseAuthor
+
+
+def test_inverse_relationship(author_model, fake_session):
+    author = author_model.load_from(
+        {
+            "id": 1,
+            "books": [
+                {"id": 2, "inverse_author_id": 1},
+                {"id": 3, "inverse_author_id": 5},
+            ],
+        },
+        fake_session.utils,
+    )
+    book, other_book = author.books
+    assert book.is_deserialized("author")
+    assert book.author is author
+    assert "author" not in book._get_data()
+    assert not other_book.is_deserialized("author")
+
+
+def test_inverse_relationship_is_not_overwritten(author_model, fake_session):
+    other_author = author_model.load_from({"id": 1}, fake_session.utils)
+    book = ModelRegistry.get_model("InverseBook").load_from(
+        {"id": 2, "inverse_author_id": 1}, fake_session.utils
+    )
+    book.author = other_author
+    author = author_model.load_from({"id": 1}, fake_session.utils)
+    author.books = [book]
+    assert book.author is other_author
+
+
+def test_missing_inverse_relationship(author_model, fake_session):
+    with pytest.raises(FieldValidationError):
+        author_model.load_from({"id": 1, "editions": [{"id": 2}]}, fake_session.utils)
@@ -1,5 +1,5 @@
-import json
 import os
+import threading
 
 import pytest
 
@@ -143,12 +143,15 @@ def test_aqhttp_post(monkeypatch, fake_response, aqhttp):
 
             # assert extra kwargs get passed in
             kwargs_copy = dict(kwargs)
-            if "json" in kwargs:
-                del kwargs_copy["json"]
+            if "data" in kwargs:
+                del kwargs_copy["data"]
+                assert kwargs_copy.pop("headers") == {
+                    "Content-Type": "application/json"
+                }
             assert kwargs_copy == extra_kwargs
 
             # return faked response
-            response.json = lambda: kwargs["json"]
+            response._content = kwargs["data"]
             return response
 
     monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
@@ -178,13 +181,16 @@ def test_aqhttp_post_2(monkeypatch, aqhttp, fake_response):
 
             # assert extra kwargs get passed in
             kwargs_copy = dict(kwargs)
-            if "json" in kwargs:
-                del kwargs_copy["json"]
+            if "data" in kwargs:
+                del kwargs_copy["data"]
+                assert kwargs_copy.pop("headers") == {
+                    "Content-Type": "application/json"
+                }
             assert kwargs_copy == extra_kwargs
 
             # return faked response
             fake_requests_response = fake_response(method, path, {}, 200)
-            fake_requests_response.json = lambda: kwargs["json"]
+            fake_requests_response._content = kwargs["data"]
             return fake_requests_response
 
     monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
@@ -213,13 +219,16 @@ def test_aqhttp_get(monkeypatch, fake_response, aqhttp):
 
             # assert extra kwargs get passed in
             kwargs_copy = dict(kwargs)
-            if "json" in kwargs:
-                del kwargs_copy["json"]
+            if "data" in kwargs:
+                del kwargs_copy["data"]
+                assert kwargs_copy.pop("headers") == {
+                    "Content-Type": "application/json"
+                }
             assert kwargs_copy == extra_kwargs
 
             # return faked response
             fake_requests_response = fake_response(method, path, {}, 200)
-            fake_requests_response.json = lambda: {}
+            fake_requests_response._content = b"{}"
             return fake_requests_response
 
     monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
@@ -234,7 +243,7 @@ def test_authentication_error_via_reroute(monkeypatch, fake_response, aqhttp):
         @staticmethod
         def request(method, path, timeout=None, **kwargs):
             fake_requests_response = fake_response(method, path, {}, 200)
-            fake_requests_response.json = lambda: json.loads("not a json")
+            fake_requests_response._content = b"not a json"
             fake_requests_response.url = url_build(aqhttp.aquarium_url, "signin")
             return fake_requests_response
 
@@ -257,7 +266,7 @@ def test_improperly_formatted_json_raise_TridentRequestError(
         def request(method, path, timeout=None, **kwargs):
             # return faked response
             fake_requests_response = fake_response(method, path, {}, 200)
-            fake_requests_response.json = lambda: json.loads("not a json")
+            fake_requests_response._content = b"not a json"
             return fake_requests_response
 
     monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
@@ -265,3 +274,25 @@ def test_improperly_formatted_json_raise_TridentRequestError(
     # test get
     with pytest.raises(TridentRequestError):
         aqhttp.post("someurl", json_data={})
+
+
+def test_num_requests_is_thread_safe(monkeypatch, fake_response, aqhttp):
+    class mock_request:
+        @staticmethod
+        def request(method, path, timeout=None, cookies=None, **kwargs):
+            fake_requests_response = fake_response(method, path, {}, 200)
+            fake_requests_response._content = b"{}"
+            return fake_requests_response
+
+    monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
+
+    def worker():
+        for _ in range(200):
+            aqhttp.get("somepath")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert aqhttp.num_requests == 1600
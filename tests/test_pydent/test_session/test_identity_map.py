@@ -0,0 +1,71 @@
+import gc
+from copy import deepcopy
+
+from pydent.models import Item
+from pydent.models import Sample
+
+
+def test_load_same_record_twice_returns_same_instance(fake_session):
+    s1 = fake_session.Sample.load({"id": 5, "name": "mysample"})
+    s2 = fake_session.Sample.load({"id": 5, "name": "mysample"})
+    assert s1 is s2
+    assert s1 in fake_session.identity_map
+
+
+def test_second_load_updates_instance(fake_session):
+    s1 = fake_session.Sample.load({"id": 5, "name": "mysample"})
+    s2 = fake_session.Sample.load({"id": 5, "name": "renamed", "description": "d"})
+    assert s1 is s2
+    assert s1.name == "renamed"
+    assert s1.description == "d"
+    assert s1.raw == {"id": 5, "name": "renamed", "description": "d"}
+
+
+def test_nested_loads_share_instance(fake_session):
+    sample = fake_session.Sample.load({"id": 5, "name": "mysample"})
+    item = fake_session.Item.load(
+        {"id": 1, "sample_id": 5, "sample": {"id": 5, "name": "mysample"}}
+    )
+    fv = fake_session.FieldValue.load(
+        {"id": 2, "child_sample_id": 5, "sample": {"id": 5, "name": "mysample"}}
+    )
+    assert isinstance(item, Item)
+    assert item.sample is sample
+    assert fv.sample is sample
+
+
+def test_models_without_ids_are_not_shared(fake_session):
+    s1 = fake_session.Sample.load({"name": "mysample"})
+    s2 = fake_session.Sample.load({"name": "mysample"})
+    assert s1 is not s2
+    assert len(fake_session.identity_map) == 0
+
+
+def test_different_model_classes_are_not_shared(fake_session):
+    sample = fake_session.Sample.load({"id": 1})
+    item = fake_session.Item.load({"id": 1})
+    assert isinstance(sample, Sample)
+    assert isinstance(item, Item)
+
+
+def test_sessions_do_not_share_instances(fake_session):
+    other = fake_session.copy()
+    s1 = fake_session.Sample.load({"id": 5})
+    s2 = other.Sample.load({"id": 5})
+    assert s1 is not s2
+    assert s1.session is fake_session
+    assert s2.session is other
+
+
+def test_unreferenced_models_are_garbage_collected(fake_session):
+    fake_session.Sample.load({"id": 5})
+    gc.collect()
+    assert fake_session.identity_map.get(Sample, 5) is None
+
+
+def test_deepcopy_session_has_empty_identity_map(fake_session):
+    sample = fake_session.Sample.load({"id": 5})
+    copied = deepcopy(sample)
+    assert copied is not sample
+    assert copied.session.identity_map.get(Sample, 5) is None
+    assert fake_session.identity_map.get(Sample, 5) is sample
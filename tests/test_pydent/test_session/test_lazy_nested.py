@@ -0,0 +1,61 @@
+from pydent.marshaller.descriptors import Placeholders
+from pydent.models import Item
+from pydent.models import Sample
+
+
+def sample_data():
+    return {
+        "id": 1,
+        "name": "mysample",
+        "items": [
+            {"id": 10, "sample_id": 1, "object_type": {"id": 100, "name": "vial"}},
+            {"id": 11, "sample_id": 1},
+        ],
+    }
+
+
+def test_lazy_nested_is_off_by_default(fake_session):
+    assert not fake_session.lazy_nested
+    sample = fake_session.Sample.load(sample_data())
+    data = sample._get_deserialized_data()
+    assert all(isinstance(item, Item) for item in data["items"])
+
+
+def test_lazy_nested_deserializes_on_access(fake_session):
+    session = fake_session(lazy_nested=True)
+    assert session.lazy_nested
+    sample = session.Sample.load(sample_data())
+    data = getattr(sample, Sample._deserialized_key)
+    assert data["items"] is Placeholders.LAZY
+    assert sample.is_deserialized("items")
+    assert sample.name == "mysample"
+
+    items = sample.items
+    assert [item.id for item in items] == [10, 11]
+    assert sample.items is items
+    assert items[0].session is session
+
+    item_data = getattr(items[0], Item._deserialized_key)
+    assert item_data["object_type"] is Placeholders.LAZY
+    assert items[0].object_type.name == "vial"
+
+
+def test_lazy_nested_dump(fake_session):
+    session = fake_session(lazy_nested=True)
+    sample = session.Sample.load(sample_data())
+    data = sample.dump(include={"items": "object_type"})
+    assert [item["id"] for item in data["items"]] == [10, 11]
+    assert data["items"][0]["object_type"]["name"] == "vial"
+
+
+def test_lazy_nested_models_are_found_by_browser(fake_session):
+    session = fake_session(lazy_nested=True)
+    sample = session.Sample.load(sample_data())
+    session.browser.update_cache([sample])
+    assert sorted(session.browser.model_cache["Item"]) == [10, 11]
+    assert list(session.browser.model_cache["ObjectType"]) == [100]
+
+
+def test_copied_session_keeps_lazy_nested(fake_session):
+    fake_session.lazy_nested = True
+    assert fake_session.copy().lazy_nested
@@ -0,0 +1,99 @@
+import pickle
+
+from pydent.base import ModelBase
+from pydent.models import Sample
+
+
+def sample_data():
+    return {
+        "id": 5,
+        "name": "mysample",
+        "items": [
+            {"id": 10, "sample_id": 5, "location": "bench"},
+            {"id": 11, "sample_id": 5, "location": "fridge"},
+        ],
+    }
+
+
+def roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+def test_pickled_models_have_no_session(fake_session):
+    sample = fake_session.Sample.load(sample_data())
+    pickled = pickle.dumps(sample)
+    assert b"AqHTTP" not in pickled
+    assert b"remember_token" not in pickled
+
+    loaded = pickle.loads(pickled)
+    assert loaded.session is None
+    assert loaded.raw is None
+    assert loaded.rid == sample.rid
+    assert loaded.name == "mysample"
+    assert [i.location for i in loaded.items] == ["bench", "fridge"]
+    assert all(i.session is None for i in loaded.items)
+    assert loaded.dump() == sample.dump()
+
+
+def test_relationship_data_is_not_pickled_twice(fake_session):
+    sample = fake_session.Sample.load(sample_data())
+    rid, data, deserialized, attributes = sample.__getstate__()
+    assert "items" not in data
+    assert deserialized["items"] == sample.items
+    assert attributes is None
+    assert "items" in sample._get_data()
+
+
+def test_shared_and_cyclic_references(fake_session):
+    op = fake_session.Operation.load(
+        {"id": 1, "field_values": [{"id": 2, "name": "in", "role": "input"}]}
+    )
+    fv = op.field_values[0]
+    fv.operation = op
+    loaded_op, loaded_fv = roundtrip([op, fv])
+    assert loaded_op.field_values[0] is loaded_fv
+    assert loaded_fv.operation is loaded_op
+
+
+def test_connect_to_session_recursive(fake_session):
+    loaded = roundtrip(fake_session.Sample.load(sample_data()))
+    session = fake_session.copy()
+    loaded.connect_to_session(session, recursive=True)
+    assert loaded.session is session
+    assert all(i.session is session for i in loaded.items)
+    assert session.identity_map.get(Sample, 5) is loaded
+
+
+def test_lazy_relationships_materialize_after_reattach(fake_session):
+    session = fake_session(lazy_nested=True)
+    sample = session.Sample.load(sample_data())
+    loaded = roundtrip(sample)
+    loaded.connect_to_session(fake_session, recursive=True)
+    assert [i.id for i in loaded.items] == [10, 11]
+    assert loaded.items[0].session is fake_session
+
+
+def test_instance_attributes_are_pickled(fake_session):
+    sample = fake_session.Sample.load({"id": 5})
+    sample.note = "extra"
+    assert roundtrip(sample).note == "extra"
+
+
+def test_unpickle_legacy_state(fake_session):
+    sample = fake_session.Sample.load({"id": 5, "name": "mysample"})
+    state = dict(vars(sample))
+    loaded = ModelBase.__new__(Sample)
+    loaded.__setstate__(state)
+    assert loaded.name == "mysample"
+
+
+def test_unpickle_adds_data_accessors(fake_session):
+    sample = fake_session.Sample.load({"id": 5, "a_new_key": 1})
+    pickled = pickle.dumps(sample)
+    delattr(Sample, "a_new_key")
+    Sample._model_schema._load_plans.clear()
+    try:
+        assert pickle.loads(pickled).a_new_key == 1
+        assert "a_new_key" in Sample.__dict__
+    finally:
+        Sample._model_schema._load_plans.clear()
@@ -0,0 +1,76 @@
+import pickle
+
+import pytest
+
+from pydent.base import FrozenRaw
+from pydent.base import RawPolicy
+from pydent.browser import _was_included
+
+
+def item_data(i=1):
+    return {"id": i, "sample_id": 5, "object_type_id": 3, "location": "A1"}
+
+
+def test_raw_policy_defaults_to_keep(fake_session):
+    assert fake_session.raw_policy is RawPolicy.KEEP
+    data = item_data()
+    item = fake_session.Item.load(data)
+    assert item.raw is data
+
+
+def test_drop_raw(fake_session):
+    session = fake_session(raw_policy="drop")
+    assert session.raw_policy is RawPolicy.DROP
+    item = session.Item.load(item_data())
+    assert item.raw is None
+    assert item.location == "A1"
+    assert item.dump()["location"] == "A1"
+
+
+def test_frozen_raw(fake_session):
+    fake_session.raw_policy = RawPolicy.FROZEN
+    item1 = fake_session.Item.load(item_data(1))
+    item2 = fake_session.Item.load(item_data(2))
+    assert isinstance(item1.raw, FrozenRaw)
+    assert item1.raw == item_data(1)
+    assert item1.raw["location"] == "A1"
+    assert item1.raw._index is item2.raw._index
+    with pytest.raises(TypeError):
+        item1.raw["location"] = "B1"
+    assert pickle.loads(pickle.dumps(item1.raw)) == item_data(1)
+
+
+def test_frozen_raw_omits_relationship_data(fake_session):
+    fake_session.raw_policy = "frozen"
+    data = dict(item_data(), object_type={"id": 3, "name": "vial"})
+    item = fake_session.Item.load(data)
+    assert "object_type" in item.raw
+    assert item.raw["object_type"] is None
+    assert item.object_type.name == "vial"
+
+
+def test_invalid_raw_policy(fake_session):
+    with pytest.raises(ValueError):
+        fake_session.raw_policy = "forget"
+
+
+def test_reload_drops_raw(fake_session):
+    item = fake_session.Item.load(item_data())
+    fake_session.raw_policy = "drop"
+    assert fake_session.Item.load(item_data()) is item
+    assert item.raw is None
+
+
+def test_copied_session_keeps_raw_policy(fake_session):
+    fake_session.raw_policy = "frozen"
+    assert fake_session.copy().raw_policy is RawPolicy.FROZEN
+
+
+@pytest.mark.parametrize("policy", list(RawPolicy))
+def test_was_included(fake_session, policy):
+    fake_session.raw_policy = policy
+    sample = fake_session.Sample.load(
+        {"id": 1, "items": [item_data()], "sample_type": None}
+    )
+    assert _was_included(sample, ["items"])
+    assert not _was_included(sample, ["items", "field_values"])
@@ -0,0 +1,62 @@
+import json
+from collections import OrderedDict
+
+import pytest
+
+from pydent.relationships import JSON
+from pydent.utils import json_codec
+
+
+@pytest.fixture(params=json_codec.available_codecs())
+def codec(request):
+    previous = json_codec.get_codec()
+    yield json_codec.set_codec(request.param)
+    json_codec.set_codec(previous)
+
+
+def test_default_codec_is_fastest_available():
+    assert json_codec.available_codecs()[-1] == "json"
+    assert json_codec.get_codec().name == json_codec.available_codecs()[0]
+
+
+def test_roundtrip(codec):
+    data = {"id": 1, "name": "plan", "layout": {"children": [1.5, None, True]}}
+    assert json_codec.loads(json_codec.dumps(data)) == data
+    assert json_codec.loads(json_codec.dumps_bytes(data)) == data
+    assert json.loads(json_codec.dumps(data)) == data
+
+
+def test_sort_keys_and_indent(codec):
+    data = OrderedDict([("b", 1), ("a", [1, 2])])
+    encoded = json_codec.dumps(data, sort_keys=True)
+    assert list(json.loads(encoded, object_pairs_hook=OrderedDict)) == ["a", "b"]
+    assert json_codec.dumps(data, indent=True) == json.dumps(data, indent=2)
+
+
+def test_unsupported_data_falls_back_to_stdlib(codec):
+    data = {"big": 2 ** 70, 1: "x"}
+    assert json_codec.loads(json_codec.dumps(data)) == {"big": 2 ** 70, "1": "x"}
+    assert json_codec.loads("[NaN]")[0] != 0
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf")])
+def test_dumps_bytes_rejects_non_finite_floats(codec, value):
+    with pytest.raises(ValueError):
+        json_codec.dumps_bytes({"x": [1, {"y": value}]})
+    assert json.loads(json_codec.dumps_bytes({"x": [None, 1.5]})) == {"x": [None, 1.5]}
+
+
+def test_invalid_json_raises(codec):
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"not a json")
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        json_codec.set_codec("not_a_codec")
+
+
+def test_json_field_uses_codec(codec):
+    field = JSON()
+    assert field.deserialize(None, '{"x": [1]}') == {"x": [1]}
+    assert json.loads(field.serialize(None, {"x": [1]})) == {"x": [1]}
@@ -0,0 +1,130 @@
+import pytest
+
+from pydent.utils.search_index import NameIndex
+from pydent.utils.search_index import TextIndex
+
+
+@pytest.fixture(scope="function")
+def index():
+    return NameIndex(
+        [
+            "1: pMOD8",
+            "2: pMOD-LTR",
+            "3: yeast strain A",
+            "4: pGG-mCherry",
+            (5, "mcherry"),
+        ]
+    )
+
+
+def test_update_and_watermark(index):
+    assert len(index) == 5
+    assert index.watermark == 5
+    index.add(10, "new")
+    assert index.watermark == 10
+    assert 10 in index
+
+
+def test_rename(index):
+    index.add(1, "renamed")
+    assert index.search("pMOD") == [2]
+    assert index.search("renamed") == [1]
+
+
+@pytest.mark.parametrize(
+    "pattern,ignore_case,expected",
+    [
+        ("pmod", True, [1, 2]),
+        ("pmod", False, []),
+        ("^pMOD", False, []),
+        ("^\\d+: pMOD\\d$", False, [1]),
+        ("^4: ", True, [4]),
+        ("^[2-3]:", True, [2, 3]),
+        ("cherry", True, [4, 5]),
+        ("p.*cherry", True, [4]),
+        ("strain|LTR", True, [2, 3]),
+        (".", True, [1, 2, 3, 4, 5]),
+    ],
+)
+def test_search(index, pattern, ignore_case, expected):
+    assert index.search(pattern, ignore_case=ignore_case) == expected
+
+
+def test_required_literals():
+    assert NameIndex.required_literals("abc.*def") == ["abc", "def"]
+    assert NameIndex.required_literals("ab?c") == ["a", "c"]
+    assert NameIndex.required_literals("a|b") == []
+
+
+def test_prefix(index):
+    assert index.prefix("pmod") == [1, 2]
+    assert index.prefix("pMOD-", ignore_case=False) == [2]
+    assert index.prefix("z") == []
+
+
+def test_close_matches(index):
+    assert index.close_matches("pMOD9")[0] == 1
+    assert index.close_matches("nothing like it") == []
+
+
+@pytest.fixture(scope="function")
+def text_index():
+    index = TextIndex()
+    index.add(1, "pGFP", "a plasmid expressing GFP in yeast strain W303")
+    index.add(2, "yGFP", "yeast strain with genomic GFP GFP")
+    index.add(3, "pmCherry", "plasmid expressing mCherry, deprecated")
+    index.add(4, "empty", None)
+    return index
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("gfp", [2, 1]),
+        ("GFP plasmid", [1]),
+        ('"yeast strain"', [2, 1]),
+        ('"strain yeast"', []),
+        ("plasmid -deprecated", [1]),
+        ('plasmid -"expressing mcherry"', [1]),
+        ("mcherry OR w303", [3, 1]),
+        ("nothing", []),
+    ],
+)
+def test_text_search(text_index, query, expected):
+    assert text_index.search(query) == expected
+
+
+def test_text_search_restricted(text_index):
+    assert text_index.search("gfp", doc_ids=[1, 3]) == [1]
+
+
+def test_text_index_replace_and_remove(text_index):
+    text_index.add(3, "pmCherry", "updated description")
+    assert text_index.search("deprecated") == []
+    assert text_index.search("updated") == [3]
+    text_index.remove(1)
+    assert text_index.search("gfp") == [2]
+    assert "w303" not in text_index.postings
+    assert len(text_index) == 3
+
+
+@pytest.mark.parametrize(
+    "literals,expected",
+    [
+        (["cherry"], {3}),
+        (["yeast strain"], {1, 2}),
+        (["GFP", "w30"], {1}),
+        (["nothing"], set()),
+        ([", "], None),
+        ([], None),
+    ],
+)
+def test_text_index_candidates(text_index, literals, expected):
+    assert text_index.candidates(literals) == expected
+
+
+def test_text_index_skips_unchanged_documents(text_index):
+    postings = text_index.postings["gfp"]
+    text_index.add(2, "yGFP", "yeast strain with genomic GFP GFP")
+    assert text_index.postings["gfp"] is postings
+    assert text_index.search("genomic") == [2]